@@ -147,7 +147,17 @@ class BinOp(ops.BinOp):
     @property
     def kind(self):
         """ the kind of my field """
-        return self.queryables.get(self.lhs)
+        return getattr(self.queryables.get(self.lhs), 'kind', None)
+
+    @property
+    def meta(self):
+        """ the meta of my field """
+        return getattr(self.queryables.get(self.lhs), 'meta', None)
+
+    @property
+    def metadata(self):
+        """ the metadata of my field """
+        return getattr(self.queryables.get(self.lhs), 'metadata', None)
 
     def generate(self, v):
         """ create and return the op string for this TermValue """
@@ -167,7 +177,11 @@ class BinOp(ops.BinOp):
             return encoder(value)
 
         kind = _ensure_decoded(self.kind)
-        if kind == u('datetime64') or kind == u('datetime'):
+        meta = _ensure_decoded(self.meta)
+        if meta == u('category'):
+            v = self.convert_category(v)
+            return TermValue(v, v, u('integer'))
+        elif kind == u('datetime64') or kind == u('datetime'):
             if isinstance(v, (int, float)):
                 v = stringify(v)
             v = _ensure_decoded(v)
@@ -203,6 +217,28 @@ class BinOp(ops.BinOp):
         # string quoting
         return TermValue(v, stringify(v), u('string'))
 
+    def convert_category(self, v):
+        """ return the code of the category v to compare the codes with; an
+        ordering comparison needs the categories sorted, and is translated to
+        the code of the first category after (or last before) v """
+        categories = self.metadata
+        if self.op in ['==', '!=']:
+            try:
+                code = categories.get_loc(v)
+            except (KeyError, TypeError):
+                # not a category, matches no code
+                code = len(categories)
+        else:
+            if not categories.is_monotonic:
+                raise TypeError("cannot use an ordering comparison on a "
+                                "categorical whose categories are not "
+                                "sorted [%s]" % self)
+            if self.op in ['<', '>=']:
+                code = categories.searchsorted(v, side='left')
+            else:
+                code = categories.searchsorted(v, side='right') - 1
+        return int(code)
+
     def convert_values(self):
         pass
 
@@ -322,6 +358,12 @@ class ConditionBinOp(BinOp):
         else:
             self.condition = self.generate(values[0])
 
+            # a missing value has the code -1
+            if (_ensure_decoded(self.meta) == u('category') and
+                    self.op in ['<', '<=']):
+                self.condition = "(%s & (%s >= 0))" % (self.condition,
+                                                       self.lhs)
+
         return self
 
 
@@ -441,7 +483,7 @@ class Expr(expr.Expr):
     Parameters
     ----------
     where : string term expression, Expr, or list-like of Exprs
-    queryables : a "kinds" map (dict of column name -> kind), or None if column
+    queryables : a map (dict of column name -> column), or None if column
         is non-indexable
     encoding : an encoding that will encode the query terms
 
@@ -48,6 +48,68 @@ def match(to_match, values, na_sentinel=-1):
     return result
 
 
+def isin(comps, values, hasnans=False):
+    """
+    Compute boolean array of whether each element of comps is found in
+    values, using a typed hash table when both sides are numeric
+
+    Parameters
+    ----------
+    comps : array-like
+        values to test for membership
+    values : set or sequence of values
+        sought values
+    hasnans : boolean, default False
+        for float comps, treat NaN elements as members
+
+    Returns
+    -------
+    isin : ndarray (boolean dtype)
+
+    Notes
+    -----
+    Membership follows python set semantics, e.g. ``1`` is found in
+    ``[1.0]`` but ``1.5`` is not in ``[1]``. Non-numeric comps or values
+    are tested against a python set.
+    """
+    import pandas.lib as lib
+
+    comps = np.asarray(comps)
+    if not (isinstance(values, (list, tuple)) or
+            hasattr(values, '__array__')):
+        values = list(values)
+    arr = com._asarray_tuplesafe(values)
+
+    if _is_int64_safe(comps.dtype):
+        if _is_int64_safe(arr.dtype):
+            return htable.ismember_int64(com._ensure_int64(comps),
+                                         com._ensure_int64(arr))
+        elif com.is_float_dtype(arr):
+            # only integral floats inside the int64 range can match
+            arr = arr[np.isfinite(arr)]
+            arr = arr[(arr == np.floor(arr)) & (arr >= -2.0 ** 63) &
+                      (arr < 2.0 ** 63)]
+            return htable.ismember_int64(com._ensure_int64(comps),
+                                         arr.astype(np.int64))
+
+    elif com.is_float_dtype(comps):
+        if com.is_float_dtype(arr) or (_is_int64_safe(arr.dtype) and
+                                       (np.abs(arr) <= 2 ** 53).all()):
+            return htable.ismember_float64(com._ensure_float64(comps),
+                                           com._ensure_float64(arr),
+                                           hasnans)
+        return lib.ismember_nans(com._ensure_float64(comps), set(values),
+                                 hasnans)
+
+    return lib.ismember(comps, set(values))
+
+
+def _is_int64_safe(dtype):
+    # integer or boolean dtypes whose values all fit in an int64
+    return (dtype.kind in ('i', 'b') or
+            (dtype.kind == 'u' and dtype.itemsize < 8))
+
+
 def unique(values):
     """
     Compute unique values (not necessarily sorted) efficiently from input array
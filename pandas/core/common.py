@@ -2070,11 +2070,8 @@ def _is_bool_indexer(key):
 
 
 def _default_index(n):
-    from pandas.core.index import Int64Index
-    values = np.arange(n, dtype=np.int64)
-    result = Int64Index(values,name=None)
-    result.is_unique = True
-    return result
+    from pandas.core.index import RangeIndex
+    return RangeIndex(0, n, name=None)
 
 
 def ensure_float(arr):
@@ -2651,17 +2648,28 @@ def _get_handle(path, mode, encoding=None, compression=None):
             msg = 'encoding + compression not yet supported in Python 2'
             raise ValueError(msg)
 
+        # the compressed file is always binary
+        mode = mode.replace('b', '')
         if compression == 'gzip':
             import gzip
-            f = gzip.GzipFile(path, 'rb')
+            f = gzip.GzipFile(path, mode + 'b')
         elif compression == 'bz2':
             import bz2
 
-            f = bz2.BZ2File(path, 'rb')
+            f = bz2.BZ2File(path, mode + 'b')
+        elif compression == 'xz':
+            from pandas.io.common import _import_lzma
+            f = _import_lzma().LZMAFile(path, mode + 'b')
+        elif compression == 'zip':
+            if mode != 'r':
+                raise ValueError('zip compression is only supported for '
+                                 'reading')
+            from pandas.io.common import open_compressed
+            f = open_compressed(path, compression)
         else:
             raise ValueError('Unrecognized compression type: %s' %
                              compression)
-        if compat.PY3_2:
+        if compat.PY3_2 and mode == 'r':
             # gzip and bz2 don't work with TextIOWrapper in 3.2
             encoding = encoding or get_option('display.encoding')
             f = StringIO(f.read().decode(encoding))
@@ -318,6 +318,24 @@ with cf.config_prefix('mode'):
                        cb=use_inf_as_null_cb)
 
 
+index_size_cutoff_doc = """
+: int
+    Monotonic increasing indexes with at least this many elements serve
+    lookups by binary search and never build a hash table. Set to 0 to
+    always use binary search for such indexes. Only affects index engines
+    created afterwards, see Index.clear_engine_cache.
+"""
+
+
+def index_size_cutoff_cb(key):
+    import pandas.index as _index
+    _index._SIZE_CUTOFF = cf.get_option(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('index_size_cutoff', 1000000, index_size_cutoff_doc,
+                       validator=is_int, cb=index_size_cutoff_cb)
+
+
 # user warnings
 chained_assignment = """
 : string
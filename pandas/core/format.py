@@ -6,7 +6,7 @@ import sys
 
 from pandas.core.base import PandasObject
 from pandas.core.common import adjoin, notnull
-from pandas.core.index import Index, MultiIndex, _ensure_index
+from pandas.core.index import Index, MultiIndex, Int64Index, _ensure_index
 from pandas import compat
 from pandas.compat import(StringIO, lzip, range, map, zip, reduce, u,
                           OrderedDict)
@@ -20,6 +20,7 @@ import numpy as np
 
 import itertools
 import csv
+import re
 
 from pandas.tseries.period import PeriodIndex, DatetimeIndex
 
@@ -1162,6 +1163,33 @@ def _get_level_lengths(levels, sentinel=''):
     return result
 
 
+_native_float_format = re.compile(r'^%[-+ #0]*\d{0,2}(\.\d{1,2})?[eEfFgG]$')
+_native_date_format = re.compile(r'^([^%]|%[YymdHMSf%])*$')
+
+
+def _is_native_float_format(float_format):
+    # printf style formats that lib.format_csv_rows applies itself
+    return (isinstance(float_format, compat.string_types) and
+            _native_float_format.match(float_format) is not None)
+
+
+def _csv_str(x):
+    if x is None:
+        return ''
+    return str(x)
+
+
+def _is_native_date_format(date_format):
+    # strftime formats that lib.format_csv_rows applies itself
+    if not isinstance(date_format, compat.string_types):
+        return False
+    try:
+        date_format.encode('ascii')
+    except UnicodeError:
+        return False
+    return _native_date_format.match(date_format) is not None
+
+
 class CSVFormatter(object):
 
     def __init__(self, obj, path_or_buf=None, sep=",", na_rep='', float_format=None,
@@ -1169,7 +1197,8 @@ class CSVFormatter(object):
                  mode='w', nanRep=None, encoding=None, quoting=None,
                  line_terminator='\n', chunksize=None, engine=None,
                  tupleize_cols=False, quotechar='"', date_format=None,
-                 doublequote=True, escapechar=None):
+                 doublequote=True, escapechar=None, compression=None,
+                 threads=1):
 
         self.engine = engine  # remove for 0.13
         self.obj = obj
@@ -1204,6 +1233,11 @@ class CSVFormatter(object):
 
         self.date_format = date_format
 
+        self.compression = compression
+        if not com.is_integer(threads) or threads < 1:
+            raise ValueError('threads must be a positive integer')
+        self.threads = threads
+
         # GH3457
         if not self.obj.columns.is_unique and engine == 'python':
             raise NotImplementedError("columns.is_unique == False not "
@@ -1372,8 +1406,10 @@ class CSVFormatter(object):
             close = False
         else:
             f = com._get_handle(self.path_or_buf, self.mode,
-                                encoding=self.encoding)
+                                encoding=self.encoding,
+                                compression=self.compression)
             close = True
+        self._handle = f
 
         try:
             writer_kwargs = dict(lineterminator=self.line_terminator,
@@ -1491,13 +1527,126 @@ class CSVFormatter(object):
         chunksize = self.chunksize
         chunks = int(nrows / chunksize) + 1
 
-        for i in range(chunks):
-            start_i = i * chunksize
-            end_i = min((i + 1) * chunksize, nrows)
-            if start_i >= end_i:
-                break
+        save_chunk = self._save_chunk
+        self._pool = None
+        if self._can_format_rows():
+            save_chunk = self._format_chunk
+            self._kinds = [self._column_kind(b) for b in self.blocks]
+            if self.threads > 1:
+                from multiprocessing.pool import ThreadPool
+                self._pool = ThreadPool(self.threads)
+
+        try:
+            for i in range(chunks):
+                start_i = i * chunksize
+                end_i = min((i + 1) * chunksize, nrows)
+                if start_i >= end_i:
+                    break
+
+                save_chunk(start_i, end_i)
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
 
-            self._save_chunk(start_i, end_i)
+    def _can_format_rows(self):
+        """
+        Whether lib.format_csv_rows can write the rows, rather than
+        csv.writer. It implements QUOTE_MINIMAL and QUOTE_ALL with
+        doublequote, and writes UTF-8 on Python 2 only without an encoding
+        """
+        return (self.quoting in (csv.QUOTE_MINIMAL, csv.QUOTE_ALL) and
+                self.doublequote and self.escapechar is None and
+                isinstance(self.sep, compat.string_types) and
+                len(self.sep) == 1 and
+                isinstance(self.quotechar, compat.string_types) and
+                len(self.quotechar) == 1 and
+                isinstance(self.line_terminator, compat.string_types) and
+                isinstance(self.na_rep, compat.string_types) and
+                (compat.PY3 or self.encoding is None))
+
+    def _column_kind(self, b):
+        # how lib.format_csv_rows formats the columns of a block, None to
+        # format them with to_native_types
+        if b.is_categorical or b.is_sparse:
+            return None
+
+        kind = b.dtype.kind
+        if kind == 'i' or (kind == 'u' and b.dtype.itemsize < 8):
+            return lib.CSV_INT64
+        elif kind == 'f' and b.dtype.itemsize <= 8:
+            if (self.float_format is None or
+                    _is_native_float_format(self.float_format)):
+                return lib.CSV_FLOAT64
+        elif kind == 'b':
+            return lib.CSV_BOOL
+        elif kind == 'M':
+            if (self.date_format is None or
+                    _is_native_date_format(self.date_format)):
+                return lib.CSV_DATETIME64
+        elif kind == 'O':
+            return lib.CSV_OBJECT
+        return None
+
+    def _format_chunk(self, start_i, end_i):
+        slicer = slice(start_i, end_i)
+
+        values = [None] * len(self.data)
+        kinds = [lib.CSV_OBJECT] * len(self.data)
+        for b, kind in zip(self.blocks, self._kinds):
+            if kind is None:
+                d = b.to_native_types(slicer=slicer, na_rep=self.na_rep,
+                                      float_format=self.float_format,
+                                      date_format=self.date_format)
+                for col_loc, col in zip(b.mgr_locs, d):
+                    values[col_loc] = lib.list_to_object_array(list(col))
+                continue
+
+            block_values = b.values[:, slicer]
+            if kind == lib.CSV_INT64:
+                block_values = block_values.astype(np.int64, copy=False)
+            elif kind == lib.CSV_FLOAT64:
+                block_values = block_values.astype(np.float64, copy=False)
+            elif kind == lib.CSV_DATETIME64:
+                block_values = block_values.view(np.int64)
+            for col_loc, col in zip(b.mgr_locs, block_values):
+                values[col_loc] = np.ascontiguousarray(col)
+                kinds[col_loc] = kind
+
+        if self.nlevels:
+            data_index = self.data_index
+            if self.nlevels == 1 and isinstance(data_index, Int64Index):
+                index_values = [np.ascontiguousarray(data_index.values[slicer])]
+                index_kinds = [lib.CSV_INT64]
+            else:
+                ix = data_index.to_native_types(slicer=slicer,
+                                                na_rep=self.na_rep,
+                                                float_format=self.float_format,
+                                                date_format=self.date_format)
+                if self.nlevels == 1:
+                    index_values = [lib.list_to_object_array(list(ix))]
+                else:
+                    # MultiIndex values are not NA-replaced, write missing
+                    # values as csv.writer does
+                    index_values = [lib.list_to_object_array(
+                        [_csv_str(x) if lib.checknull(x) else x
+                         for x in level]) for level in zip(*ix)]
+                index_kinds = [lib.CSV_OBJECT] * self.nlevels
+            values = index_values + values
+            kinds = index_kinds + kinds
+
+        rows = lib.format_csv_rows(values, kinds, sep=self.sep,
+                                   quotechar=self.quotechar,
+                                   quote_all=self.quoting == csv.QUOTE_ALL,
+                                   line_terminator=self.line_terminator,
+                                   na_rep=self.na_rep,
+                                   float_format=self.float_format,
+                                   date_format=self.date_format,
+                                   pool=self._pool)
+        if compat.PY3:
+            rows = rows.decode('utf-8')
+        self._handle.write(rows)
 
     def _save_chunk(self, start_i, end_i):
 
@@ -1105,7 +1105,7 @@ class DataFrame(NDFrame):
                mode='w', encoding=None, quoting=None,
                quotechar='"', line_terminator='\n', chunksize=None,
                tupleize_cols=False, date_format=None, doublequote=True,
-               escapechar=None, **kwds):
+               escapechar=None, compression=None, threads=1, **kwds):
         r"""Write DataFrame to a comma-separated values (csv) file
 
         Parameters
@@ -1157,6 +1157,11 @@ class DataFrame(NDFrame):
             or new (expanded format) if False)
         date_format : string, default None
             Format string for datetime objects
+        compression : {'gzip', 'bz2', 'xz', None}, default None
+            Compress the output file on the fly, only used when
+            `path_or_buf` is a file path
+        threads : int, default 1
+            Number of threads used to format the columns of each chunk
         cols : kwarg only alias of columns [deprecated]
         """
 
@@ -1172,7 +1177,9 @@ class DataFrame(NDFrame):
                                      tupleize_cols=tupleize_cols,
                                      date_format=date_format,
                                      doublequote=doublequote,
-                                     escapechar=escapechar)
+                                     escapechar=escapechar,
+                                     compression=compression,
+                                     threads=threads)
         formatter.save()
 
         if path_or_buf is None:
@@ -2563,7 +2570,7 @@ class DataFrame(NDFrame):
                                                                 mask, np.nan)
             return values
 
-        new_index = np.arange(len(new_obj),dtype='int64')
+        new_index = _default_index(len(new_obj))
         if isinstance(self.index, MultiIndex):
             if level is not None:
                 if not isinstance(level, (tuple, list)):
@@ -2733,29 +2740,42 @@ class DataFrame(NDFrame):
         -------
         duplicated : Series
         """
+        from pandas.core.groupby import _get_compressed_group_index
+        from pandas.hashtable import duplicated_int64
+
         # kludge for #1833
         def _m8_to_i8(x):
             if issubclass(x.dtype.type, np.datetime64):
                 return x.view(np.int64)
             return x
 
-        # if we are only duplicating on Categoricals this can be much faster
+        def f(vals):
+            # NA values get a code of their own so that they compare equal
+            labels, uniques = algos.factorize(_m8_to_i8(vals))
+            labels = com._ensure_int64(labels)
+            np.putmask(labels, labels < 0, len(uniques))
+            return labels, len(uniques) + 1
+
         if subset is None:
-            values = list(_m8_to_i8(self.get_values().T))
+            values = [self.iloc[:, i].get_values()
+                      for i in range(len(self.columns))]
         else:
             if np.iterable(subset) and not isinstance(subset, compat.string_types):
                 if isinstance(subset, tuple):
                     if subset in self.columns:
                         values = [self[subset].get_values()]
                     else:
-                        values = [_m8_to_i8(self[x].get_values()) for x in subset]
+                        values = [self[x].get_values() for x in subset]
                 else:
-                    values = [_m8_to_i8(self[x].get_values()) for x in subset]
+                    values = [self[x].get_values() for x in subset]
             else:
                 values = [self[subset].get_values()]
 
-        keys = lib.fast_zip_fillna(values)
-        duplicated = lib.duplicated(keys, take_last=take_last)
+        # factorize each column and combine the codes into int64 ids rather
+        # than zipping the rows into tuples
+        labels, shape = map(list, zip(*map(f, values)))
+        ids = _get_compressed_group_index(labels, shape)
+        duplicated = duplicated_int64(ids, take_last=take_last)
         return Series(duplicated, index=self.index)
 
     #----------------------------------------------------------------------
@@ -4621,8 +4641,8 @@ class DataFrame(NDFrame):
                                 " allowed to be passed to DataFrame.isin(), "
                                 "you passed a "
                                 "{0!r}".format(type(values).__name__))
-            return DataFrame(lib.ismember(self.values.ravel(),
-                                          set(values)).reshape(self.shape),
+            return DataFrame(algos.isin(self.values.ravel(),
+                                        values).reshape(self.shape),
                              self.index,
                              self.columns)
 
@@ -4736,7 +4756,7 @@ def extract_index(data):
                            % (lengths[0], len(index)))
                     raise ValueError(msg)
             else:
-                index = Index(np.arange(lengths[0]))
+                index = _default_index(lengths[0])
 
     return _ensure_index(index)
 
@@ -787,7 +787,7 @@ class NDFrame(PandasObject):
 
     def to_json(self, path_or_buf=None, orient=None, date_format='epoch',
                 double_precision=10, force_ascii=True, date_unit='ms',
-                default_handler=None):
+                default_handler=None, lines=False, chunksize=None):
         """
         Convert the object to a JSON string.
 
@@ -835,6 +835,13 @@ class NDFrame(PandasObject):
             Handler to call if object cannot otherwise be converted to a
             suitable format for JSON. Should receive a single argument which is
             the object to convert and return a serialisable object.
+        lines : boolean, default False
+            If 'orient' is 'records' write out line delimited json format,
+            one record per line.
+        chunksize : int, default None
+            Encode and write the rows ``chunksize`` at a time rather than
+            building the whole JSON string in memory first. Only supported
+            for orient 'records', 'split' and 'values'.
 
         Returns
         -------
@@ -850,7 +857,9 @@ class NDFrame(PandasObject):
             double_precision=double_precision,
             force_ascii=force_ascii,
             date_unit=date_unit,
-            default_handler=default_handler)
+            default_handler=default_handler,
+            lines=lines,
+            chunksize=chunksize)
 
     def to_hdf(self, path_or_buf, key, **kwargs):
         """ activate the HDFStore
@@ -916,7 +925,7 @@ class NDFrame(PandasObject):
         return packers.to_msgpack(path_or_buf, self, **kwargs)
 
     def to_sql(self, name, con, flavor='sqlite', schema=None, if_exists='fail',
-               index=True, index_label=None, chunksize=None):
+               index=True, index_label=None, chunksize=None, insert_method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -948,12 +957,20 @@ class NDFrame(PandasObject):
         chunksize : int, default None
             If not None, then rows will be written in batches of this size at a
             time.  If None, all rows will be written at once.
+        insert_method : {None, 'multi', 'copy'}, default None
+            - None: insert one row per parameter set with ``executemany``.
+            - multi: insert many rows per statement, with a multi-row
+              ``VALUES`` clause of as many rows as the parameter limit of the
+              database allows.
+            - copy: stream the rows as CSV to a ``COPY ... FROM STDIN``
+              statement. Only supported for PostgreSQL through psycopg2.
 
         """
         from pandas.io import sql
         sql.to_sql(
             self, name, con, flavor=flavor, schema=schema, if_exists=if_exists,
-            index=index, index_label=index_label, chunksize=chunksize)
+            index=index, index_label=index_label, chunksize=chunksize,
+            insert_method=insert_method)
 
     def to_pickle(self, path):
         """
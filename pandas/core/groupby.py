@@ -3519,6 +3519,45 @@ def _int64_overflow_possible(shape):
     return the_prod >= _INT64_MAX
 
 
+def _get_compressed_group_index(label_list, shape):
+    """
+    Combine label_list into a single array of group ids like
+    get_group_index, compressing the partial result whenever the cartesian
+    product of the remaining levels would overflow int64. The ids identify
+    equal label combinations but, unlike get_group_index, are not offsets
+    that can be passed to decons_group_index.
+    """
+    label_list, shape = list(label_list), list(shape)
+
+    while True:
+        # number of leading levels that can be combined without overflow
+        nlev, the_prod = 1, long(shape[0])
+        for x in shape[1:]:
+            the_prod *= long(x)
+            if the_prod >= _INT64_MAX:
+                break
+            nlev += 1
+
+        if nlev == 1 and len(shape) > 1:
+            # the first two levels alone overflow, so compressing the first
+            # one would not make progress: replace both by the ids of their
+            # observed labels, whose product is at most the number of rows
+            # squared
+            for i in range(2):
+                comp_ids, obs_ids = _compress_group_index(label_list[i],
+                                                          sort=False)
+                label_list[i], shape[i] = comp_ids, len(obs_ids)
+            continue
+
+        group_index = get_group_index(label_list[:nlev], shape[:nlev])
+        if nlev == len(shape):
+            return com._ensure_int64(group_index)
+
+        comp_ids, obs_ids = _compress_group_index(group_index, sort=False)
+        label_list = [comp_ids] + label_list[nlev:]
+        shape = [len(obs_ids)] + shape[nlev:]
+
+
 def decons_group_index(comp_labels, shape):
     # reconstruct labels
     label_list = []
@@ -127,6 +127,9 @@ class Index(IndexOpsMixin, PandasObject):
         if fastpath:
             return cls._simple_new(data, name)
 
+        if isinstance(data, range) and dtype is None:
+            return RangeIndex.from_range(data, name=name)
+
         from pandas.tseries.period import PeriodIndex
         if isinstance(data, (np.ndarray, Index, ABCSeries)):
             if issubclass(data.dtype.type, np.datetime64):
@@ -792,6 +795,26 @@ class Index(IndexOpsMixin, PandasObject):
     def _cleanup(self):
         self._engine.clear_mapping()
 
+    @property
+    def engine_nbytes(self):
+        """
+        Return the number of bytes held by the lookup engine of the index,
+        i.e. its hash table. This is 0 until a lookup requires the hash table
+        to be built, and stays 0 for large monotonic indexes which are
+        searched by binary search (see the ``mode.index_size_cutoff`` option).
+        """
+        if '_engine' not in (getattr(self, '_cache', None) or {}):
+            return 0
+        return self._engine.sizeof()
+
+    def clear_engine_cache(self):
+        """
+        Release the lookup engine of the index together with its hash table.
+        The engine is recreated on the next lookup, honouring the current
+        value of the ``mode.index_size_cutoff`` option.
+        """
+        self._reset_cache('_engine')
+
     @cache_readonly
     def _engine(self):
         # property, for now, slow to look up
@@ -1587,7 +1610,8 @@ class Index(IndexOpsMixin, PandasObject):
         value_set = set(values)
         if level is not None:
             self._validate_index_level(level)
-        return lib.ismember(self._array_values(), value_set)
+        from pandas.core.algorithms import isin
+        return isin(self._array_values(), value_set)
 
     def _get_method(self, method):
         if method:
@@ -2293,6 +2317,358 @@ class Int64Index(NumericIndex):
         return Int64Index(joined, name=name)
 Int64Index._add_numeric_methods()
 
+
+class RangeIndex(Int64Index):
+
+    """
+    Immutable Index implementing a monotonic range. RangeIndex is a
+    memory-saving special case of Int64Index limited to representing
+    monotonic ranges: only start, stop and step are stored, and lookups,
+    slicing and set operations with other RangeIndexes are computed
+    arithmetically. The values are only materialized when requested.
+
+    This is the default index type used by DataFrame and Series when no
+    explicit index is provided by the user.
+
+    Parameters
+    ----------
+    start : int (default: 0)
+    stop : int (default: 0)
+    step : int (default: 1)
+    name : object, optional
+        Name to be stored in the index
+    copy : bool, default False
+        Unused, accepted for homogeneity with other index types.
+    """
+
+    _typ = 'rangeindex'
+
+    def __new__(cls, start=None, stop=None, step=None, name=None, dtype=None,
+                fastpath=False, copy=False, **kwargs):
+
+        if fastpath:
+            return cls._simple_new_range(start, stop, step, name=name)
+
+        if isinstance(start, RangeIndex):
+            if name is None:
+                name = start.name
+            return cls._simple_new_range(start._start, start._stop,
+                                         start._step, name=name)
+
+        if isinstance(start, range):
+            return cls.from_range(start, name=name)
+
+        if dtype is not None and np.dtype(dtype) != np.int64:
+            raise TypeError('Invalid to pass a non-int64 dtype to '
+                            'RangeIndex')
+
+        def _ensure_int(value, field):
+            try:
+                new_value = int(value)
+            except (TypeError, ValueError):
+                new_value = None
+            if new_value is None or new_value != value:
+                raise TypeError("RangeIndex(...) must be called with integers,"
+                                " %s was passed for %s" % (value, field))
+            return new_value
+
+        if start is None and stop is None:
+            raise TypeError("RangeIndex(...) must be called with integers")
+
+        start = 0 if start is None else _ensure_int(start, 'start')
+        if stop is None:
+            start, stop = 0, start
+        else:
+            stop = _ensure_int(stop, 'stop')
+
+        step = 1 if step is None else _ensure_int(step, 'step')
+        if step == 0:
+            raise ValueError("Step must not be zero")
+
+        return cls._simple_new_range(start, stop, step, name=name)
+
+    @classmethod
+    def from_range(cls, data, name=None):
+        """ create a RangeIndex from a range (xrange in python 2) object """
+        if not isinstance(data, range):
+            raise TypeError('%s(...) must be called with object coercible to '
+                            'a range, %r was passed' % (cls.__name__, data))
+        start, stop, step = data.__reduce__()[1]
+        return cls._simple_new_range(start, stop, step, name=name)
+
+    @classmethod
+    def _simple_new(cls, values, name=None, **kwargs):
+        # values passed from inherited methods produce a regular Int64Index
+        return Int64Index._simple_new(values, name=name, **kwargs)
+
+    @classmethod
+    def _simple_new_range(cls, start, stop=None, step=None, name=None,
+                          **kwargs):
+        """ create a RangeIndex from start, stop and step, without
+        validation """
+        result = object.__new__(cls)
+        result._start = start
+        result._stop = 0 if stop is None else stop
+        result._step = 1 if step is None else step
+        result.name = name
+        for k, v in compat.iteritems(kwargs):
+            setattr(result, k, v)
+        result._reset_identity()
+        return result
+
+    @property
+    def _constructor(self):
+        """ return the class to use for construction """
+        return Int64Index
+
+    def _shallow_copy(self, values=None, **kwargs):
+        """ create a new Index, don't copy the data, use the same object
+            attributes with passed in attributes taking precedence """
+        attributes = self._get_attributes_dict()
+        attributes.update(kwargs)
+        if values is None:
+            return RangeIndex._simple_new_range(self._start, self._stop,
+                                                self._step, **attributes)
+        return Int64Index._simple_new(values, **attributes)
+
+    @cache_readonly
+    def _data(self):
+        return np.arange(self._start, self._stop, self._step, dtype=np.int64)
+
+    def copy(self, names=None, name=None, dtype=None, deep=False):
+        # the values are computed from start, stop and step, so a deep copy
+        # is the same as a shallow one
+        return super(RangeIndex, self).copy(names=names, name=name,
+                                            dtype=dtype, deep=False)
+
+    def __reduce__(self):
+        d = dict(start=self._start, stop=self._stop, step=self._step)
+        d.update(self._get_attributes_dict())
+        return _new_Index, (self.__class__, d), None
+
+    def __unicode__(self):
+        """
+        Return a string representation for this object.
+
+        Invoked by unicode(df) in py2 only. Yields a Unicode String in both
+        py2/py3.
+        """
+        attrs = [('start', self._start), ('stop', self._stop),
+                 ('step', self._step)]
+        if self.name is not None:
+            attrs.append(('name', com.pprint_thing(self.name,
+                                                   quote_strings=True)))
+        return "%s(%s)" % (type(self).__name__,
+                           ', '.join('%s=%s' % kv for kv in attrs))
+
+    @cache_readonly
+    def dtype(self):
+        return np.dtype(np.int64)
+
+    @cache_readonly
+    def nbytes(self):
+        """ return the number of bytes in the underlying data """
+        return sum(getsizeof(v) for v in (self._start, self._stop,
+                                          self._step))
+
+    def __len__(self):
+        """
+        return the length of the RangeIndex
+        """
+        return max(0, -(-(self._stop - self._start) // self._step))
+
+    @property
+    def _last(self):
+        # the last value of the range, only valid if non-empty
+        return self._start + (len(self) - 1) * self._step
+
+    @cache_readonly
+    def is_unique(self):
+        """ return if the index has unique values """
+        return True
+
+    @property
+    def is_monotonic(self):
+        return self.is_monotonic_increasing
+
+    @property
+    def is_monotonic_increasing(self):
+        return self._step > 0 or len(self) <= 1
+
+    @property
+    def is_monotonic_decreasing(self):
+        return self._step < 0 or len(self) <= 1
+
+    def __contains__(self, key):
+        hash(key)
+        if is_integer(key):
+            try:
+                self.get_loc(key)
+                return True
+            except KeyError:
+                return False
+        return super(RangeIndex, self).__contains__(key)
+
+    def get_loc(self, key):
+        """
+        Get integer location for requested label
+
+        Returns
+        -------
+        loc : int
+        """
+        if is_integer(key):
+            loc, rem = divmod(key - self._start, self._step)
+            if rem == 0 and 0 <= loc < len(self):
+                return int(loc)
+            raise KeyError(key)
+        return super(RangeIndex, self).get_loc(key)
+
+    def get_value(self, series, key):
+        """
+        Fast lookup of value from 1-dimensional ndarray. Only use this if you
+        know what you're doing
+        """
+        k = _values_from_object(key)
+        if is_integer(k):
+            return _index.get_value_at(_values_from_object(series),
+                                       self.get_loc(k))
+        return super(RangeIndex, self).get_value(series, key)
+
+    def get_indexer(self, target, method=None, limit=None):
+        target = _ensure_index(target)
+        if method is not None or not isinstance(target, Int64Index):
+            return super(RangeIndex, self).get_indexer(target, method=method,
+                                                       limit=limit)
+
+        offsets = target.values - self._start
+        locs = offsets // self._step
+        locs[(offsets % self._step != 0) | (locs < 0) |
+             (locs >= len(self))] = -1
+        return com._ensure_platform_int(locs)
+
+    def __getitem__(self, key):
+        """
+        Conserve RangeIndex type for scalar and slice keys.
+        """
+        if is_integer(key):
+            n = len(self)
+            if key < 0:
+                key += n
+            if not 0 <= key < n:
+                raise IndexError("index %d is out of bounds for axis 0 "
+                                 "with size %d" % (key, n))
+            return self._start + key * self._step
+
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            n = len(range(start, stop, step))
+            new_start = self._start + start * self._step
+            new_step = self._step * step
+            return RangeIndex._simple_new_range(new_start,
+                                                new_start + n * new_step,
+                                                new_step, name=self.name)
+
+        return super(RangeIndex, self).__getitem__(key)
+
+    def equals(self, other):
+        """
+        Determines if two Index objects contain the same elements.
+        """
+        if isinstance(other, RangeIndex):
+            n = len(self)
+            if n != len(other):
+                return False
+            return (n == 0 or (self._start == other._start and
+                               (n == 1 or self._step == other._step)))
+        return super(RangeIndex, self).equals(other)
+
+    def union(self, other):
+        """
+        Form the union of two Index objects and sorts if possible
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        union : Index
+        """
+        if (isinstance(other, RangeIndex) and len(self) and len(other) and
+                self._step == other._step and self._step > 0 and
+                (self._start - other._start) % self._step == 0 and
+                self._start <= other._last + self._step and
+                other._start <= self._last + self._step):
+            name = self.name if self.name == other.name else None
+            return RangeIndex._simple_new_range(
+                min(self._start, other._start),
+                max(self._last, other._last) + self._step, self._step,
+                name=name)
+        return super(RangeIndex, self).union(other)
+
+    def intersection(self, other):
+        """
+        Form the intersection of two Index objects. Sortedness of the result is
+        not guaranteed
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        intersection : Index
+        """
+        if not (isinstance(other, RangeIndex) and
+                self._step > 0 and other._step > 0):
+            return super(RangeIndex, self).intersection(other)
+
+        name = self.name if self.name == other.name else None
+        empty = RangeIndex._simple_new_range(0, 0, 1, name=name)
+        if not len(self) or not len(other):
+            return empty
+
+        lower = max(self._start, other._start)
+        upper = min(self._last, other._last)
+        if upper < lower:
+            return empty
+
+        # the common values solve x = self._start (mod self._step) and
+        # x = other._start (mod other._step)
+        gcd, s, _ = _extended_gcd(self._step, other._step)
+        diff = other._start - self._start
+        if diff % gcd:
+            return empty
+
+        step = self._step // gcd * other._step
+        solution = self._start + diff // gcd * s * self._step
+        start = lower + (solution - lower) % step
+        if start > upper:
+            return empty
+        return RangeIndex._simple_new_range(start, upper + 1, step, name=name)
+
+    def _wrap_union_result(self, other, result):
+        name = self.name if self.name == other.name else None
+        return Int64Index(data=result, name=name)
+
+
+def _extended_gcd(a, b):
+    """
+    Extended Euclidean algorithm, returns (gcd, s, t) such that
+    a * s + b * t == gcd
+    """
+    s, old_s = 0, 1
+    t, old_t = 1, 0
+    r, old_r = b, a
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_s, s = s, old_s - quotient * s
+        old_t, t = t, old_t - quotient * t
+    return old_r, old_s, old_t
+
+
 class Float64Index(NumericIndex):
 
     """
@@ -2481,8 +2857,9 @@ class Float64Index(NumericIndex):
         value_set = set(values)
         if level is not None:
             self._validate_index_level(level)
-        return lib.ismember_nans(self._array_values(), value_set,
-                                 isnull(list(value_set)).any())
+        from pandas.core.algorithms import isin
+        return isin(self._array_values(), value_set,
+                    hasnans=isnull(list(value_set)).any())
 Float64Index._add_numeric_methods()
 
 
@@ -2986,6 +3363,56 @@ class MultiIndex(Index):
         self._tuples = lib.fast_zip(values)
         return self._tuples
 
+    @cache_readonly
+    def _engine(self):
+        # the engine packs the labels into integer keys, the tuples are only
+        # materialized if monotonicity cannot be determined from the keys
+        return _index.MultiIndexEngine(self.levels, self.labels,
+                                       lambda: self.values)
+
+    def _get_target_codes(self, target):
+        """
+        Map target to a list of per-level codes (labels shifted by one, with
+        missing values as 0) in the coding of this index, as expected by the
+        engine. Values which are not in the corresponding level are coded as
+        -1.
+
+        Parameters
+        ----------
+        target : MultiIndex or Index of tuples
+
+        Returns
+        -------
+        codes : list of int64 ndarrays
+        """
+        codes = []
+        if isinstance(target, MultiIndex):
+            for lev, tlev, tlab in zip(self.levels, target.levels,
+                                       target.labels):
+                lev_codes = lev.get_indexer(tlev)
+                lev_codes = np.where(lev_codes == -1, -1, lev_codes + 1)
+                tlab = com._ensure_int64(tlab)
+                code = np.zeros(len(tlab), dtype=np.int64)
+                mask = tlab != -1
+                code[mask] = lev_codes.take(tlab[mask])
+                codes.append(code)
+            return codes
+
+        values = _values_from_object(target)
+        nlevels = self.nlevels
+        valid = np.array([isinstance(val, tuple) and len(val) == nlevels
+                          for val in values], dtype=bool)
+        for i, lev in enumerate(self.levels):
+            level_values = np.empty(len(values), dtype=object)
+            level_values[:] = [val[i] if ok else np.nan
+                               for val, ok in zip(values, valid)]
+            code = com._ensure_int64(lev.get_indexer(level_values))
+            code = np.where(code == -1, -1, code + 1)
+            code[isnull(level_values)] = 0
+            code[~valid] = -1
+            codes.append(code)
+        return codes
+
     # fml
     @property
     def _is_v1(self):
@@ -3710,36 +4137,38 @@ class MultiIndex(Index):
 
         target = _ensure_index(target)
 
-        target_index = target
-        if isinstance(target, MultiIndex):
-            target_index = target._tuple_index
-
-        if target_index.dtype != object:
-            return np.ones(len(target_index)) * -1
+        if target.dtype != object:
+            return np.ones(len(target)) * -1
 
         if not self.is_unique:
             raise Exception('Reindexing only valid with uniquely valued Index '
                             'objects')
 
-        self_index = self._tuple_index
-
         if method == 'pad':
             if not self.is_unique or not self.is_monotonic:
                 raise AssertionError(('Must be unique and monotonic to '
                                       'use forward fill getting the indexer'))
-            indexer = self_index._engine.get_pad_indexer(target_index.values,
-                                                         limit=limit)
+            target_index = _ensure_index(target.values)
+            indexer = self._tuple_index._engine.get_pad_indexer(
+                target_index.values, limit=limit)
         elif method == 'backfill':
             if not self.is_unique or not self.is_monotonic:
                 raise AssertionError(('Must be unique and monotonic to '
                                       'use backward fill getting the indexer'))
-            indexer = self_index._engine.get_backfill_indexer(target_index.values,
-                                                              limit=limit)
+            target_index = _ensure_index(target.values)
+            indexer = self._tuple_index._engine.get_backfill_indexer(
+                target_index.values, limit=limit)
         else:
-            indexer = self_index._engine.get_indexer(target_index.values)
+            indexer = self._engine.get_indexer(self._get_target_codes(target))
 
         return com._ensure_platform_int(indexer)
 
+    def get_indexer_non_unique(self, target, **kwargs):
+        target = _ensure_index(target)
+        codes = self._get_target_codes(target)
+        indexer, missing = self._engine.get_indexer_non_unique(codes)
+        return Index(indexer), missing
+
     def reindex(self, target, method=None, level=None, limit=None):
         """
         Create index with target's values (move/add/delete values as necessary)
@@ -848,7 +848,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         resetted : DataFrame, or Series if drop == True
         """
         if drop:
-            new_index = np.arange(len(self))
+            new_index = _default_index(len(self))
             if level is not None and isinstance(self.index, MultiIndex):
                 if not isinstance(level, (tuple, list)):
                     level = [level]
@@ -2243,8 +2243,8 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             values = Series(to_timedelta(values)).values.view('i8')
             comps = comps.view('i8')
 
-        value_set = set(values)
-        result = lib.ismember(comps, value_set)
+        from pandas.core.algorithms import isin
+        result = isin(comps, values)
         return self._constructor(result, index=self.index).__finalize__(self)
 
     def between(self, left, right, inclusive=True):
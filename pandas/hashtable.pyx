@@ -48,6 +48,13 @@ def list_to_object_array(list obj):
 
 cdef size_t _INIT_VEC_CAP = 32
 
+
+cdef inline Py_ssize_t _khash_nbytes(khint_t n_buckets, size_t key_size):
+    # each bucket holds a key and a size_t value, the occupancy flags take
+    # 2 bits per bucket packed into uint32s
+    return (n_buckets * (key_size + sizeof(size_t)) +
+            (1 if n_buckets < 16 else n_buckets >> 4) * sizeof(uint32_t))
+
 cdef class ObjectVector:
 
     cdef:
@@ -378,6 +385,10 @@ cdef class Int64HashTable: #(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """ return the number of bytes allocated by the hash table """
+        return _khash_nbytes(self.table.n_buckets, sizeof(int64_t))
+
     cpdef get_item(self, int64_t val):
         cdef khiter_t k
         k = kh_get_int64(self.table, val)
@@ -546,6 +557,10 @@ cdef class Float64HashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """ return the number of bytes allocated by the hash table """
+        return _khash_nbytes(self.table.n_buckets, sizeof(float64_t))
+
     cpdef get_item(self, float64_t val):
         cdef khiter_t k
         k = kh_get_float64(self.table, val)
@@ -681,6 +696,13 @@ cdef class PyObjectHashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def sizeof(self):
+        """
+        return the number of bytes allocated by the hash table, excluding the
+        referenced keys
+        """
+        return _khash_nbytes(self.table.n_buckets, sizeof(PyObject*))
+
     def __contains__(self, object key):
         cdef khiter_t k
         hash(key)
@@ -1062,3 +1084,126 @@ def mode_int64(ndarray[int64_t] values):
     kh_destroy_int64(table)
 
     return modes[:j+1]
+
+
+def ismember_int64(ndarray[int64_t] arr, ndarray[int64_t] values):
+    '''
+    Elementwise membership of arr in values, probing a khash set built
+    from values
+
+    Parameters
+    ----------
+    arr : ndarray[int64]
+    values : ndarray[int64]
+
+    Returns
+    -------
+    ismember : ndarray (boolean dtype)
+    '''
+    cdef:
+        Py_ssize_t i, n
+        int ret = 0
+        khiter_t k
+        ndarray[uint8_t] result
+        kh_int64_t *table
+
+    table = kh_init_int64()
+    n = len(values)
+    kh_resize_int64(table, n)
+    for i in range(n):
+        kh_put_int64(table, values[i], &ret)
+
+    n = len(arr)
+    result = np.empty(n, dtype=np.uint8)
+    for i in range(n):
+        k = kh_get_int64(table, arr[i])
+        result[i] = k != table.n_buckets
+
+    kh_destroy_int64(table)
+    return result.view(np.bool_)
+
+
+def ismember_float64(ndarray[float64_t] arr, ndarray[float64_t] values,
+                     bint hasnans=False):
+    '''
+    Elementwise membership of arr in values, probing a khash set built
+    from values. NaN never compares equal in the table, so NaN elements of
+    arr are only reported as members when hasnans is True
+
+    Parameters
+    ----------
+    arr : ndarray[float64]
+    values : ndarray[float64]
+    hasnans : boolean, default False
+
+    Returns
+    -------
+    ismember : ndarray (boolean dtype)
+    '''
+    cdef:
+        Py_ssize_t i, n
+        int ret = 0
+        khiter_t k
+        float64_t val
+        ndarray[uint8_t] result
+        kh_float64_t *table
+
+    table = kh_init_float64()
+    n = len(values)
+    kh_resize_float64(table, n)
+    for i in range(n):
+        val = values[i]
+        if val == val:
+            kh_put_float64(table, val, &ret)
+
+    n = len(arr)
+    result = np.empty(n, dtype=np.uint8)
+    for i in range(n):
+        val = arr[i]
+        if val != val:
+            result[i] = hasnans
+        else:
+            k = kh_get_float64(table, val)
+            result[i] = k != table.n_buckets
+
+    kh_destroy_float64(table)
+    return result.view(np.bool_)
+
+
+def duplicated_int64(ndarray[int64_t] values, take_last=False):
+    '''
+    Mark repeated values, keeping the first (or last, if take_last)
+    occurrence of each value unmarked
+
+    Parameters
+    ----------
+    values : ndarray[int64]
+    take_last : boolean, default False
+
+    Returns
+    -------
+    duplicated : ndarray (boolean dtype)
+    '''
+    cdef:
+        Py_ssize_t i, n
+        int ret = 0
+        ndarray[uint8_t] result
+        kh_int64_t *table
+
+    n = len(values)
+    result = np.empty(n, dtype=np.uint8)
+
+    table = kh_init_int64()
+    kh_resize_int64(table, min(n, 1000000))
+
+    if take_last:
+        for i from n > i >= 0:
+            kh_put_int64(table, values[i], &ret)
+            result[i] = ret == 0
+    else:
+        for i from 0 <= i < n:
+            kh_put_int64(table, values[i], &ret)
+            result[i] = ret == 0
+
+    kh_destroy_int64(table)
+    return result.view(np.bool_)
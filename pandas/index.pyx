@@ -65,7 +65,8 @@ def set_value_at(ndarray arr, object loc, object val):
     return util.set_value_at(arr, loc, val)
 
 
-# Don't populate hash tables in monotonic indexes larger than this
+# Don't populate hash tables in monotonic indexes larger than this, lookups
+# are served by binary search instead (see the mode.index_size_cutoff option)
 _SIZE_CUTOFF = 1000000
 
 
@@ -93,8 +94,19 @@ cdef class IndexEngine:
         self.monotonic_dec = 0
 
     def __contains__(self, object val):
-        self._ensure_mapping_populated()
         hash(val)
+        if self.over_size_threshold and self.is_monotonic_increasing:
+            try:
+                self.get_loc(val)
+                return True
+            except KeyError:
+                return False
+            except TypeError:
+                # val cannot be compared with the values (e.g. an int in
+                # strings on py3), look it up in the hash table instead
+                pass
+
+        self._ensure_mapping_populated()
         return val in self.mapping
 
     cpdef get_value(self, ndarray arr, object key):
@@ -138,9 +150,10 @@ cdef class IndexEngine:
         if self.over_size_threshold and self.is_monotonic_increasing:
             if not self.is_unique:
                 return self._get_loc_duplicates(val)
+            self._check_type(val)
             values = self._get_index_values()
             loc = _bin_search(values, val) # .searchsorted(val, side='left')
-            if util.get_value_at(values, loc) != val:
+            if loc == len(values) or util.get_value_at(values, loc) != val:
                 raise KeyError(val)
             return loc
 
@@ -246,6 +259,13 @@ cdef class IndexEngine:
         return self.vgetter()
 
     cdef inline _do_unique_check(self):
+        # the monotonic check also determines uniqueness of a monotonic
+        # index, only build the hash table if that is inconclusive
+        if self.over_size_threshold:
+            if not self.monotonic_check:
+                self._do_monotonic_check()
+            if self.unique_check:
+                return
         self._ensure_mapping_populated()
 
     def _call_monotonic(self, values):
@@ -277,7 +297,45 @@ cdef class IndexEngine:
         self.mapping = None
         self.initialized = 0
 
+    property is_mapping_populated:
+
+        def __get__(self):
+            return self.initialized == 1
+
+    def sizeof(self):
+        """ return the number of bytes allocated by the hash table """
+        if not self.initialized:
+            return 0
+        return self.mapping.sizeof()
+
+    cdef inline bint _use_bin_search(self):
+        # large, unique and monotonic increasing indexes are searched without
+        # ever building the hash table
+        return (self.over_size_threshold and self.is_monotonic_increasing and
+                self.is_unique)
+
+    cdef _get_indexer_bin_search(self, ndarray values, ndarray target):
+        cdef:
+            Py_ssize_t n = len(values)
+            ndarray[int64_t] result
+
+        if n == 0:
+            return np.repeat(-1, len(target)).astype(np.int64)
+
+        result = algos.ensure_int64(values.searchsorted(target, side='left'))
+        found = result < n
+        found &= values.take(np.where(found, result, 0)) == target
+        result[~found] = -1
+        return result
+
     def get_indexer(self, values):
+        if self._use_bin_search():
+            try:
+                return self._get_indexer_bin_search(self._get_index_values(),
+                                                    values)
+            except TypeError:
+                # incomparable objects
+                pass
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
@@ -296,7 +354,6 @@ cdef class IndexEngine:
             int count = 0, count_missing = 0
             Py_ssize_t i, j, n, n_t, n_alloc
 
-        self._ensure_mapping_populated()
         values = self._get_index_values()
         stargets = set(targets)
         n = len(values)
@@ -576,10 +633,13 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val)
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
         if values.dtype != self._get_box_dtype():
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
+        if self._use_bin_search():
+            return self._get_indexer_bin_search(self._get_index_values(),
+                                                values)
+        self._ensure_mapping_populated()
         return self.mapping.lookup(values)
 
     def get_pad_indexer(self, other, limit=None):
@@ -602,6 +662,225 @@ cdef class TimedeltaEngine(DatetimeEngine):
     cdef _get_box_dtype(self):
         return 'm8[ns]'
 
+cdef inline int _bit_width(Py_ssize_t n):
+    # the number of bits needed to store n (int.bit_length is not
+    # available on python 2.6)
+    cdef int width = 0
+    while n > 0:
+        n >>= 1
+        width += 1
+    return width
+
+cdef class MultiIndexEngine:
+    """
+    Lookup engine for a MultiIndex which does not materialize the index
+    tuples.
+
+    The labels of every level are shifted by one (so that a missing label,
+    -1, becomes 0) and packed into a single integer key per location, using
+    just enough bits per level to hold its codes. The first level occupies
+    the most significant bits, so the keys sort in the lexicographic order of
+    the labels. Keys which fit into 63 bits are searched or hashed through an
+    Int64Engine; wider keys are kept as python integers and hashed through an
+    ObjectEngine.
+    """
+
+    cdef readonly:
+        object levels
+        list offsets
+        bint overflow
+        IndexEngine base
+
+    cdef:
+        object labels, vgetter, keys
+        bint monotonic_check, monotonic_inc, monotonic_dec
+
+    def __init__(self, levels, labels, vgetter):
+        cdef:
+            Py_ssize_t i, nlevels = len(levels)
+            list bits
+
+        self.levels = levels
+        self.labels = labels
+        # only used to check monotonicity when it cannot be read off the keys
+        self.vgetter = vgetter
+        self.keys = None
+        self.monotonic_check = 0
+
+        # codes run from 0 (missing) to len(lev)
+        bits = [_bit_width(len(lev)) for lev in levels]
+        self.offsets = [sum(bits[i + 1:]) for i in range(nlevels)]
+        self.overflow = sum(bits) > 63
+
+        n = len(labels[0]) if nlevels else 0
+        if self.overflow:
+            self.base = ObjectEngine(self._get_keys, n)
+        else:
+            self.base = Int64Engine(self._get_keys, n)
+
+    def _get_keys(self):
+        if self.keys is None:
+            self.keys = self.pack_codes([algos.ensure_int64(lab) + 1
+                                         for lab in self.labels])
+        return self.keys
+
+    def pack_codes(self, codes):
+        """
+        Pack a list of per-level code arrays (as produced by shifting the
+        labels by one) into an array of keys. Locations where any code is
+        negative, i.e. the value is not in the level, get the key -1 which
+        never matches an index key.
+        """
+        cdef:
+            Py_ssize_t n = len(codes[0])
+
+        if self.overflow:
+            keys = np.zeros(n, dtype=object)
+            for code, offset in zip(codes, self.offsets):
+                keys = keys | (code.astype(object) << offset)
+        else:
+            keys = np.zeros(n, dtype=np.int64)
+            for code, offset in zip(codes, self.offsets):
+                keys |= code << offset
+
+        missing = np.zeros(n, dtype=bool)
+        for code in codes:
+            missing |= code < 0
+        if missing.any():
+            keys[missing] = -1
+
+        return keys
+
+    cdef object _pack_key(self, object key):
+        cdef:
+            object packed = 0
+
+        if not PyTuple_Check(key) or len(key) != len(self.levels):
+            raise KeyError(key)
+
+        for lev, val, offset in zip(self.levels, key, self.offsets):
+            if util._checknull(val):
+                code = 0
+            else:
+                try:
+                    loc = lev.get_loc(val)
+                except (KeyError, TypeError):
+                    raise KeyError(key)
+                if not util.is_integer_object(loc):
+                    raise KeyError(key)
+                code = loc + 1
+            packed |= code << offset
+
+        return packed
+
+    def __contains__(self, object val):
+        hash(val)
+        try:
+            self.get_loc(val)
+        except KeyError:
+            return False
+        return True
+
+    cpdef get_loc(self, object val):
+        if is_definitely_invalid_key(val):
+            raise TypeError
+
+        try:
+            return self.base.get_loc(self._pack_key(val))
+        except KeyError:
+            raise KeyError(val)
+
+    cpdef get_value(self, ndarray arr, object key):
+        '''
+        arr : 1-dimensional ndarray
+        '''
+        cdef:
+            object loc
+
+        loc = self.get_loc(key)
+        if PySlice_Check(loc) or cnp.PyArray_Check(loc):
+            return arr[loc]
+        else:
+            return get_value_at(arr, loc)
+
+    cpdef set_value(self, ndarray arr, object key, object value):
+        '''
+        arr : 1-dimensional ndarray
+        '''
+        cdef:
+            object loc
+
+        loc = self.get_loc(key)
+        value = convert_scalar(arr, value)
+
+        if PySlice_Check(loc) or cnp.PyArray_Check(loc):
+            arr[loc] = value
+        else:
+            util.set_value_at(arr, loc, value)
+
+    def get_indexer(self, codes):
+        return self.base.get_indexer(self.pack_codes(codes))
+
+    def get_indexer_non_unique(self, codes):
+        return self.base.get_indexer_non_unique(self.pack_codes(codes))
+
+    property is_unique:
+
+        def __get__(self):
+            return self.base.is_unique
+
+    property is_monotonic_increasing:
+
+        def __get__(self):
+            if not self.monotonic_check:
+                self._do_monotonic_check()
+
+            return self.monotonic_inc == 1
+
+    property is_monotonic_decreasing:
+
+        def __get__(self):
+            if not self.monotonic_check:
+                self._do_monotonic_check()
+
+            return self.monotonic_dec == 1
+
+    cdef _do_monotonic_check(self):
+        # the order of the keys matches the order of the values only when
+        # every level is sorted and no label is missing
+        if (all(lev.is_monotonic_increasing for lev in self.levels) and
+                not any((lab == -1).any() for lab in self.labels)):
+            self.monotonic_inc = self.base.is_monotonic_increasing
+            self.monotonic_dec = self.base.is_monotonic_decreasing
+        else:
+            try:
+                self.monotonic_inc, self.monotonic_dec, _ = \
+                    algos.is_monotonic_object(self.vgetter(), timelike=False)
+            except TypeError:
+                self.monotonic_inc = 0
+                self.monotonic_dec = 0
+        self.monotonic_check = 1
+
+    def clear_mapping(self):
+        self.base.clear_mapping()
+        self.keys = None
+
+    property is_mapping_populated:
+
+        def __get__(self):
+            return self.base.is_mapping_populated
+
+    def sizeof(self):
+        """
+        return the number of bytes allocated by the packed keys and the hash
+        table
+        """
+        nbytes = self.base.sizeof()
+        if self.keys is not None:
+            nbytes += self.keys.nbytes
+        return nbytes
+
+
 cpdef convert_scalar(ndarray arr, object value):
     if arr.descr.type_num == NPY_DATETIME:
         if isinstance(value,np.ndarray):
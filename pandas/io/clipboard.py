@@ -15,9 +15,14 @@ def read_clipboard(**kwargs):  # pragma: no cover
     parsed : DataFrame
     """
     from pandas.util.clipboard import clipboard_get
-    from pandas.io.parsers import read_table
+    from pandas.io.parsers import read_table, _where_scope
     text = clipboard_get()
 
+    # '@' variables of a where expression refer to our caller's scope
+    kwargs['where_locals'] = _where_scope(kwargs.get('where'),
+                                          kwargs.get('where_locals'),
+                                          scope_level=1)
+
     # try to decode (if needed on PY3)
     # Strange. linux py33 doesn't complain, win py33 does
     if compat.PY3:
@@ -17,6 +17,7 @@ if compat.PY3:
                               urlencode, urljoin)
     from urllib.error import URLError
     from http.client import HTTPException
+    import queue
 else:
     from urllib2 import urlopen as _urlopen
     from urllib import urlencode, pathname2url
@@ -24,6 +25,7 @@ else:
     from urlparse import uses_relative, uses_netloc, uses_params, urljoin
     from urllib2 import URLError
     from httplib import HTTPException
+    import Queue as queue
     from contextlib import contextmanager, closing
     from functools import wraps
 
@@ -165,3 +167,151 @@ if sys.version_info[1] <= 6:
             yield zf
 else:
     ZipFile = zipfile.ZipFile
+
+
+def _import_lzma():
+    try:
+        import lzma
+    except ImportError:
+        try:
+            from backports import lzma
+        except ImportError:
+            raise ImportError("the lzma module (or backports.lzma on "
+                              "Python 2) is required for xz compression")
+    return lzma
+
+
+def open_compressed(source, compression):
+    """
+    Open a file path or binary buffer for reading with on-the-fly
+    decompression
+
+    Parameters
+    ----------
+    source : a file path or a binary file-like object
+    compression : {'gzip', 'bz2', 'xz', 'zip'}
+
+    Returns
+    -------
+    a binary file-like object returning the decompressed data
+    """
+    is_path = isinstance(source, compat.string_types + (bytes,))
+
+    if compression == 'gzip':
+        import gzip
+        if is_path:
+            return gzip.GzipFile(source, 'rb')
+        return gzip.GzipFile(fileobj=source)
+    elif compression == 'bz2':
+        import bz2
+        if is_path:
+            return bz2.BZ2File(source, 'rb')
+        if not compat.PY3:
+            raise ValueError('Python cannot read bz2 from open file handle')
+        return bz2.BZ2File(source)
+    elif compression == 'xz':
+        lzma = _import_lzma()
+        if is_path:
+            return lzma.LZMAFile(source, 'rb')
+        return lzma.LZMAFile(source)
+    elif compression == 'zip':
+        zf = zipfile.ZipFile(source)
+        names = zf.namelist()
+        if len(names) != 1:
+            raise ValueError('a ZIP file must contain exactly one file to be '
+                             'read, found %d' % len(names))
+        return zf.open(names[0])
+    else:
+        raise ValueError('Unrecognized compression type: %s' % compression)
+
+
+def _read_ahead(f, blocks, stop, chunksize):
+    # runs in the read-ahead thread; it doesn't reference the
+    # ReadAheadReader so an abandoned reader can still be collected
+    while not stop.is_set():
+        try:
+            data = f.read(chunksize)
+        except Exception:
+            data = sys.exc_info()[1]
+
+        while not stop.is_set():
+            try:
+                blocks.put(data, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+
+        if not data or isinstance(data, Exception):
+            break
+
+
+class ReadAheadReader(object):
+    """
+    Wrap a binary file-like object so that it is read, and decompressed,
+    ahead of time by a background thread
+
+    Up to ``nbuffers`` blocks of ``chunksize`` bytes are held ready. Reading
+    and decompressing release the GIL, so the parser consuming the blocks
+    runs concurrently.
+
+    Parameters
+    ----------
+    f : binary file-like object
+    chunksize : int, default 262144
+        Number of bytes requested from ``f`` at a time
+    nbuffers : int, default 4
+        Number of blocks read ahead
+    """
+
+    def __init__(self, f, chunksize=262144, nbuffers=4):
+        import threading
+
+        self.f = f
+        self._queue = queue.Queue(nbuffers)
+        self._stop = threading.Event()
+        self._block = b''
+        self._pos = 0
+        self._eof = False
+
+        self._thread = threading.Thread(target=_read_ahead,
+                                        args=(f, self._queue, self._stop,
+                                              chunksize))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _next_block(self):
+        data = self._queue.get()
+        if isinstance(data, Exception):
+            self._eof = True
+            raise data
+        if not data:
+            self._eof = True
+        self._block = data
+        self._pos = 0
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            pieces = [self._block[self._pos:]]
+            while not self._eof:
+                self._next_block()
+                pieces.append(self._block)
+            self._block = b''
+            self._pos = 0
+            return b''.join(pieces)
+
+        if self._pos == len(self._block):
+            if self._eof:
+                return b''
+            self._next_block()
+
+        data = self._block[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.f.close()
+
+    def __del__(self):
+        self._stop.set()
@@ -6,10 +6,12 @@ from collections import defaultdict
 import numpy as np
 
 import pandas.json as _json
+import pandas.lib as lib
 from pandas.tslib import iNaT
-from pandas.compat import long, u
+from pandas.compat import long, u, StringIO
 from pandas import compat, isnull
 from pandas import Series, DataFrame, to_datetime
+from pandas.core.index import RangeIndex
 from pandas.io.common import get_filepath_or_buffer
 import pandas.core.common as com
 
@@ -20,34 +22,38 @@ dumps = _json.dumps
 
 def to_json(path_or_buf, obj, orient=None, date_format='epoch',
             double_precision=10, force_ascii=True, date_unit='ms',
-            default_handler=None):
+            default_handler=None, lines=False, chunksize=None):
 
     if isinstance(obj, Series):
-        s = SeriesWriter(
-            obj, orient=orient, date_format=date_format,
-            double_precision=double_precision, ensure_ascii=force_ascii,
-            date_unit=date_unit, default_handler=default_handler).write()
+        klass = SeriesWriter
     elif isinstance(obj, DataFrame):
-        s = FrameWriter(
-            obj, orient=orient, date_format=date_format,
-            double_precision=double_precision, ensure_ascii=force_ascii,
-            date_unit=date_unit, default_handler=default_handler).write()
+        klass = FrameWriter
     else:
         raise NotImplementedError
 
+    writer = klass(
+        obj, orient=orient, date_format=date_format,
+        double_precision=double_precision, ensure_ascii=force_ascii,
+        date_unit=date_unit, default_handler=default_handler, lines=lines,
+        chunksize=chunksize)
+
     if isinstance(path_or_buf, compat.string_types):
         with open(path_or_buf, 'w') as fh:
-            fh.write(s)
+            writer.write_to(fh)
     elif path_or_buf is None:
-        return s
+        return writer.write()
     else:
-        path_or_buf.write(s)
+        writer.write_to(path_or_buf)
 
 
 class Writer(object):
 
+    # orients which can be written in chunks of rows
+    _chunked_orients = ('records', 'split', 'values')
+
     def __init__(self, obj, orient, date_format, double_precision,
-                 ensure_ascii, date_unit, default_handler=None):
+                 ensure_ascii, date_unit, default_handler=None, lines=False,
+                 chunksize=None):
         self.obj = obj
 
         if orient is None:
@@ -60,22 +66,97 @@ class Writer(object):
         self.date_unit = date_unit
         self.default_handler = default_handler
 
+        if lines and orient != 'records':
+            raise ValueError("'lines' keyword only valid when 'orient' is "
+                             "records")
+        self.lines = lines
+
+        if chunksize is not None:
+            if not com.is_integer(chunksize) or chunksize < 1:
+                raise ValueError("chunksize must be a positive integer")
+            if orient not in self._chunked_orients:
+                raise ValueError("chunksize is only supported for orient "
+                                 "'records', 'split' or 'values', not "
+                                 "'%s'" % orient)
+        self.chunksize = chunksize
+
         self.is_copy = None
         self._format_axes()
 
     def _format_axes(self):
         raise NotImplementedError
 
-    def write(self):
+    def _dumps(self, obj, orient=None):
         return dumps(
-            self.obj,
-            orient=self.orient,
+            obj,
+            orient=orient or self.orient,
             double_precision=self.double_precision,
             ensure_ascii=self.ensure_ascii,
             date_unit=self.date_unit,
             iso_dates=self.date_format == 'iso',
             default_handler=self.default_handler)
 
+    def write(self):
+        return ''.join(self.iter_write())
+
+    def write_to(self, fh):
+        """ write the JSON to the file handle fh, one piece at a time """
+        for s in self.iter_write():
+            fh.write(s)
+
+    def iter_write(self):
+        """
+        Generate the JSON in pieces, the rows are encoded chunksize at a time
+        so that only the JSON of one chunk is held in memory
+        """
+        if self.chunksize is None:
+            s = self._dumps(self.obj)
+            if self.lines:
+                s = lib.convert_json_to_lines(s)
+            yield s
+            return
+
+        if self.orient == 'split':
+            yield '{%s,"index":[' % self._split_header()
+            for s in self._iter_chunks(self._index_chunk, 'values'):
+                yield s
+            yield '],"data":['
+            for s in self._iter_chunks(self._values_chunk, 'values'):
+                yield s
+            yield ']}'
+        elif self.lines:
+            for s in self._iter_chunks(self._values_chunk, 'records'):
+                yield s
+        else:
+            yield '['
+            for s in self._iter_chunks(self._values_chunk, self.orient):
+                yield s
+            yield ']'
+
+    def _iter_chunks(self, get_chunk, orient):
+        # encode the chunks as arrays and join their elements
+        nrows = len(self.obj)
+        first = True
+        for start in range(0, nrows, self.chunksize):
+            chunk = get_chunk(slice(start, start + self.chunksize))
+            s = self._dumps(chunk, orient=orient)
+            if self.lines:
+                yield lib.convert_json_to_lines(s)
+                continue
+            s = s[1:-1]
+            if not s:
+                continue
+            if not first:
+                yield ','
+            first = False
+            yield s
+
+    def _index_chunk(self, slicer):
+        return self.obj.index[slicer]
+
+    def _values_chunk(self, slicer):
+        return self.obj.iloc[slicer]
+
 
 class SeriesWriter(Writer):
     _default_orient = 'index'
@@ -85,6 +166,9 @@ class SeriesWriter(Writer):
             raise ValueError("Series index must be unique for orient="
                              "'%s'" % self.orient)
 
+    def _split_header(self):
+        return '"name":%s' % self._dumps(self.obj.name, orient='values')
+
 
 class FrameWriter(Writer):
     _default_orient = 'columns'
@@ -100,10 +184,14 @@ class FrameWriter(Writer):
             raise ValueError("DataFrame columns must be unique for orient="
                              "'%s'." % self.orient)
 
+    def _split_header(self):
+        return '"columns":%s' % self._dumps(self.obj.columns, orient='values')
+
 
 def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
               convert_axes=True, convert_dates=True, keep_default_dates=True,
-              numpy=False, precise_float=False, date_unit=None):
+              numpy=False, precise_float=False, date_unit=None, lines=False,
+              chunksize=None):
     """
     Convert a JSON string to pandas object
 
@@ -165,12 +253,33 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
         is to try and detect the correct precision, but if this is not desired
         then pass one of 's', 'ms', 'us' or 'ns' to force parsing only seconds,
         milliseconds, microseconds or nanoseconds respectively.
+    lines : boolean, default False
+        Read the file as a json object per line, as written by
+        ``to_json(orient='records', lines=True)``. Implies orient 'records'.
+    chunksize : int, default None
+        With ``lines=True``, return a JsonReader iterating over the file
+        ``chunksize`` lines at a time, each chunk parsed into a DataFrame
+        (or Series).
 
     Returns
     -------
-    result : Series or DataFrame
+    result : Series or DataFrame, or JsonReader if chunksize is given
     """
 
+    if lines:
+        if orient not in (None, 'records'):
+            raise ValueError("'lines' keyword only valid when 'orient' is "
+                             "records")
+        orient = 'records'
+    elif chunksize is not None:
+        raise ValueError("chunksize can only be passed if lines=True")
+
+    parser_kwds = dict(orient=orient, typ=typ, dtype=dtype,
+                       convert_axes=convert_axes, convert_dates=convert_dates,
+                       keep_default_dates=keep_default_dates, numpy=numpy,
+                       precise_float=precise_float, date_unit=date_unit,
+                       lines=lines)
+
     filepath_or_buffer, _ = get_filepath_or_buffer(path_or_buf)
     if isinstance(filepath_or_buffer, compat.string_types):
         try:
@@ -182,31 +291,134 @@ def read_json(path_or_buf=None, orient=None, typ='frame', dtype=True,
             exists = False
 
         if exists:
+            if chunksize is not None:
+                return JsonReader(open(filepath_or_buffer, 'r'), chunksize,
+                                  close=True, **parser_kwds)
             with open(filepath_or_buffer, 'r') as fh:
                 json = fh.read()
         else:
             json = filepath_or_buffer
     elif hasattr(filepath_or_buffer, 'read'):
+        if chunksize is not None:
+            return JsonReader(filepath_or_buffer, chunksize, **parser_kwds)
         json = filepath_or_buffer.read()
     else:
         json = filepath_or_buffer
 
+    if chunksize is not None:
+        return JsonReader(StringIO(json), chunksize, **parser_kwds)
+
+    if lines:
+        json = _lines_to_json(json.split('\n'))
+
+    return _parse_json(json, **parser_kwds)
+
+
+def _parse_json(json, orient, typ, dtype, convert_axes, convert_dates,
+                keep_default_dates, numpy, precise_float, date_unit,
+                lines=False):
     obj = None
     if typ == 'frame':
         obj = FrameParser(json, orient, dtype, convert_axes, convert_dates,
                           keep_default_dates, numpy, precise_float,
-                          date_unit).parse()
+                          date_unit, lines=lines).parse()
 
     if typ == 'series' or obj is None:
         if not isinstance(dtype, bool):
             dtype = dict(data=dtype)
         obj = SeriesParser(json, orient, dtype, convert_axes, convert_dates,
                            keep_default_dates, numpy, precise_float,
-                           date_unit).parse()
+                           date_unit, lines=lines).parse()
 
     return obj
 
 
+def _lines_to_json(lines):
+    """ join json objects, one per line, into a json array """
+    lines = [line.strip() for line in lines]
+    return '[%s]' % ','.join([line for line in lines if line])
+
+
+def _records_to_frame(records):
+    """
+    build a DataFrame from a list of decoded json objects, scattering the
+    values into typed columns with lib.dicts_to_columns
+    """
+    try:
+        columns, arrays = lib.dicts_to_columns(records)
+    except TypeError:
+        # not all records are objects
+        return DataFrame(records, dtype=None)
+    return DataFrame._from_arrays(arrays, columns,
+                                  com._default_index(len(records)))
+
+
+class JsonReader(object):
+    """
+    Iterate over a file of line delimited json, parsing ``chunksize`` lines
+    at a time. Returned by ``read_json(lines=True, chunksize=...)``. The
+    rows of the chunks are labelled by their position in the file.
+    """
+
+    def __init__(self, f, chunksize, close=False, **kwds):
+        if not com.is_integer(chunksize) or chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+        self.f = f
+        self.chunksize = chunksize
+        self._close = close
+        self.kwds = kwds
+        self._currow = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        result = self.get_chunk()
+        if result is None:
+            self.close()
+            raise StopIteration
+        return result
+
+    next = __next__
+
+    def get_chunk(self, size=None):
+        """
+        Parse the next ``size`` lines (default chunksize), return None at
+        the end of the file
+        """
+        if size is None:
+            size = self.chunksize
+
+        lines = []
+        for line in self.f:
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
+            line = line.strip()
+            if line:
+                lines.append(line)
+                if len(lines) == size:
+                    break
+        if not lines:
+            return None
+
+        obj = _parse_json(_lines_to_json(lines), **self.kwds)
+        obj.index = RangeIndex(self._currow, self._currow + len(obj))
+        self._currow += len(obj)
+        return obj
+
+    def read(self):
+        """ parse the remaining lines in a single object """
+        from pandas.tools.merge import concat
+        chunks = list(self)
+        if not chunks:
+            return _parse_json('[]', **self.kwds)
+        return concat(chunks)
+
+    def close(self):
+        if self._close:
+            self.f.close()
+
+
 class Parser(object):
 
     _STAMP_UNITS = ('s', 'ms', 'us', 'ns')
@@ -218,7 +430,7 @@ class Parser(object):
 
     def __init__(self, json, orient, dtype=True, convert_axes=True,
                  convert_dates=True, keep_default_dates=False, numpy=False,
-                 precise_float=False, date_unit=None):
+                 precise_float=False, date_unit=None, lines=False):
         self.json = json
 
         if orient is None:
@@ -227,8 +439,9 @@ class Parser(object):
         self.orient = orient
         self.dtype = dtype
 
-        if orient == "split":
+        if orient == "split" or lines:
             numpy = False
+        self.lines = lines
 
         if date_unit is not None:
             date_unit = date_unit.lower()
@@ -491,6 +704,9 @@ class FrameParser(Parser):
         elif orient == "index":
             self.obj = DataFrame(
                 loads(json, precise_float=self.precise_float), dtype=None).T
+        elif self.lines:
+            self.obj = _records_to_frame(
+                loads(json, precise_float=self.precise_float))
         else:
             self.obj = DataFrame(
                 loads(json, precise_float=self.precise_float), dtype=None)
@@ -41,6 +41,8 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import os
+import mmap
+import struct
 from datetime import datetime, date, timedelta
 from dateutil.parser import parse
 
@@ -49,13 +51,14 @@ from pandas import compat
 from pandas.compat import u, PY3
 from pandas import (
     Timestamp, Period, Series, DataFrame, Panel, Panel4D,
-    Index, MultiIndex, Int64Index, PeriodIndex, DatetimeIndex, Float64Index,
+    Index, MultiIndex, Int64Index, RangeIndex, PeriodIndex, DatetimeIndex,
+    Float64Index,
     NaT
 )
 from pandas.sparse.api import SparseSeries, SparseDataFrame, SparsePanel
 from pandas.sparse.array import BlockIndex, IntIndex
 from pandas.core.generic import NDFrame
-from pandas.core.common import needs_i8_conversion
+from pandas.core.common import needs_i8_conversion, is_integer
 from pandas.io.common import get_filepath_or_buffer
 from pandas.core.internals import BlockManager, make_block
 import pandas.core.internals as internals
@@ -90,20 +93,38 @@ def to_msgpack(path_or_buf, *args, **kwargs):
              (default is False)
     compress : type of compressor (zlib or blosc), default to None (no
                compression)
+    container : boolean, write a msgpack container, with an index of the
+                objects (default is False), see ``MsgpackContainer``
+    chunksize : int, with container, write Series and DataFrames in chunks
+                of this many rows, that can be read individually
+                (default is None, one chunk)
     """
     global compressor
     compressor = kwargs.pop('compress', None)
     append = kwargs.pop('append', None)
+    container = kwargs.pop('container', False)
+    chunksize = kwargs.pop('chunksize', None)
+    if chunksize is not None and not container:
+        raise ValueError("chunksize is only supported with container=True")
     if append:
         mode = 'a+b'
     else:
         mode = 'wb'
 
     def writer(fh):
-        for a in args:
-            fh.write(pack(a, **kwargs))
+        if container:
+            w = _ContainerWriter(fh, append=append)
+            for a in args:
+                w.write(a, chunksize=chunksize, **kwargs)
+            w.close()
+        else:
+            for a in args:
+                fh.write(pack(a, **kwargs))
 
     if isinstance(path_or_buf, compat.string_types):
+        if container and append and os.path.exists(path_or_buf):
+            # the index is rewritten after the new objects
+            mode = 'r+b'
         with open(path_or_buf, mode) as fh:
             writer(fh)
     elif path_or_buf is None:
@@ -127,6 +148,9 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
     path_or_buf : string File path, BytesIO like or string
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
+    memory_map : boolean, for a msgpack container file, memory map the file,
+                 the uncompressed arrays read are views of the map
+                 (default is True)
 
     Returns
     -------
@@ -134,6 +158,19 @@ def read_msgpack(path_or_buf, iterator=False, **kwargs):
 
     """
     path_or_buf, _ = get_filepath_or_buffer(path_or_buf)
+    memory_map = kwargs.pop('memory_map', True)
+    if _is_container(path_or_buf):
+        store = MsgpackContainer(path_or_buf, memory_map=memory_map)
+        if iterator:
+            return _iter_container(store)
+        try:
+            l = list(store)
+        finally:
+            store.close()
+        if len(l) == 1:
+            return l[0]
+        return l
+
     if iterator:
         return Iterator(path_or_buf)
 
@@ -239,6 +276,13 @@ def unconvert(values, dtype, compress=None):
     if dtype == np.object_:
         return np.array(values, dtype=object)
 
+    if isinstance(values, np.ndarray):
+
+        # the bytes of a msgpack container buffer, return a view
+        if compress is None:
+            return values.view(dtype)
+        values = values.tostring()
+
     if compress == 'zlib':
 
         values = zlib.decompress(values)
@@ -286,6 +330,13 @@ def encode(obj):
                     'data': convert(obj.asi8),
                     'freq': getattr(obj, 'freqstr', None),
                     'tz': tz}
+        elif isinstance(obj, RangeIndex):
+            return {'typ': 'range_index',
+                    'klass': obj.__class__.__name__,
+                    'name': getattr(obj, 'name', None),
+                    'start': obj._start,
+                    'stop': obj._stop,
+                    'step': obj._step}
         elif isinstance(obj, MultiIndex):
             return {'typ': 'multi_index',
                     'klass': obj.__class__.__name__,
@@ -451,6 +502,9 @@ def decode(obj):
         data = unconvert(obj['data'], np.typeDict[obj['dtype']],
                          obj.get('compress'))
         return globals()[obj['klass']](data, dtype=dtype, name=obj['name'])
+    elif typ == 'range_index':
+        return globals()[obj['klass']](obj['start'], obj['stop'], obj['step'],
+                                       name=obj['name'])
     elif typ == 'multi_index':
         data = unconvert(obj['data'], np.typeDict[obj['dtype']],
                          obj.get('compress'))
@@ -640,3 +694,296 @@ class Iterator(object):
         finally:
             if needs_closing:
                 fh.close()
+
+
+#------------------------------------------------------------------------------
+# msgpack containers
+#
+# a container starts with the magic, followed by a segment per chunk of an
+# object: the aligned buffers of the arrays of the chunk, then the msgpack
+# of the chunk, referring to the buffers by offset. The msgpack of the index
+# of the segments, and a trailer of the offset of the index and the magic
+# end the container. All offsets are from the start of the container.
+
+_CONTAINER_MAGIC = b'PDMSGPK\x01'
+_CONTAINER_TRAILER = struct.Struct('<Q8s')
+_CONTAINER_ALIGN = 64
+
+# the encoded types with their array bytes under 'data'
+_BUFFER_TYPES = ['index', 'multi_index', 'period_index', 'datetime_index',
+                 'series', 'ndarray']
+
+
+def _is_container(path_or_buf):
+    """ does path_or_buf hold a msgpack container """
+    n = len(_CONTAINER_MAGIC)
+    if isinstance(path_or_buf, compat.string_types):
+        try:
+            exists = os.path.exists(path_or_buf)
+        except (TypeError, ValueError):
+            exists = False
+        if exists:
+            with open(path_or_buf, 'rb') as fh:
+                return fh.read(n) == _CONTAINER_MAGIC
+    if isinstance(path_or_buf, bytes):
+        return path_or_buf[:n] == _CONTAINER_MAGIC
+    if hasattr(path_or_buf, 'read') and hasattr(path_or_buf, 'seek'):
+        pos = path_or_buf.tell()
+        try:
+            return path_or_buf.read(n) == _CONTAINER_MAGIC
+        finally:
+            path_or_buf.seek(pos)
+    return False
+
+
+def _iter_container(store):
+    """ iterate over the objects of the container, close it on completion """
+    try:
+        for o in store:
+            yield o
+    finally:
+        store.close()
+
+
+def _read_container_index(fh):
+    """ the object entries and the offset of the index of the container
+    in the file-like fh """
+    n = _CONTAINER_TRAILER.size
+    fh.seek(0, 2)
+    end = fh.tell()
+    fh.seek(0)
+    if end < len(_CONTAINER_MAGIC) + n or \
+            fh.read(len(_CONTAINER_MAGIC)) != _CONTAINER_MAGIC:
+        raise ValueError("not a msgpack container")
+
+    fh.seek(end - n)
+    offset, magic = _CONTAINER_TRAILER.unpack(fh.read(n))
+    if magic != _CONTAINER_MAGIC:
+        raise ValueError("the msgpack container is incomplete")
+
+    fh.seek(offset)
+    packed = fh.read(end - n - offset)
+    index = next(iter(unpack(compat.BytesIO(packed), object_hook=None,
+                             use_list=True)))
+    return index['objects'], offset
+
+
+class _ContainerWriter(object):
+
+    """ write the objects of a msgpack container to fh """
+
+    def __init__(self, fh, append=False):
+        self.fh = fh
+        self.objects = []
+        self.pos = 0
+
+        if append:
+            fh.seek(0, 2)
+            if fh.tell() > 0:
+                self.objects, self.pos = _read_container_index(fh)
+                fh.seek(self.pos)
+                fh.truncate()
+                return
+        self._write(_CONTAINER_MAGIC)
+
+    def _write(self, b):
+        self.fh.write(b)
+        self.pos += len(b)
+
+    def _align(self, pos):
+        return pos + (-pos % _CONTAINER_ALIGN)
+
+    def write(self, obj, chunksize=None, **kwargs):
+        if chunksize is not None and isinstance(obj, (Series, DataFrame)):
+            if chunksize <= 0:
+                raise ValueError("chunksize must be a positive integer")
+            pieces = [obj.iloc[i:i + chunksize]
+                      for i in range(0, len(obj), chunksize)] or [obj]
+        else:
+            pieces = [obj]
+
+        chunks = [self._write_segment(piece, **kwargs) for piece in pieces]
+        self.objects.append({'klass': obj.__class__.__name__,
+                             'chunks': chunks})
+
+    def _write_segment(self, obj, **kwargs):
+        start = self._align(self.pos)
+        buffers = []
+
+        def buffer_ref(values):
+            # object arrays are encoded as lists, and stay in the msgpack
+            if not isinstance(values, bytes):
+                return values
+            if buffers:
+                offset, b = buffers[-1]
+                offset = self._align(offset + len(b))
+            else:
+                offset = start
+            buffers.append((offset, values))
+            return {'typ': 'buffer', 'offset': offset, 'nbytes': len(values)}
+
+        def default(o):
+            obj = encode(o)
+            if isinstance(obj, dict):
+                typ = obj.get('typ')
+                if typ == 'block_manager':
+                    for b in obj['blocks']:
+                        b['values'] = buffer_ref(b['values'])
+                elif typ in _BUFFER_TYPES:
+                    obj['data'] = buffer_ref(obj['data'])
+            return obj
+
+        packed = pack(obj, default=default, **kwargs)
+
+        for offset, b in buffers:
+            self._write(b'\x00' * (offset - self.pos))
+            self._write(b)
+        self._write(b'\x00' * (self._align(self.pos) - self.pos))
+
+        nrows = len(obj) if isinstance(obj, (Series, DataFrame)) else None
+        header = self.pos
+        self._write(packed)
+        return [header, len(packed), nrows]
+
+    def close(self):
+        """ write the index and the trailer """
+        offset = self.pos
+        self._write(pack({'version': 1, 'objects': self.objects}))
+        self._write(_CONTAINER_TRAILER.pack(offset, _CONTAINER_MAGIC))
+
+
+class MsgpackContainer(object):
+
+    """
+    Random access to the objects of a msgpack container, written by
+    ``to_msgpack(..., container=True)``. An object, or a chunk of the rows
+    of an object, is read from the index of the container without reading
+    the others. The uncompressed arrays of the objects read are views of the
+    memory mapped file, or of the bytes passed.
+
+    Parameters
+    ----------
+    path_or_buf : string File path, BytesIO like or bytes
+    memory_map : boolean, memory map a file path (default is True); the
+                 mapping is copy-on-write, so the arrays read are writable
+                 without changing the file
+
+    Examples
+    --------
+    >>> df.to_msgpack('foo.msg', container=True, chunksize=10000)
+    >>> with MsgpackContainer('foo.msg') as store:
+    ...     first = store.read(0, chunk=0)
+    """
+
+    def __init__(self, path_or_buf, memory_map=True):
+        self._fh = None
+        if isinstance(path_or_buf, bytes) and not _is_path(path_or_buf):
+            self.buf = path_or_buf
+        elif isinstance(path_or_buf, compat.string_types):
+            self._fh = open(path_or_buf, 'rb')
+            if memory_map:
+                self.buf = mmap.mmap(self._fh.fileno(), 0,
+                                     access=mmap.ACCESS_COPY)
+            else:
+                self.buf = self._fh.read()
+        else:
+            self.buf = path_or_buf.read()
+
+        self.objects, _ = _read_container_index(self._file_like())
+
+    def _file_like(self):
+        if isinstance(self.buf, mmap.mmap):
+            return self.buf
+        return compat.BytesIO(self.buf)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.read(i)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """ close the file; the arrays read keep the memory map alive """
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        self.buf = None
+
+    def _check_index(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError("the container has %d objects" % len(self))
+        return self.objects[i]
+
+    def nchunks(self, i=0):
+        """ the number of chunks of object i """
+        return len(self._check_index(i)['chunks'])
+
+    def nrows(self, i=0):
+        """ the number of rows of object i, None if not a Series or
+        DataFrame """
+        chunks = self._check_index(i)['chunks']
+        if chunks[0][2] is None:
+            return None
+        return sum(c[2] for c in chunks)
+
+    def _read_chunk(self, header, length, nrows):
+        buf = self.buf
+        if buf is None:
+            raise ValueError("the container is closed")
+
+        def hook(obj):
+            if obj.get('typ') == 'buffer':
+                if not obj['nbytes']:
+                    return np.empty(0, dtype=np.uint8)
+                return np.frombuffer(buf, dtype=np.uint8,
+                                     count=obj['nbytes'],
+                                     offset=obj['offset'])
+            return decode(obj)
+
+        packed = buf[header:header + length]
+        return next(iter(unpack(compat.BytesIO(packed), object_hook=hook)))
+
+    def read(self, i=0, chunk=None):
+        """
+        Read object i of the container
+
+        Parameters
+        ----------
+        i : int, the position of the object (default is 0)
+        chunk : int or list of ints, the chunk or chunks of the rows to read
+                (default is None, all)
+        """
+        chunks = self._check_index(i)['chunks']
+        if chunk is None:
+            selected = chunks
+        elif is_integer(chunk):
+            return self._read_chunk(*chunks[chunk])
+        else:
+            selected = [chunks[c] for c in chunk]
+
+        pieces = [self._read_chunk(*c) for c in selected]
+        if len(pieces) == 1:
+            return pieces[0]
+
+        from pandas.tools.merge import concat
+        return concat(pieces)
+
+    def iter_chunks(self, i=0):
+        """ iterate over the chunks of the rows of object i """
+        for c in self._check_index(i)['chunks']:
+            yield self._read_chunk(*c)
+
+
+def _is_path(b):
+    """ is the bytes b an existing file path """
+    try:
+        return os.path.exists(b)
+    except (TypeError, ValueError):
+        return False
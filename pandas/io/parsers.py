@@ -6,17 +6,18 @@ from pandas.compat import range, lrange, StringIO, lzip, zip, string_types, map
 from pandas import compat
 import re
 import csv
+import codecs
 import warnings
 
 import numpy as np
 
-from pandas.core.index import Index, MultiIndex
+from pandas.core.index import Index, MultiIndex, RangeIndex
 from pandas.core.frame import DataFrame
 import datetime
 import pandas.core.common as com
 from pandas.core.config import get_option
 from pandas.io.date_converters import generic_parser
-from pandas.io.common import get_filepath_or_buffer
+from pandas.io.common import get_filepath_or_buffer, open_compressed
 from pandas.tseries import tools
 
 from pandas.util.decorators import Appender
@@ -53,10 +54,14 @@ skipinitialspace : boolean, default False
 escapechar : string (length 1), default None
     One-character string used to escape delimiter when quoting is QUOTE_NONE.
 dtype : Type name or dict of column -> type
-    Data type for data or columns. E.g. {'a': np.float64, 'b': np.int32}
+    Data type for data or columns. E.g. {'a': np.float64, 'b': np.int32}.
+    Use 'category' to read columns directly as Categoricals
     (Unsupported with engine='python')
-compression : {'gzip', 'bz2', None}, default None
-    For on-the-fly decompression of on-disk data
+compression : {'gzip', 'bz2', 'xz', 'zip', None}, default None
+    For on-the-fly decompression of on-disk data. A zip file must contain
+    exactly one file. The C engine decompresses in a background thread,
+    overlapping it with parsing. 'xz' needs the lzma module (backports.lzma
+    on Python 2)
 dialect : string or csv.Dialect instance, default None
     If None defaults to Excel dialect. Ignored if sep longer than 1 char
     See csv.Dialect documentation for more details
@@ -105,6 +110,12 @@ date_parser : function
     Function to use for converting a sequence of string columns to an
     array of datetime instances. The default uses dateutil.parser.parser
     to do the conversion.
+date_format : string, default None
+    strftime format used to parse the columns in ``parse_dates``, e.g.
+    ``'%d/%m/%Y %H:%M'``. The C engine converts single ISO 8601 date
+    columns, and formats using only the ``%Y``, ``%m``, ``%d``, ``%H``,
+    ``%M``, ``%S`` and ``%f`` directives, while tokenizing, without
+    creating intermediate string objects
 dayfirst : boolean, default False
     DD/MM format dates, international and European format
 thousands : str, default None
@@ -165,6 +176,36 @@ infer_datetime_format : boolean, default False
     the datetime format to speed up the processing
 skip_blank_lines : boolean, default True
     If True, skip over blank lines rather than interpreting as NaN values
+where : string or callable, default None
+    Only keep the rows matching this predicate. Either a boolean expression
+    of the column names as accepted by ``DataFrame.query`` (local variables
+    can be referenced with ``@``), or a function taking a DataFrame and
+    returning a boolean mask. The file is parsed in pieces and rows failing
+    the predicate are discarded from each piece, so only the selected rows
+    are held in memory. ``nrows`` and ``chunksize`` count the rows read from
+    the file, before filtering
+where_locals : dict, default None
+    Variables referenced with ``@`` in a ``where`` expression. By default
+    they are looked up in the scope the function is called from, functions
+    wrapping ``read_csv`` should pass their caller's variables
+threads : int, default 1
+    Number of threads used to convert the tokenized columns to their
+    dtypes. Only the conversion runs in parallel, a file is still tokenized
+    by a single thread. Tokenizing and numeric conversion release the GIL,
+    so separate files can also be parsed concurrently from several threads.
+    The threads are kept until the input is exhausted or the reader is
+    closed. (Only valid with C parser)
+infer_schema_rows : int, default None
+    Infer the column dtypes from the first ``infer_schema_rows`` rows and
+    convert the rest of the file, including every chunk read with
+    ``low_memory`` or ``chunksize``, to those dtypes instead of inferring
+    them again for each chunk. Columns with a ``dtype``, a converter or
+    ``parse_dates``, and columns that are all missing in the sample, are not
+    locked. (Only valid with C parser)
+infer_schema_errors : {'raise', 'infer'}, default 'raise'
+    What to do when a chunk does not fit a dtype locked by
+    ``infer_schema_rows``: raise a ValueError, or infer the dtype of the
+    chunk as usual. (Only valid with C parser)
 
 Returns
 -------
@@ -218,9 +259,25 @@ fields if it is not spaces (e.g., '~').
 """ % (_parser_params % _fwf_widths)
 
 
+def _where_scope(where, where_locals, scope_level):
+    """
+    capture the variables a ``where`` expression can reference with '@', from
+    the frame ``scope_level`` levels above the caller, as DataFrame.query does
+
+    the expression is evaluated once per piece of the file, so the scope is
+    only captured once, when the reader is created
+    """
+    if not isinstance(where, compat.string_types):
+        return None
+
+    from pandas.computation.scope import Scope
+    return Scope(scope_level + 1, local_dict=where_locals).scope
+
+
 def _read(filepath_or_buffer, kwds):
     "Generic reader of line files."
     encoding = kwds.get('encoding', None)
+
     skipfooter = kwds.pop('skipfooter', None)
     if skipfooter is not None:
         kwds['skip_footer'] = skipfooter
@@ -243,12 +300,13 @@ def _read(filepath_or_buffer, kwds):
     if (nrows is not None) and (chunksize is not None):
         raise NotImplementedError("'nrows' and 'chunksize' can not be used"
                                   " together yet.")
-    elif nrows is not None:
-        return parser.read(nrows)
-    elif chunksize or iterator:
+    elif nrows is None and (chunksize or iterator):
         return parser
 
-    return parser.read()
+    try:
+        return parser.read(nrows)
+    finally:
+        parser.close()
 
 _parser_defaults = {
     'delimiter': None,
@@ -280,6 +338,7 @@ _parser_defaults = {
     'keep_date_col': False,
     'dayfirst': False,
     'date_parser': None,
+    'date_format': None,
 
     'usecols': None,
 
@@ -293,7 +352,8 @@ _parser_defaults = {
     'mangle_dupe_cols': True,
     'tupleize_cols': False,
     'infer_datetime_format': False,
-    'skip_blank_lines': True
+    'skip_blank_lines': True,
+    'where': None
 }
 
 
@@ -310,7 +370,10 @@ _c_parser_defaults = {
     'warn_bad_lines': True,
     'dtype': None,
     'decimal': b'.',
-    'float_precision': None
+    'float_precision': None,
+    'threads': 1,
+    'infer_schema_rows': None,
+    'infer_schema_errors': 'raise'
 }
 
 _fwf_defaults = {
@@ -319,6 +382,10 @@ _fwf_defaults = {
 }
 
 _c_unsupported = set(['skip_footer'])
+
+# encodings for which the C parser can count the characters of fixed-width
+# fields
+_c_fwf_encodings = set(['utf-8', 'ascii', 'iso8859-1', 'cp1252'])
 _python_unsupported = set(_c_parser_defaults.keys())
 
 
@@ -374,6 +441,7 @@ def _make_parser_function(name, sep=','):
                  keep_date_col=False,
                  dayfirst=False,
                  date_parser=None,
+                 date_format=None,
 
                  memory_map=False,
                  float_precision=None,
@@ -387,7 +455,12 @@ def _make_parser_function(name, sep=','):
                  mangle_dupe_cols=True,
                  tupleize_cols=False,
                  infer_datetime_format=False,
-                 skip_blank_lines=True):
+                 skip_blank_lines=True,
+                 where=None,
+                 where_locals=None,
+                 threads=1,
+                 infer_schema_rows=None,
+                 infer_schema_errors='raise'):
 
         # Alias sep -> delimiter.
         if delimiter is None:
@@ -434,6 +507,7 @@ def _make_parser_function(name, sep=','):
                     keep_date_col=keep_date_col,
                     dayfirst=dayfirst,
                     date_parser=date_parser,
+                    date_format=date_format,
 
                     nrows=nrows,
                     iterator=iterator,
@@ -460,7 +534,13 @@ def _make_parser_function(name, sep=','):
                     mangle_dupe_cols=mangle_dupe_cols,
                     tupleize_cols=tupleize_cols,
                     infer_datetime_format=infer_datetime_format,
-                    skip_blank_lines=skip_blank_lines)
+                    skip_blank_lines=skip_blank_lines,
+                    where=where,
+                    where_scope=_where_scope(where, where_locals,
+                                             scope_level=1),
+                    threads=threads,
+                    infer_schema_rows=infer_schema_rows,
+                    infer_schema_errors=infer_schema_errors)
 
         return _read(filepath_or_buffer, kwds)
 
@@ -492,10 +572,22 @@ def read_fwf(filepath_or_buffer, colspecs='infer', widths=None, **kwds):
             col += w
 
     kwds['colspecs'] = colspecs
-    kwds['engine'] = 'python-fwf'
+
+    engine = kwds.pop('engine', None)
+    kwds['engine_specified'] = engine is not None
+    if engine in ('python', 'python-fwf'):
+        kwds['engine'] = 'python-fwf'
+    else:
+        kwds['engine'] = 'c-fwf'
+    kwds['where_scope'] = _where_scope(kwds.get('where'),
+                                       kwds.pop('where_locals', None),
+                                       scope_level=1)
     return _read(filepath_or_buffer, kwds)
 
 
+# number of rows parsed at a time when filtering with ``where``
+_WHERE_CHUNKSIZE = 100000
+
 # common NA values
 # no longer excluding inf representations
 # '1.#INF','-1.#INF', '1.#INF000000',
@@ -546,12 +638,26 @@ class TextFileReader(object):
 
         self.chunksize = options.pop('chunksize', None)
         self.squeeze = options.pop('squeeze', False)
+        self.where = options.pop('where', None)
+        self._where_scope = kwds.get('where_scope')
+        self._currow = 0
 
         # might mutate self.engine
         self.options, self.engine = self._clean_options(options, engine)
         if 'has_index_names' in kwds:
             self.options['has_index_names'] = kwds['has_index_names']
 
+        if self.where is not None:
+            if not (isinstance(self.where, compat.string_types) or
+                    callable(self.where)):
+                raise TypeError('where must be a string expression or a '
+                                'callable, input was a {0!r}'
+                                .format(type(self.where).__name__))
+            if self.options.get('as_recarray'):
+                raise ValueError('where is not supported with as_recarray')
+            if self.options.get('skip_footer'):
+                raise ValueError('where is not supported with skip_footer')
+
         self._make_engine(self.engine)
 
     def _get_options_with_defaults(self, engine):
@@ -566,14 +672,14 @@ class TextFileReader(object):
             if argname in kwds:
                 value = kwds[argname]
 
-                if engine != 'c' and value != default:
+                if engine not in ('c', 'c-fwf') and value != default:
                     raise ValueError('The %r option is not supported with the'
                                      ' %r engine' % (argname, engine))
             else:
                 value = default
             options[argname] = value
 
-        if engine == 'python-fwf':
+        if engine in ('python-fwf', 'c-fwf'):
             for argname, default in compat.iteritems(_fwf_defaults):
                 options[argname] = kwds.get(argname, default)
 
@@ -594,6 +700,10 @@ class TextFileReader(object):
                 fallback_reason = "the 'c' engine does not support"\
                                   " skip_footer"
                 engine = 'python'
+        elif engine == 'c-fwf':
+            fallback_reason = self._c_fwf_fallback_reason(options)
+            if fallback_reason:
+                engine = 'python-fwf'
 
         if sep is None and not delim_whitespace:
             if engine == 'c':
@@ -604,7 +714,7 @@ class TextFileReader(object):
             if engine == 'c' and sep == '\s+':
                 result['delim_whitespace'] = True
                 del result['delimiter']
-            elif engine not in ('python', 'python-fwf'):
+            elif engine not in ('python', 'python-fwf', 'c-fwf'):
                 # wait until regex engine integrated
                 fallback_reason = "the 'c' engine does not support"\
                                   " regex separators"
@@ -613,7 +723,7 @@ class TextFileReader(object):
         if fallback_reason and engine_specified:
             raise ValueError(fallback_reason)
 
-        if engine == 'c':
+        if engine in ('c', 'c-fwf'):
             for arg in _c_unsupported:
                 del result[arg]
 
@@ -630,7 +740,8 @@ class TextFileReader(object):
                     raise ValueError(msg)
                 del result[arg]
 
-        if fallback_reason:
+        if fallback_reason and engine != 'python-fwf':
+            # read_fwf picks its engine silently
             warnings.warn(("Falling back to the 'python' engine because"
                            " {0}; you can avoid this warning by specifying"
                            " engine='python'.").format(fallback_reason),
@@ -677,6 +788,35 @@ class TextFileReader(object):
 
         return result, engine
 
+    def _c_fwf_fallback_reason(self, options):
+        if options['skip_footer'] > 0:
+            return "the 'c' engine does not support skip_footer"
+
+        encoding = options['encoding']
+        if (encoding is not None and
+                codecs.lookup(encoding).name not in _c_fwf_encodings):
+            return ("the 'c' engine does not support fixed-width fields"
+                    " with the %r encoding" % encoding)
+
+        colspecs = options['colspecs']
+        if colspecs == 'infer':
+            seekable = (hasattr(self.f, 'tell') and hasattr(self.f, 'seek'))
+            if not (isinstance(self.f, compat.string_types) or seekable):
+                return ("the 'c' engine cannot infer the column"
+                        " specifications of a non-seekable buffer")
+            if options['compression'] is not None:
+                return ("the 'c' engine cannot infer the column"
+                        " specifications of compressed data")
+        elif isinstance(colspecs, (tuple, list)):
+            for colspec in colspecs:
+                if (isinstance(colspec, (tuple, list)) and
+                        any(x is not None and com.is_integer(x) and x < 0
+                            for x in colspec)):
+                    return ("the 'c' engine does not support negative"
+                            " column specifications")
+
+        return None
+
     def __iter__(self):
         try:
             if self.chunksize:
@@ -690,6 +830,17 @@ class TextFileReader(object):
     def _make_engine(self, engine='c'):
         if engine == 'c':
             self._engine = CParserWrapper(self.f, **self.options)
+        elif engine == 'c-fwf':
+            colspecs = self.options['colspecs']
+            if colspecs == 'infer':
+                delimiter = self.options['delimiter']
+                delimiter = '\r\n' + delimiter if delimiter else '\n\r\t '
+                rows = _peek_lines(self.f, self.options['encoding'])
+                colspecs = _detect_colspecs(rows, delimiter,
+                                            self.options['comment'])
+            _validate_colspecs(colspecs)
+            self.options['colspecs'] = colspecs
+            self._engine = CParserWrapper(self.f, **self.options)
         else:
             if engine == 'python':
                 klass = PythonParser
@@ -705,20 +856,112 @@ class TextFileReader(object):
             if self.options.get('skip_footer'):
                 raise ValueError('skip_footer not supported for iteration')
 
-        ret = self._engine.read(nrows)
-
         if self.options.get('as_recarray'):
-            return ret
-
-        # May alter columns / col_dict
-        index, columns, col_dict = self._create_index(ret)
+            return self._engine.read(nrows)
 
-        df = DataFrame(col_dict, columns=columns, index=index)
+        if self.where is None:
+            df = self._read_frame(nrows)
+        else:
+            df = self._read_where(nrows)
 
         if self.squeeze and len(df.columns) == 1:
             return df[df.columns[0]].copy()
         return df
 
+    def _read_frame(self, nrows=None):
+        ret = self._engine.read(nrows)
+
+        # May alter columns / col_dict
+        index, columns, col_dict = self._create_index(ret)
+
+        if self.where is not None:
+            index, col_dict = self._apply_where(index, columns, col_dict)
+
+        return DataFrame(col_dict, columns=columns, index=index)
+
+    def _read_where(self, nrows=None):
+        # parse at most _WHERE_CHUNKSIZE rows at a time and only keep the
+        # rows of each piece matching the predicate
+        pieces = []
+        remaining = nrows
+        while remaining is None or remaining > 0:
+            size = _WHERE_CHUNKSIZE
+            if remaining is not None:
+                size = min(size, remaining)
+
+            currow = self._currow
+            try:
+                df = self._read_frame(size)
+            except StopIteration:
+                # the first piece of a file without rows is an empty frame,
+                # so this is only reached once the input is exhausted
+                if not pieces:
+                    raise
+                break
+
+            if remaining is not None:
+                remaining -= self._currow - currow
+            pieces.append(df)
+
+        if len(pieces) == 1:
+            return pieces[0]
+
+        from pandas.tools.merge import concat
+        return concat(pieces)
+
+    def _apply_where(self, index, columns, col_dict):
+        # select the rows of a parsed piece before the DataFrame is built,
+        # so that only the matching rows are copied into its blocks
+        if index is not None:
+            count = len(index)
+        elif col_dict:
+            count = len(next(iter(compat.itervalues(col_dict))))
+        else:
+            count = 0
+
+        if index is None:
+            # label the rows by their position in the file, so that the
+            # filtered pieces can be combined
+            index = RangeIndex(self._currow, self._currow + count)
+        self._currow += count
+
+        if callable(self.where):
+            mask = self.where(DataFrame(col_dict, columns=columns,
+                                        index=index))
+        else:
+            mask = self._eval_where(index, col_dict)
+
+        mask = np.asarray(mask, dtype=bool)
+        if mask.ndim == 0:
+            mask = np.repeat(mask, count)
+        if mask.all():
+            return index, col_dict
+
+        col_dict = dict((k, v[mask]) for k, v in compat.iteritems(col_dict))
+        return index[mask], col_dict
+
+    def _eval_where(self, index, col_dict):
+        from pandas.core.series import Series
+        from pandas.computation.eval import eval as _eval
+
+        # the same names DataFrame.query resolves: the columns, the index
+        # and its levels
+        resolvers = dict((k, Series(v, index=index, name=k))
+                         for k, v in compat.iteritems(col_dict))
+        index_resolvers = {}
+        for i, name in enumerate(index.names):
+            key = name if name is not None else 'ilevel_%d' % i
+            index_resolvers[key] = Series(index.get_level_values(i),
+                                          index=index)
+        if isinstance(index, MultiIndex):
+            index_resolvers['index'] = index
+        else:
+            index_resolvers['index'] = Series(index, index=index)
+
+        scope = self._where_scope
+        return _eval(self.where, resolvers=(resolvers, index_resolvers),
+                     local_dict=scope, global_dict=scope, level=1)
+
     def _create_index(self, ret):
         index, columns, col_dict = ret
         return index, columns, col_dict
@@ -728,6 +971,12 @@ class TextFileReader(object):
             size = self.chunksize
         return self.read(nrows=size)
 
+    def close(self):
+        """ release the resources held by the parser engine """
+        close = getattr(self._engine, 'close', None)
+        if close is not None:
+            close()
+
 
 def _is_index_col(col):
     return col is not None and col is not False
@@ -746,6 +995,7 @@ class ParserBase(object):
 
         self.parse_dates = kwds.pop('parse_dates', False)
         self.date_parser = kwds.pop('date_parser', None)
+        self.date_format = kwds.pop('date_format', None)
         self.dayfirst = kwds.pop('dayfirst', False)
         self.keep_date_col = kwds.pop('keep_date_col', False)
 
@@ -759,7 +1009,8 @@ class ParserBase(object):
         self._date_conv = _make_date_converter(
             date_parser=self.date_parser,
             dayfirst=self.dayfirst,
-            infer_datetime_format=self.infer_datetime_format
+            infer_datetime_format=self.infer_datetime_format,
+            date_format=self.date_format
         )
 
         # validate header options for mi
@@ -1039,6 +1290,9 @@ class CParserWrapper(ParserBase):
         self.kwds = kwds
         kwds = kwds.copy()
 
+        # read_fwf has already turned widths into colspecs
+        kwds.pop('widths', None)
+
         self.as_recarray = kwds.get('as_recarray', False)
         ParserBase.__init__(self, kwds)
 
@@ -1051,6 +1305,10 @@ class CParserWrapper(ParserBase):
         # #2442
         kwds['allow_leading_cols'] = self.index_col is not False
 
+        if (self.date_format is not None and
+                _parser._is_native_date_format(self.date_format)):
+            kwds['date_format'] = self.date_format
+
         self._reader = _parser.TextReader(src, **kwds)
 
         # XXX
@@ -1095,6 +1353,7 @@ class CParserWrapper(ParserBase):
                 raise ValueError("Usecols do not match names.")
 
         self._set_noconvert_columns()
+        self._set_date_columns()
 
         self.orig_names = self.names
 
@@ -1140,9 +1399,50 @@ class CParserWrapper(ParserBase):
                 else:
                     _set(val)
 
+    def _set_date_columns(self):
+        # single date columns are converted to datetime64 by the C parser
+        # when the default converter would be used, anything it cannot parse
+        # still goes through _date_conv after reading
+        if (not self.parse_dates or self.date_parser is not None or
+                self.usecols is not None):
+            return
+        if (self.date_format is not None and
+                not _parser._is_native_date_format(self.date_format)):
+            return
+
+        names = self.names
+        leading_cols = self._reader.leading_cols
+
+        if self.parse_dates is True:
+            if leading_cols:
+                for i in range(leading_cols):
+                    self._reader.set_date_column(i)
+            elif _is_index_col(self.index_col):
+                index_col = self.index_col
+                if not isinstance(index_col, (list, tuple, np.ndarray)):
+                    index_col = [index_col]
+                for x in index_col:
+                    if com.is_integer(x):
+                        self._reader.set_date_column(x)
+                    elif x in names:
+                        self._reader.set_date_column(names.index(x))
+
+        elif isinstance(self.parse_dates, list):
+            for x in self.parse_dates:
+                if isinstance(x, list):
+                    continue
+                if x in names:
+                    self._reader.set_date_column(names.index(x) +
+                                                 leading_cols)
+                elif com.is_integer(x) and not leading_cols:
+                    self._reader.set_date_column(x)
+
     def set_error_bad_lines(self, status):
         self._reader.set_error_bad_lines(int(status))
 
+    def close(self):
+        self._reader.close()
+
     def read(self, nrows=None):
         if self.as_recarray:
             # what to do if there are leading columns?
@@ -1319,6 +1619,13 @@ def _wrap_compressed(f, compression, encoding=None):
             data = data.decode(encoding)
         f = StringIO(data)
         return f
+    elif compression in ('xz', 'zip'):
+        f = open_compressed(f, compression)
+        if compat.PY3:
+            from io import TextIOWrapper
+
+            f = TextIOWrapper(f, encoding=encoding)
+        return f
     else:
         raise ValueError('do not recognize compression method %s'
                          % compression)
@@ -2009,9 +2316,15 @@ class PythonParser(ParserBase):
 
 
 def _make_date_converter(date_parser=None, dayfirst=False,
-                         infer_datetime_format=False):
+                         infer_datetime_format=False, date_format=None):
     def converter(*date_cols):
         if date_parser is None:
+            if (len(date_cols) == 1 and
+                    isinstance(date_cols[0], np.ndarray) and
+                    com.is_datetime64_dtype(date_cols[0])):
+                # already converted while parsing
+                return date_cols[0]
+
             strs = _concat_date_cols(date_cols)
             try:
                 return tools.to_datetime(
@@ -2019,6 +2332,7 @@ def _make_date_converter(date_parser=None, dayfirst=False,
                     utc=None,
                     box=False,
                     dayfirst=dayfirst,
+                    format=date_format,
                     infer_datetime_format=infer_datetime_format
                 )
             except:
@@ -2275,6 +2589,65 @@ def _concat_date_cols(date_cols):
     return rs
 
 
+def _validate_colspecs(colspecs):
+    if not isinstance(colspecs, (tuple, list)):
+        raise TypeError("column specifications must be a list or tuple, "
+                        "input was a %r" % type(colspecs).__name__)
+
+    for colspec in colspecs:
+
+        if not (isinstance(colspec, (tuple, list)) and
+                len(colspec) == 2 and
+                isinstance(colspec[0], (int, np.integer, type(None))) and
+                isinstance(colspec[1], (int, np.integer, type(None)))):
+            raise TypeError('Each column specification must be '
+                            '2 element tuple or list of integers')
+
+
+def _detect_colspecs(rows, delimiter, comment):
+    # Regex escape the delimiters
+    delimiters = ''.join([r'\%s' % x for x in delimiter])
+    pattern = re.compile('([^%s]+)' % delimiters)
+    max_len = max(map(len, rows))
+    mask = np.zeros(max_len + 1, dtype=int)
+    if comment is not None:
+        rows = [row.partition(comment)[0] for row in rows]
+    for row in rows:
+        for m in pattern.finditer(row):
+            mask[m.start():m.end()] = 1
+    shifted = np.roll(mask, 1)
+    shifted[0] = 0
+    edges = np.where((mask ^ shifted) == 1)[0]
+    return list(zip(edges[::2], edges[1::2]))
+
+
+def _peek_lines(f, encoding=None, n=100):
+    """
+    The first n lines of a file path or seekable buffer, leaving the buffer
+    at its current position
+    """
+    lines = []
+    if isinstance(f, compat.string_types):
+        with open(f, 'rb') as fh:
+            for line in fh:
+                lines.append(line)
+                if len(lines) >= n:
+                    break
+    else:
+        pos = f.tell()
+        while len(lines) < n:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line)
+        f.seek(pos)
+
+    if compat.PY3 or encoding is not None:
+        lines = [line.decode(encoding or 'utf-8')
+                 if isinstance(line, bytes) else line for line in lines]
+    return lines
+
+
 class FixedWidthReader(object):
     """
     A reader of fixed-width lines.
@@ -2289,18 +2662,7 @@ class FixedWidthReader(object):
         else:
             self.colspecs = colspecs
 
-        if not isinstance(self.colspecs, (tuple, list)):
-            raise TypeError("column specifications must be a list or tuple, "
-                            "input was a %r" % type(colspecs).__name__)
-
-        for colspec in self.colspecs:
-
-            if not (isinstance(colspec, (tuple, list)) and
-                    len(colspec) == 2 and
-                    isinstance(colspec[0], (int, np.integer, type(None))) and
-                    isinstance(colspec[1], (int, np.integer, type(None)))):
-                raise TypeError('Each column specification must be '
-                                '2 element tuple or list of integers')
+        _validate_colspecs(self.colspecs)
 
     def get_rows(self, n):
         rows = []
@@ -2312,21 +2674,8 @@ class FixedWidthReader(object):
         return rows
 
     def detect_colspecs(self, n=100):
-        # Regex escape the delimiters
-        delimiters = ''.join([r'\%s' % x for x in self.delimiter])
-        pattern = re.compile('([^%s]+)' % delimiters)
         rows = self.get_rows(n)
-        max_len = max(map(len, rows))
-        mask = np.zeros(max_len + 1, dtype=int)
-        if self.comment is not None:
-            rows = [row.partition(self.comment)[0] for row in rows]
-        for row in rows:
-            for m in pattern.finditer(row):
-                mask[m.start():m.end()] = 1
-        shifted = np.roll(mask, 1)
-        shifted[0] = 0
-        edges = np.where((mask ^ shifted) == 1)[0]
-        return list(zip(edges[::2], edges[1::2]))
+        return _detect_colspecs(rows, self.delimiter, self.comment)
 
     def next(self):
         if self.buffer is not None:
@@ -11,6 +11,8 @@ import copy
 import itertools
 import warnings
 import os
+import sys
+import threading
 
 import numpy as np
 from pandas import (Series, TimeSeries, DataFrame, Panel, Panel4D, Index,
@@ -30,6 +32,10 @@ import pandas.core.common as com
 from pandas.tools.merge import concat
 from pandas import compat
 from pandas.compat import u_safe as u, PY3, range, lrange, string_types, filter
+if PY3:
+    import queue
+else:
+    import Queue as queue
 from pandas.io.common import PerformanceWarning
 from pandas.core.config import get_option
 from pandas.computation.pytables import Expr, maybe_expression
@@ -101,6 +107,45 @@ def _ensure_term(where, scope_level):
     return where
 
 
+def _thread_map(func, items, threads=None):
+    """ map func over items, in a pool of threads if threads > 1 """
+    items = list(items)
+    if threads is not None and threads < 1:
+        raise ValueError("threads must be a positive integer")
+    if threads is None or threads == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(min(int(threads), len(items)))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _prefetch(chunks, results, stop):
+    # runs in the prefetch thread; puts (done, value, exception) for each
+    # chunk read, until the chunks are exhausted or the consumer stops
+    while not stop.is_set():
+        try:
+            result = (False, next(chunks), None)
+        except StopIteration:
+            result = (True, None, None)
+        except Exception:
+            result = (True, None, sys.exc_info()[1])
+
+        while not stop.is_set():
+            try:
+                results.put(result, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+
+        if result[0]:
+            break
+
+
 class PossibleDataLossError(Exception):
     pass
 
@@ -146,6 +191,8 @@ _FORMAT_MAP = {
     u('fixed'): 'fixed',
     u('t'): 'table',
     u('table'): 'table',
+    u('c'): 'column',
+    u('column'): 'column',
 }
 
 format_deprecate_doc = """
@@ -179,6 +226,7 @@ _STORER_MAP = {
     u('series'): 'SeriesFixed',
     u('sparse_series'): 'SparseSeriesFixed',
     u('frame'): 'FrameFixed',
+    u('frame_column'): 'FrameColumnStore',
     u('sparse_frame'): 'SparseFrameFixed',
     u('wide'): 'PanelFixed',
     u('sparse_panel'): 'SparsePanelFixed',
@@ -213,8 +261,8 @@ dropna_doc = """
 """
 format_doc = """
 : format
-    default format writing format, if None, then
-    put will default to 'fixed' and append will default to 'table'
+    default format writing format ('fixed', 'table' or 'column'), if None,
+    then put will default to 'fixed' and append will default to 'table'
 """
 
 with config.config_prefix('io.hdf'):
@@ -222,7 +270,8 @@ with config.config_prefix('io.hdf'):
                            validator=config.is_bool)
     config.register_option(
         'default_format', None, format_doc,
-        validator=config.is_one_of_factory(['fixed', 'table', None])
+        validator=config.is_one_of_factory(['fixed', 'table', 'column',
+                                            None])
     )
 
 # oh the troubles to reduce import time
@@ -419,6 +468,11 @@ class HDFStore(StringMixin):
         self._complib = complib
         self._fletcher32 = fletcher32
         self._filters = None
+
+        # HDF5 is not safe to use from several threads at once: the reads
+        # done from threads (select_multiple, select_as_multiple with
+        # threads, prefetching iterators) access the file holding this lock
+        self._hdf_lock = threading.RLock()
         self.open(mode=mode, **kwargs)
 
     @property
@@ -639,7 +693,8 @@ class HDFStore(StringMixin):
         return self._read_group(group)
 
     def select(self, key, where=None, start=None, stop=None, columns=None,
-               iterator=False, chunksize=None, auto_close=False, **kwargs):
+               iterator=False, chunksize=None, auto_close=False, prefetch=None,
+               **kwargs):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -656,34 +711,87 @@ class HDFStore(StringMixin):
         chunksize : nrows to include in iteration, return an iterator
         auto_close : boolean, should automatically close the store when
             finished, default is False
+        prefetch : integer, the number of chunks an iterator reads ahead in
+            a background thread, default None (read when asked)
 
         Returns
         -------
         The selected object
 
         """
-        group = self.get_node(key)
-        if group is None:
-            raise KeyError('No object named %s in the file' % key)
-
-        # create the storer and axes
         where = _ensure_term(where, scope_level=1)
-        s = self._create_storer(group)
-        s.infer_axes()
+        with self._hdf_lock:
+            group = self.get_node(key)
+            if group is None:
+                raise KeyError('No object named %s in the file' % key)
+
+            # create the storer and axes
+            s = self._create_storer(group)
+            s.infer_axes()
+            nrows = s.nrows
 
         # function to call on iteration
         def func(_start, _stop, _where):
-            return s.read(start=_start, stop=_stop,
-                          where=_where,
-                          columns=columns, **kwargs)
+            return self._read_storer(s, start=_start, stop=_stop,
+                                     where=_where, columns=columns, **kwargs)
 
         # create the iterator
-        it = TableIterator(self, s, func, where=where, nrows=s.nrows, start=start,
+        it = TableIterator(self, s, func, where=where, nrows=nrows, start=start,
                            stop=stop, iterator=iterator, chunksize=chunksize,
-                           auto_close=auto_close)
+                           auto_close=auto_close, prefetch=prefetch)
 
         return it.get_result()
 
+    def _read_storer(self, s, **kwargs):
+        """ read from the storer s holding the lock while the file is
+            accessed: a table only holds it to read its rows, so that the
+            objects are built concurrently, other storers for the whole read
+            """
+        if s.is_table:
+            return s.read(**kwargs)
+        with self._hdf_lock:
+            return s.read(**kwargs)
+
+    def select_multiple(self, keys, where=None, start=None, stop=None,
+                        columns=None, threads=None, **kwargs):
+        """
+        Retrieve several pandas objects, optionally based on the same where
+        criteria, reading them in a pool of threads
+
+        Parameters
+        ----------
+        keys : a list of the keys
+        where : list of Term (or convertable) objects, optional
+        start : integer (defaults to None), row number to start selection
+        stop  : integer (defaults to None), row number to stop selection
+        columns : a list of columns that if not None, will limit the return
+            columns
+        threads : integer, the number of keys read concurrently, default
+            None (read sequentially)
+
+        Returns
+        -------
+        a dict of the key to the selected object
+
+        Exceptions
+        ----------
+        raises KeyError if a key is not found
+        raises TypeError if keys is not a list or tuple
+        """
+        if not isinstance(keys, (list, tuple)):
+            raise TypeError("keys must be a list/tuple")
+
+        where = _ensure_term(where, scope_level=1)
+        for k in keys:
+            if self.get_node(k) is None:
+                raise KeyError('No object named %s in the file' % k)
+
+        def func(k):
+            return self.select(k, where=where, start=start, stop=stop,
+                               columns=columns, **kwargs)
+
+        return dict(zip(keys, _thread_map(func, keys, threads)))
+
     def select_as_coordinates(
             self, key, where=None, start=None, stop=None, **kwargs):
         """
@@ -697,8 +805,10 @@ class HDFStore(StringMixin):
         stop  : integer (defaults to None), row number to stop selection
         """
         where = _ensure_term(where, scope_level=1)
-        return self.get_storer(key).read_coordinates(where=where, start=start,
-                                                     stop=stop, **kwargs)
+        with self._hdf_lock:
+            return self.get_storer(key).read_coordinates(where=where,
+                                                         start=start,
+                                                         stop=stop, **kwargs)
 
     def select_column(self, key, column, **kwargs):
         """
@@ -718,11 +828,13 @@ class HDFStore(StringMixin):
             is part of a data block)
 
         """
-        return self.get_storer(key).read_column(column=column, **kwargs)
+        with self._hdf_lock:
+            return self.get_storer(key).read_column(column=column, **kwargs)
 
     def select_as_multiple(self, keys, where=None, selector=None, columns=None,
                            start=None, stop=None, iterator=False,
-                           chunksize=None, auto_close=False, **kwargs):
+                           chunksize=None, auto_close=False, threads=None,
+                           prefetch=None, **kwargs):
         """ Retrieve pandas objects from multiple tables
 
         Parameters
@@ -735,6 +847,10 @@ class HDFStore(StringMixin):
         stop  : integer (defaults to None), row number to stop selection
         iterator : boolean, return an iterator, default False
         chunksize : nrows to include in iteration, return an iterator
+        threads : integer, the number of tables read concurrently, default
+            None (read sequentially)
+        prefetch : integer, the number of chunks an iterator reads ahead in
+            a background thread, default None (read when asked)
 
         Exceptions
         ----------
@@ -750,7 +866,8 @@ class HDFStore(StringMixin):
         if isinstance(keys, string_types):
             return self.select(key=keys, where=where, columns=columns,
                                start=start, stop=stop, iterator=iterator,
-                               chunksize=chunksize, **kwargs)
+                               chunksize=chunksize, prefetch=prefetch,
+                               **kwargs)
 
         if not isinstance(keys, (list, tuple)):
             raise TypeError("keys must be a list/tuple")
@@ -788,7 +905,9 @@ class HDFStore(StringMixin):
         def func(_start, _stop, _where):
 
             # retrieve the objs, _where is always passed as a set of coordinates here
-            objs = [t.read(where=_where, columns=columns, **kwargs) for t in tbls]
+            def read(t):
+                return t.read(where=_where, columns=columns, **kwargs)
+            objs = _thread_map(read, tbls, threads)
 
             # concat and return
             return concat(objs, axis=axis,
@@ -797,7 +916,7 @@ class HDFStore(StringMixin):
         # create the iterator
         it = TableIterator(self, s, func, where=where, nrows=nrows, start=start,
                            stop=stop, iterator=iterator, chunksize=chunksize,
-                           auto_close=auto_close)
+                           auto_close=auto_close, prefetch=prefetch)
 
         return it.get_result(coordinates=True)
 
@@ -810,13 +929,17 @@ class HDFStore(StringMixin):
         ----------
         key      : object
         value    : {Series, DataFrame, Panel}
-        format   : 'fixed(f)|table(t)', default is 'fixed'
+        format   : 'fixed(f)|table(t)|column(c)', default is 'fixed'
             fixed(f) : Fixed format
                        Fast writing/reading. Not-appendable, nor searchable
             table(t) : Table format
                        Write as a PyTables Table structure which may perform
                        worse but allow more flexible operations like searching
                        / selecting subsets of the data
+            column(c) : Column format
+                       Write each column as its own array, appendable and
+                       fast to read a subset of the columns, but not
+                       searchable
         append   : boolean, default False
             This will force Table format, append the input data to the
             existing.
@@ -894,6 +1017,8 @@ class HDFStore(StringMixin):
                        Write as a PyTables Table structure which may perform
                        worse but allow more flexible operations like searching
                        / selecting subsets of the data
+            column(c) : column format
+                       Write each column as its own array
         append       : boolean, default True, append the input data to the
             existing
         data_columns : list of columns to create as data columns, or True to
@@ -922,6 +1047,43 @@ class HDFStore(StringMixin):
         self._write_to_group(key, value, append=append, dropna=dropna,
                              **kwargs)
 
+    def appender(self, key, format=None, index=True, chunksize=None,
+                 dropna=None, **kwargs):
+        """
+        Return a TableAppender, buffering many small appends to a table
+
+        Parameters
+        ----------
+        key : object
+        format : 'table' is the default
+        index : boolean or list of columns, default True, create the table
+            index on these columns when the appender is closed
+        chunksize : the number of rows buffered before writing, default
+            100000
+        dropna : boolean, default True, do not write an ALL nan row to
+            the store settable by the option 'io.hdf.dropna_table'
+        kwargs : passed to append for the first write, e.g. data_columns,
+            min_itemsize, expectedrows or complib
+
+        Returns
+        -------
+        a TableAppender, which can be used as a context manager
+
+        Notes
+        -----
+        The first append creates (or validates against) the table. Later
+        frames with the same columns and dtypes are converted straight to
+        the rows of the table and written in large batches; anything else
+        is passed to append.
+        """
+        if dropna is None:
+            dropna = get_option("io.hdf.dropna_table")
+        if format is None:
+            format = get_option("io.hdf.default_format") or 'table'
+        kwargs = self._validate_format(format, kwargs)
+        return TableAppender(self, key, index=index, chunksize=chunksize,
+                             dropna=dropna, **kwargs)
+
     def append_to_multiple(self, d, value, selector, data_columns=None,
                            axes=None, dropna=True, **kwargs):
         """
@@ -1106,6 +1268,9 @@ class HDFStore(StringMixin):
                         data_columns=getattr(s, 'data_columns', None),
                         encoding=s.encoding
                     )
+                elif s.is_column_store:
+                    new_store.put(k, data, format='column',
+                                  encoding=s.encoding)
                 else:
                     new_store.put(k, data, encoding=s.encoding)
 
@@ -1177,6 +1342,8 @@ class HDFStore(StringMixin):
                 # we are actually a table
                 if format == 'table':
                     pt += u('_table')
+                elif format == 'column':
+                    pt += u('_column')
 
         # a storer node
         if u('table') not in pt:
@@ -1262,7 +1429,7 @@ class HDFStore(StringMixin):
         if append:
             # raise if we are trying to append to a Fixed format,
             #       or a table that exists (and we are putting)
-            if (not s.is_table or
+            if (not (s.is_table or s.is_column_store) or
                     (s.is_table and format == 'fixed' and s.is_exists)):
                 raise ValueError('Can only append to Tables')
             if not s.is_exists:
@@ -1270,11 +1437,6 @@ class HDFStore(StringMixin):
         else:
             s.set_object_info()
 
-        if not s.is_table and complib:
-            raise ValueError(
-                'Compression not supported on Fixed format stores'
-            )
-
         # write the object
         s.write(obj=value, append=append, complib=complib, **kwargs)
 
@@ -1305,11 +1467,14 @@ class TableIterator(object):
         chunksize : the passed chunking value (default is 50000)
         auto_close : boolean, automatically close the store at the end of
             iteration, default is False
+        prefetch : the number of chunks read ahead in a background thread
+            (default is None, read when asked)
         kwargs : the passed kwargs
         """
 
     def __init__(self, store, s, func, where, nrows, start=None, stop=None,
-                 iterator=False, chunksize=None, auto_close=False):
+                 iterator=False, chunksize=None, auto_close=False,
+                 prefetch=None):
         self.store = store
         self.s     = s
         self.func  = func
@@ -1331,15 +1496,19 @@ class TableIterator(object):
 
         self.auto_close = auto_close
 
+        if prefetch is not None and prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer")
+        self.prefetch = int(prefetch or 0)
+
     def __iter__(self):
 
         # iterate
-        current = self.start
-        while current < self.stop:
+        if self.prefetch:
+            chunks = self._prefetch_chunks()
+        else:
+            chunks = self._read_chunks()
 
-            stop = min(current + self.chunksize, self.stop)
-            value = self.func(None, None, self.coordinates[current:stop])
-            current = stop
+        for value in chunks:
             if value is None or not len(value):
                 continue
 
@@ -1347,6 +1516,37 @@ class TableIterator(object):
 
         self.close()
 
+    def _read_chunks(self):
+        current = self.start
+        while current < self.stop:
+
+            stop = min(current + self.chunksize, self.stop)
+            yield self.func(None, None, self.coordinates[current:stop])
+            current = stop
+
+    def _prefetch_chunks(self):
+        """ read the chunks in a background thread, up to prefetch of them
+            ahead of the consumer """
+
+        results = queue.Queue(self.prefetch)
+        stop = threading.Event()
+        thread = threading.Thread(target=_prefetch,
+                                  args=(self._read_chunks(), results, stop))
+        thread.daemon = True
+        thread.start()
+
+        try:
+            while True:
+                done, value, exc = results.get()
+                if exc is not None:
+                    raise exc
+                if done:
+                    break
+                yield value
+        finally:
+            stop.set()
+            thread.join()
+
     def close(self):
         if self.auto_close:
             self.store.close()
@@ -1355,17 +1555,19 @@ class TableIterator(object):
 
         #  return the actual iterator
         if self.chunksize is not None:
-            if not self.s.is_table:
+            if not (self.s.is_table or self.s.is_column_store):
                 raise TypeError(
                     "can only use an iterator or chunksize on a table")
 
-            self.coordinates = self.s.read_coordinates(where=self.where)
+            with self.store._hdf_lock:
+                self.coordinates = self.s.read_coordinates(where=self.where)
 
             return self
 
         # if specified read via coordinates (necessary for multiple selections
         if coordinates:
-            where = self.s.read_coordinates(where=self.where)
+            with self.store._hdf_lock:
+                where = self.s.read_coordinates(where=self.where)
         else:
             where = self.where
 
@@ -1374,6 +1576,195 @@ class TableIterator(object):
         self.close()
         return results
 
+
+class TableAppender(object):
+
+    """ buffer the appends of frames to a table, writing in large batches
+
+        Parameters
+        ----------
+
+        store : the reference store
+        key   : the key of the table
+        index : boolean or list of columns, the columns to index on close
+        chunksize : the number of rows to buffer (default is 100000)
+        dropna : boolean, do not write an ALL nan row
+        kwargs : the passed kwargs to append
+        """
+
+    def __init__(self, store, key, index=True, chunksize=None, dropna=True,
+                 **kwargs):
+        self.store = store
+        self.key = key
+        self.index = index
+        if chunksize is None:
+            chunksize = 100000
+        self.chunksize = int(chunksize)
+        if self.chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+        self.dropna = dropna
+        self.kwargs = kwargs
+
+        self.s = None
+        self.buffer = None
+        self.nbuffered = 0
+        self.is_open = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, value):
+        """ append a pandas object to the table """
+        if not self.is_open:
+            raise ValueError("cannot append to a closed appender")
+
+        rows = self._convert(value)
+        if rows is None:
+            # keep the order of the rows with the buffered ones
+            self.flush()
+            self.store.append(self.key, value, index=False,
+                              dropna=self.dropna, **self.kwargs)
+            self.s = None
+            return
+
+        nrows = len(rows)
+        if nrows >= self.chunksize:
+            self.flush()
+            self._write(rows)
+            return
+
+        start = 0
+        while start < nrows:
+            n = min(self.chunksize - self.nbuffered, nrows - start)
+            self.buffer[self.nbuffered:self.nbuffered + n] = \
+                rows[start:start + n]
+            self.nbuffered += n
+            start += n
+            if self.nbuffered == self.chunksize:
+                self.flush()
+
+    def flush(self):
+        """ write the buffered rows """
+        if self.nbuffered:
+            self._write(self.buffer[:self.nbuffered])
+            self.nbuffered = 0
+
+    def close(self):
+        """ flush the buffer and create the table index """
+        if not self.is_open:
+            return
+        self.flush()
+        self.is_open = False
+        self.buffer = None
+
+        if self.index is not False and self.key in self.store:
+            s = self.store.get_storer(self.key)
+            if s.is_table:
+                s.create_index(columns=self.index)
+
+    def _write(self, rows):
+        table = self.s.table
+        try:
+            table.append(rows)
+            table.flush()
+        except Exception as detail:
+            raise TypeError("tables cannot write this data -> %s" % detail)
+
+    def _infer(self):
+        """ the storer to write to directly, or None if the value must be
+            appended (as a new table, or not a frame table) """
+        if self.s is None:
+            if self.key not in self.store:
+                return None
+            s = self.store.get_storer(self.key)
+            if (not s.is_table or s.table_type != u('appendable_frame') or
+                    not s.infer_axes()):
+                return None
+            self.s = s
+            self.buffer = np.empty(self.chunksize, dtype=s.table.dtype)
+        return self.s
+
+    def _convert(self, value):
+        """ convert a frame to the rows of the table, or return None if it
+            cannot be converted without validating it as append does """
+        if not isinstance(value, DataFrame) or self._infer() is None:
+            return None
+
+        s = self.s
+        if (len(s.index_axes) != 1 or len(s.non_index_axes) != 1 or
+                not value.columns.equals(Index(s.non_index_axes[0][1]))):
+            return None
+
+        dtype = s.table.dtype
+        rows = np.empty(len(value), dtype=dtype)
+        mask = None
+
+        # the index
+        a = s.index_axes[0]
+        index = value.index
+        kind = _ensure_decoded(a.kind)
+        if isinstance(index, MultiIndex) or a.tz is not None:
+            return None
+        if a.freq is not None and a.freq != getattr(index, 'freq', None):
+            return None
+        if kind == u('datetime64') and isinstance(index, DatetimeIndex):
+            if index.tz is not None:
+                return None
+            rows[a.cname] = index.asi8
+        elif kind == u('integer') and isinstance(index, Int64Index):
+            rows[a.cname] = index.values
+        elif (kind == u('float') and
+              com.is_float_dtype(getattr(index, 'dtype', None))):
+            rows[a.cname] = index.values
+        else:
+            return None
+
+        # the values blocks and data columns
+        for a in s.values_axes:
+            kind = _ensure_decoded(a.kind)
+            field = dtype[a.cname]
+            items = list(a.values)
+            dtypes = value.dtypes[items]
+            data = value[items].values
+
+            if kind == u('string'):
+                if not (dtypes == np.object_).all():
+                    return None
+                data = data.copy()
+                data[com.isnull(data)] = s.nan_rep
+                data = data.ravel()
+                if (lib.infer_dtype(data) != 'string' or
+                        lib.max_len_string_array(data) > field.base.itemsize):
+                    return None
+                data = _convert_string_array(data, s.encoding,
+                                             field.base.itemsize)
+            elif kind in (u('datetime64'), u('timedelta64')):
+                if a.tz is not None or not (dtypes == np.dtype(
+                        '%s[ns]' % kind)).all():
+                    return None
+                data = data.view('i8')
+            elif (dtypes == field.base).all():
+                if field.base.kind == 'f':
+                    m = com.isnull(data).all(axis=1)
+                    mask = m if mask is None else mask & m
+            else:
+                return None
+
+            rows[a.cname] = data.reshape((len(value),) + field.shape)
+
+        # drop the ALL nan rows; when there are blocks other than floats
+        # (e.g. datetimes holding NaT), let append decide which rows to drop
+        if self.dropna and mask is not None and mask.any():
+            if not all(dtype[a.cname].base.kind == 'f'
+                       for a in s.values_axes):
+                return None
+            rows = rows[~mask]
+        return rows
+
+
 class IndexCol(StringMixin):
 
     """ an index column description class
@@ -1688,6 +2079,10 @@ class DataCol(IndexCol):
             values=values, kind=kind, typ=typ, cname=cname, **kwargs)
         self.dtype = None
         self.dtype_attr = u("%s_dtype" % self.name)
+        self.meta = None
+        self.meta_attr = u("%s_meta" % self.name)
+        self.metadata = None
+        self.ordered = None
         self.set_data(data)
 
     def __unicode__(self):
@@ -1698,7 +2093,7 @@ class DataCol(IndexCol):
     def __eq__(self, other):
         """ compare 2 col items """
         return all([getattr(self, a, None) == getattr(other, a, None)
-                    for a in ['name', 'cname', 'dtype', 'pos']])
+                    for a in ['name', 'cname', 'dtype', 'pos', 'meta']])
 
     def set_data(self, data, dtype=None):
         self.data = data
@@ -1745,6 +2140,10 @@ class DataCol(IndexCol):
 
         self.values = list(block_items)
         dtype = block.dtype.name
+
+        if dtype == 'category':
+            return self.set_atom_categorical(block, existing_col)
+
         rvalues = block.values.ravel()
         inferred_type = lib.infer_dtype(rvalues)
 
@@ -1803,9 +2202,6 @@ class DataCol(IndexCol):
             raise TypeError(
                 "[unicode] is not implemented as a table column")
 
-        elif dtype == 'category':
-            raise NotImplementedError("cannot store a category dtype")
-
         # this is basically a catchall; if say a datetime64 has nans then will
         # end up here ###
         elif inferred_type == 'string' or dtype == 'object':
@@ -1887,6 +2283,26 @@ class DataCol(IndexCol):
         self.typ = self.get_atom_data(block)
         self.set_data(block.values.astype(self.typ.type))
 
+    def set_atom_categorical(self, block, existing_col):
+        """ store a categorical as its codes, the categories are written to
+            their own node with the table """
+        values = block.values
+        categories = values.categories
+
+        if existing_col is not None and existing_col.meta == u('category'):
+            if not existing_col.metadata.equals(categories):
+                raise ValueError("cannot append a categorical with different "
+                                 "categories to the existing")
+
+        codes = values.codes
+        self.kind = codes.dtype.name
+        self.typ = self.get_atom_data(block)
+        self.meta = 'category'
+        self.metadata = categories
+        self.ordered = values.ordered
+        self.set_data(codes.reshape(block.shape))
+        return self
+
     def get_atom_datetime64(self, block):
         return _tables().Int64Col(shape=block.shape[0])
 
@@ -1931,6 +2347,13 @@ class DataCol(IndexCol):
                 raise ValueError("appended items dtype do not match existing "
                                  "items dtype in table!")
 
+            existing_meta = _ensure_decoded(
+                getattr(self.attrs, self.meta_attr, None))
+            if (existing_fields is not None and
+                    existing_meta != _ensure_decoded(self.meta)):
+                raise ValueError("appended items meta do not match existing "
+                                 "items meta in table!")
+
     def convert(self, values, nan_rep, encoding):
         """set the data from this selection (and convert to the correct dtype
         if we can)
@@ -1987,12 +2410,72 @@ class DataCol(IndexCol):
             self.data = _unconvert_string_array(
                 self.data, nan_rep=nan_rep, encoding=encoding)
 
+        # recreate a categorical from its codes
+        if self.meta == u('category'):
+            self.data = Categorical.from_codes(self.data.ravel(),
+                                               categories=self.metadata,
+                                               ordered=self.ordered)
+
         return self
 
+    @property
+    def metadata_key(self):
+        """ the node of my categories """
+        return u("%s_categories" % self.cname)
+
+    def write_metadata(self, handle, encoding=None):
+        """ write my categories to a node next to the table """
+        if self.meta != u('category'):
+            return
+
+        group = self.table._v_parent
+        if self.metadata_key in group:
+            handle.remove_node(group, self.metadata_key)
+
+        categories = self.metadata
+        if not len(categories):
+            # length 0 arrays cannot be stored
+            kind, values = 'data', np.zeros(1)
+        elif isinstance(categories, DatetimeIndex):
+            if categories.tz is not None:
+                raise TypeError("cannot store a categorical with tz-aware "
+                                "categories")
+            kind, values = 'datetime64', categories.asi8
+        elif categories.is_numeric() or categories.is_boolean():
+            kind, values = 'data', categories.values
+        elif lib.infer_dtype(categories) == 'string':
+            kind = 'string'
+            values = _convert_string_array(categories.values, encoding)
+        else:
+            raise TypeError("cannot store a categorical with categories of "
+                            "[%s]" % lib.infer_dtype(categories))
+
+        node = handle.create_array(group, self.metadata_key, values)
+        node._v_attrs.kind = kind
+        node._v_attrs.ncategories = len(categories)
+
+    def read_metadata(self, encoding=None):
+        """ read my categories """
+        if self.meta != u('category'):
+            self.metadata = None
+            return
+
+        node = getattr(self.table._v_parent, self.metadata_key)
+        kind = _ensure_decoded(node._v_attrs.kind)
+        values = node.read()[:node._v_attrs.ncategories]
+        if kind == u('string'):
+            values = _unconvert_string_array(values, encoding=encoding)
+        elif kind == u('datetime64'):
+            values = np.asarray(values, dtype='M8[ns]')
+        self.metadata = Index(values)
+
     def get_attr(self):
         """ get the data for this colummn """
         self.values = getattr(self.attrs, self.kind_attr, None)
         self.dtype = getattr(self.attrs, self.dtype_attr, None)
+        self.meta = _ensure_decoded(getattr(self.attrs, self.meta_attr, None))
+        if self.meta == u('category'):
+            self.ordered = getattr(self.attrs, '%s_ordered' % self.name, None)
         self.set_kind()
 
     def set_attr(self):
@@ -2000,6 +2483,9 @@ class DataCol(IndexCol):
         setattr(self.attrs, self.kind_attr, self.values)
         if self.dtype is not None:
             setattr(self.attrs, self.dtype_attr, self.dtype)
+        if self.meta is not None:
+            setattr(self.attrs, self.meta_attr, self.meta)
+            setattr(self.attrs, '%s_ordered' % self.name, self.ordered)
 
 
 class DataIndexableCol(DataCol):
@@ -2044,6 +2530,7 @@ class Fixed(StringMixin):
     obj_type = None
     ndim = None
     is_table = False
+    is_column_store = False
 
     def __init__(self, parent, group, encoding=None, **kwargs):
         self.parent = parent
@@ -2128,6 +2615,16 @@ class Fixed(StringMixin):
     def _complib(self):
         return self.parent._complib
 
+    def _get_filters(self, complib=None, complevel=None, fletcher32=None):
+        """ the filters of new arrays, as for a Table description """
+        if complib:
+            if complevel is None:
+                complevel = self._complevel or 9
+            return _tables().Filters(
+                complevel=complevel, complib=complib,
+                fletcher32=fletcher32 or self._fletcher32)
+        return self._filters
+
     @property
     def attrs(self):
         return self.group._v_attrs
@@ -2240,20 +2737,42 @@ class GenericFixed(Fixed):
         for n in self.attributes:
             setattr(self, n, _ensure_decoded(getattr(self.attrs, n, None)))
 
-    def write(self, obj, **kwargs):
+    def write(self, obj, complib=None, complevel=None, fletcher32=None,
+              **kwargs):
         self.set_attrs()
+        self._write_filters = self._get_filters(complib, complevel,
+                                                fletcher32)
 
-    def read_array(self, key):
-        """ read an array for the specified node (off of group """
+    def _index_length(self, key):
+        """ the length of the index written at key, without reading it """
+        import tables
+        variety = _ensure_decoded(getattr(self.attrs, '%s_variety' % key))
+        if variety == u('multi'):
+            key = '%s_label0' % key
+        node = getattr(self.group, key)
+        shape = getattr(node._v_attrs, 'shape', None)
+        if shape is not None and self._is_empty_array(shape):
+            return 0
+        if isinstance(node, tables.VLArray):
+            return len(node[0])
+        return node.shape[0]
+
+    def read_array(self, key, start=None, stop=None, locs=None):
+        """ read an array for the specified node (off of group), optionally
+        only the rows start:stop, and the items at locs of a block """
         import tables
         node = getattr(self.group, key)
-        data = node[:]
         attrs = node._v_attrs
+        rows = slice(start, stop)
 
         transposed = getattr(attrs, 'transposed', False)
 
         if isinstance(node, tables.VLArray):
-            ret = data[0]
+            ret = node[0]
+            if transposed:
+                ret = ret[rows]
+                if locs is not None:
+                    ret = ret[:, locs]
         else:
             dtype = getattr(attrs, 'value_type', None)
             shape = getattr(attrs, 'shape', None)
@@ -2261,8 +2780,19 @@ class GenericFixed(Fixed):
             if shape is not None:
                 # length 0 axis
                 ret = np.empty(shape, dtype=dtype)
+                if locs is not None:
+                    ret = ret[locs]
+                ret = ret[..., rows]
+            elif (locs is not None and 2 * len(locs) < node.shape[1] and
+                  (node.chunkshape is None or node.chunkshape[1] == 1)):
+                # read the columns of the selected items as hyperslabs; only
+                # when a chunk does not hold several columns, otherwise each
+                # read would decompress the same chunks again
+                ret = np.column_stack([node[rows, loc] for loc in locs])
             else:
-                ret = data
+                ret = node[rows]
+                if locs is not None:
+                    ret = ret[:, locs]
 
             if dtype == u('datetime64'):
                 ret = np.array(ret, dtype='M8[ns]')
@@ -2274,17 +2804,18 @@ class GenericFixed(Fixed):
         else:
             return ret
 
-    def read_index(self, key):
+    def read_index(self, key, start=None, stop=None):
         variety = _ensure_decoded(getattr(self.attrs, '%s_variety' % key))
 
         if variety == u('multi'):
-            return self.read_multi_index(key)
+            return self.read_multi_index(key, start=start, stop=stop)
         elif variety == u('block'):
             return self.read_block_index(key)
         elif variety == u('sparseint'):
             return self.read_sparse_intindex(key)
         elif variety == u('regular'):
-            _, index = self.read_index_node(getattr(self.group, key))
+            _, index = self.read_index_node(getattr(self.group, key),
+                                            start=start, stop=stop)
             return index
         else:  # pragma: no cover
             raise TypeError('unrecognized index variety: %s' % variety)
@@ -2362,7 +2893,7 @@ class GenericFixed(Fixed):
             label_key = '%s_label%d' % (key, i)
             self.write_array(label_key, lab)
 
-    def read_multi_index(self, key):
+    def read_multi_index(self, key, start=None, stop=None):
         nlevels = getattr(self.attrs, '%s_nlevels' % key)
 
         levels = []
@@ -2375,14 +2906,20 @@ class GenericFixed(Fixed):
             names.append(name)
 
             label_key = '%s_label%d' % (key, i)
-            lab = self.read_array(label_key)
+            lab = self.read_array(label_key, start=start, stop=stop)
             labels.append(lab)
 
         return MultiIndex(levels=levels, labels=labels, names=names,
                           verify_integrity=True)
 
-    def read_index_node(self, node):
-        data = node[:]
+    def read_index_node(self, node, start=None, stop=None):
+        import tables
+        # an object index is a single pickled row, sliced once read
+        is_vlarray = isinstance(node, tables.VLArray)
+        if is_vlarray:
+            data = node[:]
+        else:
+            data = node[start:stop]
         # If the index was an empty array write_array_empty() will
         # have written a sentinel. Here we relace it with the original.
         if ('shape' in node._v_attrs and
@@ -2414,6 +2951,8 @@ class GenericFixed(Fixed):
             index = factory(
                 _unconvert_index(data, kind, encoding=self.encoding), **kwargs)
 
+        if is_vlarray:
+            index = index[start:stop]
         index.name = name
 
         return name, index
@@ -2446,7 +2985,8 @@ class GenericFixed(Fixed):
             value = value.T
             transposed = True
 
-        if self._filters is not None:
+        filters = getattr(self, '_write_filters', None) or self._filters
+        if filters is not None:
             atom = None
             try:
                 # get the atom for this datatype
@@ -2459,7 +2999,7 @@ class GenericFixed(Fixed):
                 if not empty_array:
                     ca = self._handle.create_carray(self.group, key, atom,
                                                    value.shape,
-                                                   filters=self._filters)
+                                                   filters=filters)
                     ca[:] = value
                     getattr(self.group, key)._v_attrs.transposed = transposed
 
@@ -2545,10 +3085,18 @@ class SeriesFixed(GenericFixed):
         except:
             return None
 
-    def read(self, **kwargs):
+    @property
+    def nrows(self):
+        try:
+            return self._index_length('index')
+        except:
+            return None
+
+    def read(self, start=None, stop=None, **kwargs):
         self.validate_read(kwargs)
-        index = self.read_index('index')
-        values = self.read_array('values')
+        start, stop, _ = slice(start, stop).indices(self.nrows)
+        index = self.read_index('index', start=start, stop=stop)
+        values = self.read_array('values', start=start, stop=stop)
         return Series(values, index=index, name=self.name)
 
     def write(self, obj, **kwargs):
@@ -2728,6 +3276,56 @@ class FrameFixed(BlockManagerFixed):
     pandas_kind = u('frame')
     obj_type = DataFrame
 
+    @property
+    def nrows(self):
+        try:
+            return self._index_length('axis1')
+        except:
+            return None
+
+    def read(self, start=None, stop=None, columns=None, **kwargs):
+        """ read the rows start:stop, of the columns (default all) only.
+            The blocks are stored with their rows as the first dimension so
+            a row range is a single hyperslab of each block, and the columns
+            of a block are read individually when few of them are selected
+            """
+        if kwargs.get('where') is not None:
+            raise TypeError("cannot pass a where specification when reading "
+                            "from a Fixed format store. this store must be "
+                            "selected in its entirety")
+
+        start, stop, _ = slice(start, stop).indices(self.nrows)
+        items = self.read_index('axis0')
+        index = self.read_index('axis1', start=start, stop=stop)
+
+        if columns is not None:
+            columns = _ensure_index(columns)
+            missing = columns[items.get_indexer(columns) == -1]
+            if len(missing):
+                raise KeyError("columns [%s] not found in the store"
+                               % ','.join([pprint_thing(c) for c in missing]))
+            if not columns.is_unique:
+                raise ValueError("columns must be unique")
+            items = columns
+
+        blocks = []
+        for i in range(self.nblocks):
+            blk_items = self.read_index('block%d_items' % i)
+            locs = None
+            if columns is not None:
+                locs = columns.get_indexer(blk_items)
+                locs = np.flatnonzero(locs != -1)
+                if not len(locs):
+                    continue
+                blk_items = blk_items.take(locs)
+            values = self.read_array('block%d_values' % i, start=start,
+                                     stop=stop, locs=locs)
+            blk = make_block(values,
+                             placement=items.get_indexer(blk_items))
+            blocks.append(blk)
+
+        return self.obj_type(BlockManager(blocks, [items, index]))
+
 
 class PanelFixed(BlockManagerFixed):
     pandas_kind = u('wide')
@@ -2739,6 +3337,287 @@ class PanelFixed(BlockManagerFixed):
         return super(PanelFixed, self).write(obj, **kwargs)
 
 
+class FrameColumnStore(GenericFixed):
+
+    """ a DataFrame stored column-wise: the index and each column are their
+        own chunked (and possibly compressed) EArray of the same length, the
+        row number being the coordinate shared by all of them. Reading a
+        subset of the columns only touches the arrays of those columns. Rows
+        can be appended, and selected by start/stop or by row coordinates.
+        """
+    pandas_kind = u('frame_column')
+    obj_type = DataFrame
+    is_column_store = True
+    attributes = ['ncols', 'nan_rep']
+
+    @property
+    def format_type(self):
+        return 'column'
+
+    @property
+    def is_exists(self):
+        return u('index') in self.group
+
+    @property
+    def nrows(self):
+        node = getattr(self.group, 'index', None)
+        if node is None:
+            return None
+        return node.nrows
+
+    @property
+    def shape(self):
+        try:
+            return [self.nrows, int(self.ncols)]
+        except:
+            return None
+
+    def _column_key(self, loc):
+        return 'values_%d' % loc
+
+    def _convert_column(self, values, name):
+        """ return the values to store for a column and their kind """
+        if com.is_categorical_dtype(values):
+            raise NotImplementedError("cannot store a category dtype")
+
+        kind = values.dtype.kind
+        if kind in 'biuf':
+            return values, u('data')
+        elif kind == 'M':
+            return values.view('i8'), u('datetime64')
+        elif kind == 'm':
+            return values.view('i8'), u('timedelta64')
+        elif kind == 'O':
+            mask = com.isnull(values)
+            if mask.any():
+                values = values.copy()
+                values[mask] = self.nan_rep
+            inferred_type = lib.infer_dtype(values)
+            if len(values) and inferred_type != 'string':
+                raise TypeError(
+                    "Cannot serialize the column [%s] because\n"
+                    "its data contents are [%s] object dtype"
+                    % (name, inferred_type))
+            return _convert_string_array(values, self.encoding), u('string')
+
+        raise TypeError("cannot store the column [%s] of dtype [%s] in the "
+                        "column format" % (name, values.dtype))
+
+    def _prepare_column(self, key, name, values, kind, min_itemsize):
+        """ validate the converted values against the existing array key,
+            return the values to append and the atom of the array to create
+            (None if it exists) """
+        if key in self.group:
+            node = getattr(self.group, key)
+            existing_kind = _ensure_decoded(node._v_attrs.kind)
+            if existing_kind != kind or (kind != u('string') and
+                                         values.dtype != node.atom.dtype):
+                raise ValueError(
+                    "invalid combinate of [%s] on appending data [%s] vs "
+                    "current table [%s]" % (name, values.dtype,
+                                            node.atom.dtype))
+            if kind == u('string'):
+                itemsize = node.atom.itemsize
+                if values.dtype.itemsize > itemsize:
+                    raise ValueError(
+                        "Trying to store a string with len [%s] in [%s] "
+                        "column but\nthis column has a limit of [%s]!\n"
+                        "Consider using min_itemsize to preset the sizes on "
+                        "these columns" % (values.dtype.itemsize, name,
+                                           itemsize))
+                values = values.astype('S%d' % itemsize)
+            return values, None
+
+        if kind == u('string'):
+            itemsize = max(values.dtype.itemsize,
+                           (min_itemsize or {}).get(name, 0), 1)
+            values = values.astype('S%d' % itemsize)
+            atom = _tables().StringAtom(itemsize)
+        else:
+            atom = _tables().Atom.from_dtype(values.dtype)
+        return values, atom
+
+    def _append_column(self, key, values, kind, atom, filters,
+                       expectedrows):
+        """ append the prepared values to the array key, creating it with
+            atom if given """
+        if atom is None:
+            node = getattr(self.group, key)
+        else:
+            node = self._handle.create_earray(self.group, key, atom, (0,),
+                                              filters=filters,
+                                              expectedrows=expectedrows)
+            node._v_attrs.kind = kind
+        node.append(values)
+
+    def write(self, obj, append=False, complib=None, complevel=None,
+              fletcher32=None, min_itemsize=None, expectedrows=None,
+              nan_rep=None, **kwargs):
+        if not isinstance(obj, DataFrame):
+            raise TypeError("can only store a DataFrame in the column format")
+        if not obj.columns.is_unique:
+            raise ValueError("Columns index has to be unique for column "
+                             "format")
+        if isinstance(obj.index, MultiIndex):
+            raise NotImplementedError("a MultiIndex is not supported in the "
+                                      "column format")
+
+        append = append and self.is_exists
+        if append:
+            self.get_attrs()
+            columns = self.read_index('columns')
+            if not columns.equals(obj.columns):
+                raise ValueError(
+                    "cannot append a frame with columns [%s] to the column "
+                    "store with columns [%s]"
+                    % (','.join([pprint_thing(c) for c in obj.columns]),
+                       ','.join([pprint_thing(c) for c in columns])))
+        else:
+            self.nan_rep = nan_rep or 'nan'
+
+        # convert and validate the index and every column before writing
+        # anything, so that a rejected append leaves the arrays unchanged
+        index = obj.index
+        converted = _convert_index(index, self.encoding, self.format_type)
+        if converted.kind in (u('object'), u('date'), u('datetime')):
+            raise TypeError("cannot store an index of kind [%s] in the "
+                            "column format" % converted.kind)
+        prepared = [('index', converted.kind) +
+                    self._prepare_column('index', 'index', converted.values,
+                                         converted.kind, min_itemsize)]
+        for loc, (name, col) in enumerate(compat.iteritems(obj)):
+            key = self._column_key(loc)
+            values, kind = self._convert_column(col.values, name)
+            prepared.append((key, kind) +
+                            self._prepare_column(key, name, values, kind,
+                                                 min_itemsize))
+
+        if not append:
+            super(FrameColumnStore, self).write(obj, **kwargs)
+            self.attrs.nan_rep = self.nan_rep
+            self.ncols = self.attrs.ncols = len(obj.columns)
+            self.write_index('columns', obj.columns)
+
+        filters = self._get_filters(complib, complevel, fletcher32)
+        expectedrows = max(expectedrows or len(obj), 1)
+        for key, kind, values, atom in prepared:
+            self._append_column(key, values, kind, atom, filters,
+                                expectedrows)
+
+        node = self.group.index
+        if 'name' not in node._v_attrs:
+            node._v_attrs.name = index.name
+            if getattr(index, 'tz', None) is not None:
+                zone = tslib.get_timezone(index.tz)
+                if zone is None:
+                    zone = tslib.tot_seconds(index.tz.utcoffset())
+                node._v_attrs.tz = zone
+
+    def _get_coordinates(self, where=None, start=None, stop=None):
+        """ return the normalized start and stop, and the row coordinates
+            (or None) given by where """
+        nrows = self.nrows or 0
+        start, stop, _ = slice(start, stop).indices(nrows)
+
+        if where is None:
+            return start, stop, None
+
+        coords = None
+        if com.is_list_like(where) and not isinstance(where, Expr):
+            inferred = lib.infer_dtype(where)
+            if inferred == 'boolean':
+                coords = np.arange(start, stop)[np.asarray(where)]
+            elif inferred == 'integer':
+                coords = np.asarray(where, dtype=np.int64)
+                if ((coords < start) | (coords >= stop)).any():
+                    raise ValueError("where must have index locations >= "
+                                     "start and < stop")
+        if coords is None:
+            raise TypeError("the column format can only select rows by "
+                            "start/stop or row coordinates, not a where "
+                            "expression")
+        return start, stop, coords
+
+    def _read_node(self, node, start, stop, coords):
+        if coords is None:
+            return node.read(start, stop)
+        elif len(coords):
+            # read the span of the coordinates in a single hyperslab
+            lo = coords.min()
+            return node.read(lo, coords.max() + 1)[coords - lo]
+        return node.read(0, 0)
+
+    def _read_column(self, key, start, stop, coords):
+        node = getattr(self.group, key)
+        data = self._read_node(node, start, stop, coords)
+
+        kind = _ensure_decoded(node._v_attrs.kind)
+        if kind == u('datetime64'):
+            return data.view('M8[ns]')
+        elif kind == u('timedelta64'):
+            return data.view('m8[ns]')
+        elif kind == u('string'):
+            return _unconvert_string_array(data, nan_rep=self.nan_rep,
+                                           encoding=self.encoding)
+        return data
+
+    def _read_index(self, start, stop, coords):
+        node = self.group.index
+        data = self._read_node(node, start, stop, coords)
+
+        kind = _ensure_decoded(node._v_attrs.kind)
+        if kind == u('datetime64'):
+            index = _set_tz(DatetimeIndex(data),
+                            getattr(node._v_attrs, 'tz', None))
+        else:
+            index = Index(_unconvert_index(data, kind,
+                                           encoding=self.encoding))
+        index.name = getattr(node._v_attrs, 'name', None)
+        return index
+
+    def read_coordinates(self, where=None, start=None, stop=None, **kwargs):
+        """ return the selected row numbers as an Index """
+        start, stop, coords = self._get_coordinates(where, start, stop)
+        if coords is None:
+            coords = np.arange(start, stop)
+        return Index(coords)
+
+    def read_column(self, column, where=None, start=None, stop=None,
+                    **kwargs):
+        """ return a single column as a Series, only its array is read """
+        start, stop, coords = self._get_coordinates(where, start, stop)
+        if column == 'index':
+            return Series(self._read_index(start, stop, coords))
+        columns = self.read_index('columns')
+        if column not in columns:
+            raise KeyError("column [%s] not found in the table" % column)
+        key = self._column_key(columns.get_loc(column))
+        return Series(self._read_column(key, start, stop, coords),
+                      name=column)
+
+    def read(self, where=None, columns=None, start=None, stop=None,
+             **kwargs):
+        start, stop, coords = self._get_coordinates(where, start, stop)
+        index = self._read_index(start, stop, coords)
+
+        stored = self.read_index('columns')
+        if columns is None:
+            locs = np.arange(len(stored))
+        else:
+            locs = stored.get_indexer(_ensure_index(columns))
+            if (locs == -1).any():
+                raise KeyError("columns [%s] not found in the table"
+                               % ','.join([pprint_thing(c) for c, loc
+                                           in zip(columns, locs)
+                                           if loc == -1]))
+
+        arrays = [self._read_column(self._column_key(loc), start, stop,
+                                    coords) for loc in locs]
+        if not arrays:
+            return DataFrame(index=index, columns=stored.take(locs))
+        return DataFrame._from_arrays(arrays, stored.take(locs), index)
+
+
 class Table(Fixed):
 
     """ represent a table:
@@ -2900,14 +3779,15 @@ class Table(Fixed):
                                      [int(a.axis) for a in self.index_axes]))
 
     def queryables(self):
-        """ return a dict of the kinds allowable columns for this object """
+        """ return a dict of the allowable columns for this object, to the
+            column (or None if it is not in the table) """
 
         # compute the values_axes queryables
         return dict(
-            [(a.cname, a.kind) for a in self.index_axes] +
+            [(a.cname, a) for a in self.index_axes] +
             [(self.storage_obj_type._AXIS_NAMES[axis], None)
              for axis, values in self.non_index_axes] +
-            [(v.cname, v.kind) for v in self.values_axes
+            [(v.cname, v) for v in self.values_axes
              if v.name in set(self.data_columns)]
         )
 
@@ -2955,6 +3835,8 @@ class Table(Fixed):
         self.values_axes = [
             a.infer(t) for a in self.indexables if not a.is_an_indexable
         ]
+        for a in self.values_axes:
+            a.read_metadata(encoding=self.encoding)
 
     def validate_version(self, where=None):
         """ are we trying to operate on an old version? """
@@ -3080,16 +3962,20 @@ class Table(Fixed):
         for success
         """
 
-        # validate the version
-        self.validate_version(where)
+        # only the access to the file holds the lock of the store, the
+        # data is converted concurrently when reading from threads
+        with self.parent._hdf_lock:
 
-        # infer the data kind
-        if not self.infer_axes():
-            return False
+            # validate the version
+            self.validate_version(where)
 
-        # create the selection
-        self.selection = Selection(self, where=where, **kwargs)
-        values = self.selection.select()
+            # infer the data kind
+            if not self.infer_axes():
+                return False
+
+            # create the selection
+            self.selection = Selection(self, where=where, **kwargs)
+            values = self.selection.select()
 
         # convert the data
         for a in self.axes:
@@ -3643,7 +4529,8 @@ class AppendableTable(LegacyTable):
                          min_itemsize=min_itemsize,
                          **kwargs)
 
-        if not self.is_exists:
+        new_table = not self.is_exists
+        if new_table:
 
             # create the table
             options = self.create_description(complib=complib,
@@ -3667,6 +4554,11 @@ class AppendableTable(LegacyTable):
         for a in self.axes:
             a.validate_and_set(table, append)
 
+        # the categories of a new table
+        if new_table:
+            for a in self.values_axes:
+                a.write_metadata(self._handle, encoding=self.encoding)
+
         # add the rows
         self.write_data(chunksize, dropna=dropna)
 
@@ -3877,17 +4769,18 @@ class AppendableFrameTable(AppendableTable):
             if names is not None:
                 cols.set_names(names, inplace=True)
 
+            values = a.cvalues
             if self.is_transposed:
-                values = a.cvalues
                 index_ = cols
                 cols_ = Index(index, name=getattr(index, 'name', None))
             else:
-                values = a.cvalues.T
+                if not isinstance(values, Categorical):
+                    values = values.T
                 index_ = Index(index, name=getattr(index, 'name', None))
                 cols_ = cols
 
             # if we have a DataIndexableCol, its shape will only be 1 dim
-            if values.ndim == 1:
+            if values.ndim == 1 and not isinstance(values, Categorical):
                 values = values.reshape(1, values.shape[0])
 
             block = make_block(values, placement=np.arange(len(cols_)))
@@ -9,13 +9,16 @@ from datetime import datetime, date
 
 import warnings
 import traceback
+import itertools
 import re
 import numpy as np
 
 import pandas.lib as lib
 import pandas.core.common as com
-from pandas.compat import lzip, map, zip, raise_with_traceback, string_types
-from pandas.core.api import DataFrame, Series
+from pandas.compat import (lzip, map, zip, raise_with_traceback, string_types,
+                           StringIO, lrange)
+from pandas.core.api import DataFrame, Series, Index
+from pandas.core.frame import _to_arrays, _convert_object_array
 from pandas.core.common import isnull
 from pandas.core.base import PandasObject
 from pandas.tseries.tools import to_datetime
@@ -92,6 +95,14 @@ def _handle_date_column(col, format=None):
             return to_datetime(col, coerce=True, format=format)
 
 
+def _chunk_bounds(nrows, chunksize=None):
+    """ the (start, stop) of each chunk of chunksize (default all) rows """
+    if chunksize is None:
+        chunksize = nrows
+    for start_i in range(0, nrows, chunksize):
+        yield start_i, min(start_i + chunksize, nrows)
+
+
 def _parse_date_columns(data_frame, parse_dates):
     """
     Force non-datetime columns to be read as such.
@@ -115,14 +126,74 @@ def _parse_date_columns(data_frame, parse_dates):
     return data_frame
 
 
-def _wrap_result(data, columns, index_col=None, coerce_float=True,
-                 parse_dates=None):
-    """Wrap result set of query in a DataFrame """
+def _date_columns(columns, parse_dates):
+    """ the (position, format) of each of the parse_dates columns """
+    if parse_dates is True or parse_dates is None or parse_dates is False:
+        parse_dates = []
+
+    if not hasattr(parse_dates, '__iter__'):
+        parse_dates = [parse_dates]
 
-    frame = DataFrame.from_records(data, columns=columns,
-                                   coerce_float=coerce_float)
+    for col_name in parse_dates:
+        if col_name not in columns:
+            raise KeyError(col_name)
+        try:
+            fmt = parse_dates[col_name]
+        except TypeError:
+            fmt = None
+        for i, name in enumerate(columns):
+            if name == col_name:
+                yield i, fmt
+
+
+def _convert_batch(data, columns, coerce_float=True, parse_dates=None):
+    """
+    Convert a batch of rows to a typed array per column, parsing the
+    parse_dates columns
+    """
+    if not isinstance(data, list):
+        data = list(data)
+    arrays, _ = _to_arrays(data, columns, coerce_float=coerce_float)
+    for i, fmt in _date_columns(columns, parse_dates):
+        arrays[i] = _handle_date_column(Series(arrays[i]), format=fmt).values
+    return arrays
 
-    _parse_date_columns(frame, parse_dates)
+
+def _concat_batches(batches, coerce_float=True):
+    """
+    Concatenate the typed arrays of the batches of a column; batches of
+    different types are converted again as a whole, as if read at once
+    """
+    if len(batches) == 1:
+        return batches[0]
+
+    dtypes = set(arr.dtype for arr in batches)
+    if len(dtypes) == 1 or all(issubclass(dtype.type, (np.integer, np.floating))
+                               for dtype in dtypes):
+        return np.concatenate(batches)
+
+    values = np.concatenate([Index(arr).asobject.values
+                             if com.is_datetime64_dtype(arr)
+                             else arr.astype(object) for arr in batches])
+    arrays, _ = _convert_object_array([values], None,
+                                      coerce_float=coerce_float)
+    return arrays[0]
+
+
+def _frame_from_batches(column_batches, columns, index_col=None,
+                        coerce_float=True, parse_dates=None):
+    """ the DataFrame of the converted batches of each column """
+    if not columns or not column_batches[0]:
+        frame = DataFrame.from_records([], columns=columns,
+                                       coerce_float=coerce_float)
+        _parse_date_columns(frame, parse_dates)
+    else:
+        arrays = []
+        while column_batches:
+            # release the batches of a column once concatenated
+            arrays.append(_concat_batches(column_batches.pop(0),
+                                          coerce_float=coerce_float))
+        frame = DataFrame._from_arrays(arrays, Index(columns), None)
 
     if index_col is not None:
         frame.set_index(index_col, inplace=True)
@@ -130,6 +201,52 @@ def _wrap_result(data, columns, index_col=None, coerce_float=True,
     return frame
 
 
+def _wrap_result(data, columns, index_col=None, coerce_float=True,
+                 parse_dates=None):
+    """Wrap result set of query in a DataFrame """
+
+    column_batches = [[] for _ in columns]
+    if len(data):
+        arrays = _convert_batch(data, columns, coerce_float=coerce_float,
+                                parse_dates=parse_dates)
+        for batches, arr in zip(column_batches, arrays):
+            batches.append(arr)
+
+    return _frame_from_batches(column_batches, columns, index_col=index_col,
+                               coerce_float=coerce_float,
+                               parse_dates=parse_dates)
+
+
+# the number of rows fetched from a cursor at a time
+_FETCH_BATCHSIZE = 10000
+
+
+def _fetch_result(fetchmany, columns, index_col=None, coerce_float=True,
+                  parse_dates=None, batchsize=None):
+    """
+    Read the result set of a cursor in a DataFrame. The rows are fetched
+    and converted to typed column arrays ``batchsize`` at a time, so only a
+    batch of rows is held as Python tuples at once
+    """
+
+    if batchsize is None:
+        batchsize = _FETCH_BATCHSIZE
+
+    column_batches = [[] for _ in columns]
+    while True:
+        data = fetchmany(batchsize)
+        if not data:
+            break
+        arrays = _convert_batch(data, columns, coerce_float=coerce_float,
+                                parse_dates=parse_dates)
+        for batches, arr in zip(column_batches, arrays):
+            batches.append(arr)
+
+    return _frame_from_batches(column_batches, columns, index_col=index_col,
+                               coerce_float=coerce_float,
+                               parse_dates=parse_dates)
+
+
 def execute(sql, con, cur=None, params=None):
     """
     Execute the given SQL query using the provided connection object.
@@ -323,21 +440,21 @@ def read_sql_table(table_name, con, schema=None, index_col=None,
     read_sql
 
     """
-    if not _is_sqlalchemy_engine(con):
+    if isinstance(con, SQLSession):
+        pandas_sql = con.pandas_sql
+    elif _is_sqlalchemy_engine(con):
+        pandas_sql = SQLDatabase(con, schema=schema)
+    else:
+        pandas_sql = None
+    if not isinstance(pandas_sql, SQLDatabase):
         raise NotImplementedError("read_sql_table only supported for "
                                   "SQLAlchemy engines.")
-    import sqlalchemy
-    from sqlalchemy.schema import MetaData
-    meta = MetaData(con, schema=schema)
-    try:
-        meta.reflect(only=[table_name])
-    except sqlalchemy.exc.InvalidRequestError:
-        raise ValueError("Table %s not found" % table_name)
 
-    pandas_sql = SQLDatabase(con, meta=meta)
+    pandas_sql.reflect_table(table_name, schema=schema)
     table = pandas_sql.read_table(
         table_name, index_col=index_col, coerce_float=coerce_float,
-        parse_dates=parse_dates, columns=columns, chunksize=chunksize)
+        parse_dates=parse_dates, columns=columns, schema=schema,
+        chunksize=chunksize)
 
     if table is not None:
         return table
@@ -472,7 +589,7 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
         _is_table_name = False
 
     if _is_table_name:
-        pandas_sql.meta.reflect(only=[sql])
+        pandas_sql.reflect_table(sql)
         return pandas_sql.read_table(
             sql, index_col=index_col, coerce_float=coerce_float,
             parse_dates=parse_dates, columns=columns, chunksize=chunksize)
@@ -484,7 +601,7 @@ def read_sql(sql, con, index_col=None, coerce_float=True, params=None,
 
 
 def to_sql(frame, name, con, flavor='sqlite', schema=None, if_exists='fail',
-           index=True, index_label=None, chunksize=None):
+           index=True, index_label=None, chunksize=None, insert_method=None):
     """
     Write records stored in a DataFrame to a SQL database.
 
@@ -517,10 +634,20 @@ def to_sql(frame, name, con, flavor='sqlite', schema=None, if_exists='fail',
     chunksize : int, default None
         If not None, then rows will be written in batches of this size at a
         time.  If None, all rows will be written at once.
+    insert_method : {None, 'multi', 'copy'}, default None
+        - None: insert one row per parameter set with ``executemany``.
+        - multi: insert many rows per statement, with a multi-row ``VALUES``
+          clause of as many rows as the parameter limit of the database
+          allows.
+        - copy: stream the rows as CSV to a ``COPY ... FROM STDIN``
+          statement. Only supported for PostgreSQL through psycopg2.
 
     """
     if if_exists not in ('fail', 'replace', 'append'):
         raise ValueError("'{0}' is not valid for if_exists".format(if_exists))
+    if insert_method not in _INSERT_METHODS:
+        raise ValueError("'{0}' is not valid for insert_method".format(
+            insert_method))
 
     pandas_sql = pandasSQL_builder(con, schema=schema, flavor=flavor)
 
@@ -531,7 +658,7 @@ def to_sql(frame, name, con, flavor='sqlite', schema=None, if_exists='fail',
 
     pandas_sql.to_sql(frame, name, if_exists=if_exists, index=index,
                       index_label=index_label, schema=schema,
-                      chunksize=chunksize)
+                      chunksize=chunksize, insert_method=insert_method)
 
 
 def has_table(table_name, con, flavor='sqlite', schema=None):
@@ -564,6 +691,17 @@ def has_table(table_name, con, flavor='sqlite', schema=None):
 table_exists = has_table
 
 
+_INSERT_METHODS = (None, 'multi', 'copy')
+
+# the maximum number of parameters of a statement, by database
+_MAX_PARAMS = {
+    'sqlite': 999,
+    'mssql': 2100,
+    'postgresql': 32767,
+    'mysql': 65535,
+}
+
+
 _MYSQL_WARNING = ("The 'mysql' flavor with DBAPI connection is deprecated "
                   "and will be removed in future versions. "
                   "MySQL will be further supported with SQLAlchemy engines.")
@@ -577,7 +715,9 @@ def pandasSQL_builder(con, flavor=None, schema=None, meta=None,
     """
     # When support for DBAPI connections is removed,
     # is_cursor should not be necessary.
-    if _is_sqlalchemy_engine(con):
+    if isinstance(con, SQLSession):
+        return con.pandas_sql
+    elif _is_sqlalchemy_engine(con):
         return SQLDatabase(con, schema=schema, meta=meta)
     else:
         if flavor == 'mysql':
@@ -643,10 +783,17 @@ class SQLTable(PandasObject):
         else:
             self._execute_create()
 
+    def _statement_key(self, *args):
+        """ identifies a statement on this table, by the table's columns """
+        columns = tuple((c.name, repr(c.type)) for c in self.table.columns)
+        return (self.name, self.schema, columns) + args
+
     def insert_statement(self):
-        return self.table.insert()
+        return self.pd_sql.statement(self._statement_key('insert'),
+                                     self.table.insert)
 
-    def insert_data(self):
+    def insert_frame(self):
+        """ the frame to insert, with the index as columns """
         if self.index is not None:
             temp = self.frame.copy()
             temp.index.names = self.index
@@ -657,6 +804,10 @@ class SQLTable(PandasObject):
                     "duplicate name in index/columns: {0}".format(err))
         else:
             temp = self.frame
+        return temp
+
+    def insert_data(self):
+        temp = self.insert_frame()
 
         column_names = list(map(str, temp.columns))
         ncols = len(column_names)
@@ -686,30 +837,80 @@ class SQLTable(PandasObject):
         data = [dict((k, v) for k, v in zip(keys, row)) for row in data_iter]
         conn.execute(self.insert_statement(), data)
 
-    def insert(self, chunksize=None):
-        keys, data_list = self.insert_data()
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        """ insert the rows with multi-row VALUES statements, of as many rows
+        as the parameter limit of the database allows """
+        data = [dict((k, v) for k, v in zip(keys, row)) for row in data_iter]
+        nrows = max(1, self.pd_sql.max_params // len(keys))
+        for i in range(0, len(data), nrows):
+            conn.execute(self.table.insert().values(data[i:i + nrows]))
+
+    def copy_statement(self, columns):
+        """ the COPY of the CSV rows of columns, with \\N as NULL """
+        preparer = self.pd_sql.engine.dialect.identifier_preparer
+        columns = ', '.join([preparer.quote(c) for c in columns])
+        return ("COPY %s (%s) FROM STDIN WITH CSV NULL '\\N'"
+                % (preparer.format_table(self.table), columns))
+
+    def _insert_copy(self, chunksize):
+        """ stream the rows to a COPY as CSV, a chunk of rows at a time """
+        if self.pd_sql.engine.dialect.name != 'postgresql':
+            raise ValueError("insert_method='copy' is only supported for "
+                             "PostgreSQL")
+
+        temp = self.insert_frame()
+        columns = list(map(str, temp.columns))
+        if any(com.is_timedelta64_dtype(col) for _, col in temp.iteritems()):
+            # the table stores timedeltas as integers (ns frequency)
+            temp = DataFrame(
+                dict((i, col.values.view('i8')
+                      if com.is_timedelta64_dtype(col) else col)
+                     for i, (_, col) in enumerate(temp.iteritems())),
+                index=temp.index, columns=lrange(len(columns)))
+
+        nrows = len(temp)
+        sql = self.copy_statement(columns)
+        with self.pd_sql.run_transaction() as conn:
+            cursor = conn.connection.cursor()
+            if not hasattr(cursor, 'copy_expert'):
+                raise ValueError("insert_method='copy' requires a psycopg2 "
+                                 "connection")
+            for start_i, end_i in _chunk_bounds(nrows, chunksize):
+                buf = StringIO()
+                temp.iloc[start_i:end_i].to_csv(
+                    buf, header=False, index=False, na_rep='\\N',
+                    date_format='%Y-%m-%d %H:%M:%S.%f')
+                buf.seek(0)
+                cursor.copy_expert(sql, buf)
+            cursor.close()
+
+    def insert(self, chunksize=None, insert_method=None):
+        if insert_method not in _INSERT_METHODS:
+            raise ValueError("'{0}' is not valid for insert_method".format(
+                insert_method))
 
         nrows = len(self.frame)
 
         if nrows == 0:
             return
 
-        if chunksize is None:
-            chunksize = nrows
-        elif chunksize == 0:
+        if chunksize == 0:
             raise ValueError('chunksize argument should be non-zero')
 
-        chunks = int(nrows / chunksize) + 1
+        if insert_method == 'copy':
+            return self._insert_copy(chunksize)
 
-        with self.pd_sql.run_transaction() as conn:
-            for i in range(chunks):
-                start_i = i * chunksize
-                end_i = min((i + 1) * chunksize, nrows)
-                if start_i >= end_i:
-                    break
+        if insert_method == 'multi':
+            execute_insert = self._execute_insert_multi
+        else:
+            execute_insert = self._execute_insert
+
+        keys, data_list = self.insert_data()
 
+        with self.pd_sql.run_transaction() as conn:
+            for start_i, end_i in _chunk_bounds(nrows, chunksize):
                 chunk_iter = zip(*[arr[start_i:end_i] for arr in data_list])
-                self._execute_insert(conn, keys, chunk_iter)
+                execute_insert(conn, keys, chunk_iter)
 
     def _query_iterator(self, result, chunksize, columns, coerce_float=True,
                         parse_dates=None):
@@ -718,10 +919,11 @@ class SQLTable(PandasObject):
         while True:
             data = result.fetchmany(chunksize)
             if not data:
+                result.close()
                 break
             else:
-                self.frame = DataFrame.from_records(
-                    data, columns=columns, coerce_float=coerce_float)
+                self.frame = _wrap_result(data, columns,
+                                          coerce_float=coerce_float)
 
                 self._harmonize_columns(parse_dates=parse_dates)
 
@@ -733,16 +935,22 @@ class SQLTable(PandasObject):
     def read(self, coerce_float=True, parse_dates=None, columns=None,
              chunksize=None):
 
-        if columns is not None and len(columns) > 0:
-            from sqlalchemy import select
-            cols = [self.table.c[n] for n in columns]
-            if self.index is not None:
-                [cols.insert(0, self.table.c[idx]) for idx in self.index[::-1]]
-            sql_select = select(cols)
-        else:
-            sql_select = self.table.select()
+        def build_select():
+            if columns is not None and len(columns) > 0:
+                from sqlalchemy import select
+                cols = [self.table.c[n] for n in columns]
+                if self.index is not None:
+                    [cols.insert(0, self.table.c[idx])
+                     for idx in self.index[::-1]]
+                return select(cols)
+            else:
+                return self.table.select()
+
+        key = self._statement_key('select', tuple(columns or ()),
+                                  tuple(self.index or ()))
+        sql_select = self.pd_sql.statement(key, build_select)
 
-        result = self.pd_sql.execute(sql_select)
+        result = self.pd_sql.execute_stream(sql_select)
         column_names = result.keys()
 
         if chunksize is not None:
@@ -750,9 +958,9 @@ class SQLTable(PandasObject):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            self.frame = DataFrame.from_records(
-                data, columns=column_names, coerce_float=coerce_float)
+            self.frame = _fetch_result(result.fetchmany, column_names,
+                                       coerce_float=coerce_float)
+            result.close()
 
             self._harmonize_columns(parse_dates=parse_dates)
 
@@ -970,6 +1178,11 @@ class SQLDatabase(PandasSQL):
 
         self.meta = meta
 
+    @property
+    def max_params(self):
+        """ the maximum number of parameters of a statement """
+        return _MAX_PARAMS.get(self.engine.dialect.name, 999)
+
     def run_transaction(self):
         return self.engine.begin()
 
@@ -977,6 +1190,12 @@ class SQLDatabase(PandasSQL):
         """Simple passthrough to SQLAlchemy engine"""
         return self.engine.execute(*args, **kwargs)
 
+    def execute_stream(self, *args, **kwargs):
+        """Execute with a server-side cursor, if the driver supports one, so
+        that the rows are fetched from the server as they are read"""
+        engine = self.engine.execution_options(stream_results=True)
+        return engine.execute(*args, **kwargs)
+
     def read_table(self, table_name, index_col=None, coerce_float=True,
                    parse_dates=None, columns=None, schema=None,
                    chunksize=None):
@@ -1034,6 +1253,7 @@ class SQLDatabase(PandasSQL):
         while True:
             data = result.fetchmany(chunksize)
             if not data:
+                result.close()
                 break
             else:
                 yield _wrap_result(data, columns, index_col=index_col,
@@ -1081,7 +1301,7 @@ class SQLDatabase(PandasSQL):
         """
         args = _convert_params(sql, params)
 
-        result = self.execute(*args)
+        result = self.execute_stream(*args)
         columns = result.keys()
 
         if chunksize is not None:
@@ -1090,16 +1310,18 @@ class SQLDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = result.fetchall()
-            frame = _wrap_result(data, columns, index_col=index_col,
-                                 coerce_float=coerce_float,
-                                 parse_dates=parse_dates)
+            frame = _fetch_result(result.fetchmany, columns,
+                                  index_col=index_col,
+                                  coerce_float=coerce_float,
+                                  parse_dates=parse_dates)
+            result.close()
             return frame
 
     read_sql = read_query
 
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None):
+               index_label=None, schema=None, chunksize=None,
+               insert_method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1125,13 +1347,19 @@ class SQLDatabase(PandasSQL):
         chunksize : int, default None
             If not None, then rows will be written in batches of this size at a
             time.  If None, all rows will be written at once.
+        insert_method : {None, 'multi', 'copy'}, default None
+            - None: insert one row per parameter set with ``executemany``.
+            - multi: insert many rows per statement, with a multi-row
+              ``VALUES`` clause.
+            - copy: stream the rows as CSV to a ``COPY ... FROM STDIN``
+              statement (PostgreSQL through psycopg2 only).
     
         """
         table = SQLTable(name, self, frame=frame, index=index,
                          if_exists=if_exists, index_label=index_label,
                          schema=schema)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, insert_method=insert_method)
         # check for potentially case sensitivity issues (GH7815)
         if name not in self.engine.table_names(schema=schema or self.meta.schema):
             warnings.warn("The provided table name '{0}' is not found exactly "
@@ -1153,6 +1381,21 @@ class SQLDatabase(PandasSQL):
         else:
             return self.meta.tables.get(table_name)
 
+    def reflect_table(self, table_name, schema=None):
+        """Reflect the table in the MetaData, unless it is there already"""
+        import sqlalchemy
+        schema = schema or self.meta.schema
+        if self.get_table(table_name, schema) is None:
+            try:
+                self.meta.reflect(only=[table_name], schema=schema)
+            except sqlalchemy.exc.InvalidRequestError:
+                raise ValueError("Table %s not found" % table_name)
+
+    def statement(self, key, build):
+        """The statement returned by build(), key identifies it for the
+        statement cache of a SQLSession"""
+        return build()
+
     def drop_table(self, table_name, schema=None):
         schema = schema or self.meta.schema
         if self.engine.has_table(table_name, schema):
@@ -1165,6 +1408,147 @@ class SQLDatabase(PandasSQL):
         return str(table.sql_schema())
 
 
+class CachedSQLDatabase(SQLDatabase):
+    """
+    A SQLDatabase that keeps the tables it reflected, whether the names it
+    looked up are tables, and its select and insert statements together
+    with their compiled form, to be reused by the calls of a SQLSession.
+
+    Parameters
+    ----------
+    engine : SQLAlchemy engine
+    schema : string, default None
+    meta : SQLAlchemy MetaData object, default None
+    cache_size : int, default 100
+        The number of statements, and of table name lookups, to keep.
+
+    """
+
+    def __init__(self, engine, schema=None, meta=None, cache_size=100):
+        from sqlalchemy.util import LRUCache
+        self.statements = LRUCache(cache_size)
+        self.compiled_cache = LRUCache(cache_size)
+        self.table_names = LRUCache(cache_size)
+        engine = engine.execution_options(compiled_cache=self.compiled_cache)
+        super(CachedSQLDatabase, self).__init__(engine, schema=schema,
+                                                meta=meta)
+
+    def statement(self, key, build):
+        try:
+            return self.statements[key]
+        except KeyError:
+            stmt = self.statements[key] = build()
+            return stmt
+
+    def has_table(self, name, schema=None):
+        if re.search(r'\s', name):
+            # read_sql looks up whole queries, which are never table names
+            return super(CachedSQLDatabase, self).has_table(name, schema)
+
+        key = name, schema or self.meta.schema
+        try:
+            return self.table_names[key]
+        except KeyError:
+            result = super(CachedSQLDatabase, self).has_table(name, schema)
+            self.table_names[key] = result
+            return result
+
+    def to_sql(self, frame, name, if_exists='fail', index=True,
+               index_label=None, schema=None, chunksize=None,
+               insert_method=None):
+        try:
+            super(CachedSQLDatabase, self).to_sql(
+                frame, name, if_exists=if_exists, index=index,
+                index_label=index_label, schema=schema, chunksize=chunksize,
+                insert_method=insert_method)
+        finally:
+            self.table_names.pop((name, schema or self.meta.schema), None)
+
+    def drop_table(self, table_name, schema=None):
+        super(CachedSQLDatabase, self).drop_table(table_name, schema)
+        self.table_names.pop((table_name, schema or self.meta.schema), None)
+
+    def clear_cache(self):
+        self.meta.clear()
+        self.statements.clear()
+        self.compiled_cache.clear()
+        self.table_names.clear()
+
+
+class SQLSession(PandasObject):
+    """
+    A session on a database, reused by many ``read_sql`` and ``to_sql``
+    calls. Pass it in place of the connection as ``con``.
+
+    With a SQLAlchemy engine the session keeps the reflected table schemas,
+    whether the names passed to ``read_sql`` are tables, and the select and
+    insert statements with their compiled form. Connections are taken from
+    the connection pool of the engine. A DBAPI2 connection is reused as is.
+
+    Parameters
+    ----------
+    con : SQLAlchemy engine or DBAPI2 connection (fallback mode)
+    flavor : {'sqlite', 'mysql'}, default 'sqlite'
+        The flavor of SQL to use. Ignored when using SQLAlchemy engine.
+    schema : string, default None
+        Name of SQL schema in database to use (if database flavor supports
+        this). If None, use default schema (default).
+    cache_size : int, default 100
+        The number of statements, and of table name lookups, to keep.
+
+    Notes
+    -----
+    Call ``clear_cache`` when tables are changed other than through the
+    session.
+
+    Examples
+    --------
+    >>> session = SQLSession(engine)
+    >>> for key in keys:
+    ...     df = read_sql_query('SELECT * FROM data WHERE key = %(key)s',
+    ...                         session, params={'key': key})
+
+    """
+
+    def __init__(self, con, flavor='sqlite', schema=None, cache_size=100):
+        self.con = con
+        if _is_sqlalchemy_engine(con):
+            self.pandas_sql = CachedSQLDatabase(con, schema=schema,
+                                                cache_size=cache_size)
+        else:
+            self.pandas_sql = pandasSQL_builder(con, flavor=flavor)
+
+    def read_sql(self, sql, **kwargs):
+        """Read SQL query or database table into a DataFrame, see
+        :func:`read_sql`"""
+        return read_sql(sql, self, **kwargs)
+
+    def read_sql_query(self, sql, **kwargs):
+        """Read SQL query into a DataFrame, see :func:`read_sql_query`"""
+        return read_sql_query(sql, self, **kwargs)
+
+    def read_sql_table(self, table_name, **kwargs):
+        """Read SQL database table into a DataFrame, see
+        :func:`read_sql_table`"""
+        return read_sql_table(table_name, self, **kwargs)
+
+    def to_sql(self, frame, name, **kwargs):
+        """Write records stored in a DataFrame to a SQL database, see
+        :func:`to_sql`"""
+        return to_sql(frame, name, self, **kwargs)
+
+    def has_table(self, table_name, schema=None):
+        return self.pandas_sql.has_table(table_name, schema)
+
+    def execute(self, sql, params=None):
+        return execute(sql, self, params=params)
+
+    def clear_cache(self):
+        """Forget the reflected tables and the statements"""
+        if isinstance(self.pandas_sql, CachedSQLDatabase):
+            self.pandas_sql.clear_cache()
+
+
 # ---- SQL without SQLAlchemy ---
 # Flavour specific sql strings and handler class for access to DBs without
 # SQLAlchemy installed
@@ -1234,7 +1618,7 @@ class SQLiteTable(SQLTable):
             for stmt in self.table:
                 conn.execute(stmt)
 
-    def insert_statement(self):
+    def insert_statement(self, nrows=1):
         names = list(map(str, self.frame.columns))
         flv = self.pd_sql.flavor
         br_l = _SQL_SYMB[flv]['br_l']  # left val quote char
@@ -1247,14 +1631,43 @@ class SQLiteTable(SQLTable):
         bracketed_names = [br_l + column + br_r for column in names]
         col_names = ','.join(bracketed_names)
         wildcards = ','.join([wld] * len(names))
-        insert_statement = 'INSERT INTO %s (%s) VALUES (%s)' % (
-            self.name, col_names, wildcards)
+        row_wildcards = ','.join(['(%s)' % wildcards] * nrows)
+        insert_statement = 'INSERT INTO %s (%s) VALUES %s' % (
+            self.name, col_names, row_wildcards)
         return insert_statement
 
     def _execute_insert(self, conn, keys, data_iter):
         data_list = list(data_iter)
         conn.executemany(self.insert_statement(), data_list)
 
+    def _execute_insert_multi(self, conn, keys, data_iter):
+        """ insert the rows with multi-row VALUES statements; for sqlite the
+        full statements are a single executemany of one prepared statement
+        """
+        data_list = list(data_iter)
+        nrows = max(1, self.pd_sql.max_params // len(keys))
+        nfull = len(data_list) // nrows * nrows
+
+        flatten = itertools.chain.from_iterable
+        batches = [list(flatten(data_list[i:i + nrows]))
+                   for i in range(0, nfull, nrows)]
+        if batches:
+            stmt = self.insert_statement(nrows)
+            if self.pd_sql.flavor == 'sqlite':
+                conn.executemany(stmt, batches)
+            else:
+                for batch in batches:
+                    conn.execute(stmt, batch)
+
+        rest = data_list[nfull:]
+        if rest:
+            conn.execute(self.insert_statement(len(rest)),
+                         list(flatten(rest)))
+
+    def _insert_copy(self, chunksize):
+        raise ValueError("insert_method='copy' is only supported for "
+                         "PostgreSQL through SQLAlchemy")
+
     def _create_table_setup(self):
         """
         Return a list of SQL statement that create a table reflecting the
@@ -1347,6 +1760,11 @@ class SQLiteDatabase(PandasSQL):
         else:
             self.flavor = flavor
 
+    @property
+    def max_params(self):
+        """ the maximum number of parameters of a statement """
+        return _MAX_PARAMS[self.flavor]
+
     @contextmanager
     def run_transaction(self):
         cur = self.con.cursor()
@@ -1409,22 +1827,16 @@ class SQLiteDatabase(PandasSQL):
                                         coerce_float=coerce_float,
                                         parse_dates=parse_dates)
         else:
-            data = self._fetchall_as_list(cursor)
+            frame = _fetch_result(cursor.fetchmany, columns,
+                                  index_col=index_col,
+                                  coerce_float=coerce_float,
+                                  parse_dates=parse_dates)
             cursor.close()
-
-            frame = _wrap_result(data, columns, index_col=index_col,
-                                 coerce_float=coerce_float,
-                                 parse_dates=parse_dates)
             return frame
 
-    def _fetchall_as_list(self, cur):
-        result = cur.fetchall()
-        if not isinstance(result, list):
-            result = list(result)
-        return result
-
     def to_sql(self, frame, name, if_exists='fail', index=True,
-               index_label=None, schema=None, chunksize=None):
+               index_label=None, schema=None, chunksize=None,
+               insert_method=None):
         """
         Write records stored in a DataFrame to a SQL database.
 
@@ -1448,12 +1860,16 @@ class SQLiteDatabase(PandasSQL):
         chunksize : int, default None
             If not None, then rows will be written in batches of this
             size at a time. If None, all rows will be written at once.
+        insert_method : {None, 'multi'}, default None
+            - None: insert one row per parameter set with ``executemany``.
+            - multi: insert many rows per statement, with a multi-row
+              ``VALUES`` clause.
 
         """
         table = SQLiteTable(name, self, frame=frame, index=index,
                             if_exists=if_exists, index_label=index_label)
         table.create()
-        table.insert(chunksize)
+        table.insert(chunksize, insert_method=insert_method)
 
     def has_table(self, name, schema=None):
         flavor_map = {
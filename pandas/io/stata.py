@@ -12,6 +12,7 @@ http://statsmodels.sourceforge.net/devel/
 import numpy as np
 
 import sys
+import mmap
 import struct
 from dateutil.relativedelta import relativedelta
 from pandas.core.base import StringMixin
@@ -29,7 +30,8 @@ from pandas.tslib import NaT, Timestamp
 
 def read_stata(filepath_or_buffer, convert_dates=True,
                convert_categoricals=True, encoding=None, index=None,
-               convert_missing=False, preserve_dtypes=True, columns=None):
+               convert_missing=False, preserve_dtypes=True, columns=None,
+               chunksize=None, iterator=False, memory_map=False):
     """
     Read Stata file into DataFrame
 
@@ -58,8 +60,27 @@ def read_stata(filepath_or_buffer, convert_dates=True,
     columns : list or None
         Columns to retain.  Columns will be returned in the given order.  None
         returns all columns
+    chunksize : int, default None
+        Return StataReader object for iteration, returns chunks with
+        given number of lines
+    iterator : boolean, default False
+        Return StataReader object, to read the data with ``read`` or
+        ``get_chunk``
+    memory_map : boolean, default False
+        Memory map the file, rather than reading the observations into
+        memory
+
+    Returns
+    -------
+    DataFrame or StataReader
     """
-    reader = StataReader(filepath_or_buffer, encoding)
+    reader = StataReader(filepath_or_buffer, encoding, chunksize=chunksize,
+                         memory_map=memory_map)
+
+    if iterator or chunksize:
+        reader._setup_read(convert_dates, convert_categoricals, index,
+                           convert_missing, preserve_dtypes, columns)
+        return reader
 
     return reader.data(convert_dates, convert_categoricals, index,
                        convert_missing, preserve_dtypes, columns)
@@ -661,15 +682,28 @@ class StataReader(StataParser):
     encoding : string, None or encoding
         Encoding used to parse the files. Note that Stata doesn't
         support unicode. None defaults to cp1252.
+    chunksize : int, default None
+        The number of observations of the chunks returned when iterating
+        over the reader, see ``get_chunk``
+    memory_map : boolean, default False
+        Memory map the file, if it has a file descriptor, rather than
+        reading the observations into memory
     """
 
-    def __init__(self, path_or_buf, encoding='cp1252'):
+    def __init__(self, path_or_buf, encoding='cp1252', chunksize=None,
+                 memory_map=False):
         super(StataReader, self).__init__(encoding)
         self.col_sizes = ()
         self._has_string_data = False
         self._missing_values = False
         self._data_read = False
         self._value_labels_read = False
+        self._lines_read = 0
+        self._mmap = None
+        if chunksize is not None and (not com.is_integer(chunksize) or
+                                      chunksize <= 0):
+            raise ValueError("chunksize must be a positive integer")
+        self.chunksize = chunksize
         if isinstance(path_or_buf, str):
             path_or_buf, encoding = get_filepath_or_buffer(
                 path_or_buf, encoding=self._default_encoding
@@ -680,6 +714,14 @@ class StataReader(StataParser):
         else:
             self.path_or_buf = path_or_buf
 
+        if memory_map:
+            try:
+                self._mmap = mmap.mmap(self.path_or_buf.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            except (AttributeError, IOError, OSError, ValueError):
+                # not a file with a descriptor, read it instead
+                self._mmap = None
+
         self._read_header()
 
     def _read_header(self):
@@ -917,12 +959,11 @@ class StataReader(StataParser):
         if self.format_version >= 117:
             self.path_or_buf.seek(self.seek_value_labels)
         else:
-            if not self._data_read:
-                raise Exception("Data has not been read. Because of the "
-                                "layout of Stata files, this is necessary "
-                                "before reading value labels.")
             if self._value_labels_read:
                 raise Exception("Value labels have already been read.")
+            # the value labels follow the data
+            self.path_or_buf.seek(self.data_location +
+                                  self.nobs * sum(self.col_sizes))
 
         self.value_label_dict = dict()
 
@@ -1010,6 +1051,15 @@ class StataReader(StataParser):
         -------
         y : DataFrame instance
         """
+        self._setup_read(convert_dates, convert_categoricals, index,
+                         convert_missing, preserve_dtypes, columns)
+        return self._read_chunk(self.nobs)
+
+    def _setup_read(self, convert_dates=True, convert_categoricals=True,
+                    index=None, convert_missing=False, preserve_dtypes=True,
+                    columns=None):
+        """ check the options of reading the data, and read the metadata
+        they need """
         self._missing_values = convert_missing
         if self._data_read:
             raise Exception("Data has already been read.")
@@ -1018,34 +1068,22 @@ class StataReader(StataParser):
         if self.format_version >= 117:
             self._read_strls()
 
-        # Read data
-        count = self.nobs
         dtype = []  # Convert struct data types to numpy data type
         for i, typ in enumerate(self.typlist):
             if typ in self.NUMPY_TYPE_MAP:
                 dtype.append(('s' + str(i), self.NUMPY_TYPE_MAP[typ]))
             else:
                 dtype.append(('s' + str(i), 'S' + str(typ)))
-        dtype = np.dtype(dtype)
-        read_len = count * dtype.itemsize
-        self.path_or_buf.seek(self.data_location)
-        data = np.frombuffer(self.path_or_buf.read(read_len),dtype=dtype,count=count)
-        self._data_read = True
+        self._dtype = np.dtype(dtype)
 
-        if convert_categoricals:
+        if convert_categoricals and not self._value_labels_read:
             self._read_value_labels()
 
-        if len(data)==0:
-            data = DataFrame(columns=self.varlist, index=index)
-        else:
-            data = DataFrame.from_records(data, index=index)
-            data.columns = self.varlist
-
         if columns is not None:
             column_set = set(columns)
             if len(column_set) != len(columns):
                 raise ValueError('columns contains duplicate entries')
-            unmatched = column_set.difference(data.columns)
+            unmatched = column_set.difference(self.varlist)
             if unmatched:
                 raise ValueError('The following columns were not found in the '
                                  'Stata data set: ' +
@@ -1055,21 +1093,158 @@ class StataReader(StataParser):
             typlist = []
             fmtlist = []
             lbllist = []
-            matched = set()
-            for i, col in enumerate(data.columns):
+            for i, col in enumerate(self.varlist):
                 if col in column_set:
-                    matched.update([col])
                     dtyplist.append(self.dtyplist[i])
                     typlist.append(self.typlist[i])
                     fmtlist.append(self.fmtlist[i])
                     lbllist.append(self.lbllist[i])
 
-            data = data[columns]
             self.dtyplist = dtyplist
             self.typlist = typlist
             self.fmtlist = fmtlist
             self.lbllist = lbllist
 
+        self._read_options = dict(convert_dates=convert_dates,
+                                  convert_categoricals=convert_categoricals,
+                                  index=index,
+                                  preserve_dtypes=preserve_dtypes,
+                                  columns=columns)
+        self._unlabeled = None
+
+    def read(self, nrows=None):
+        """
+        Reads the next nrows observations, with the options given to
+        read_stata
+
+        Parameters
+        ----------
+        nrows : int, default None
+            The number of observations to read, None reads the remaining
+            observations
+
+        Returns
+        -------
+        y : DataFrame instance
+        """
+        if not self._data_read:
+            self._setup_read()
+        if self._lines_read >= self.nobs and (self.nobs or self._lines_read):
+            raise StopIteration
+        if nrows is None:
+            nrows = self.nobs
+        if (self._unlabeled is None and
+                self._read_options['convert_categoricals'] and
+                (self._lines_read or nrows < self.nobs)):
+            # the data is read in several chunks
+            self._unlabeled = self._scan_unlabeled()
+        data = self._read_chunk(nrows)
+        if not self.nobs:
+            # an empty data set is read once
+            self._lines_read = 1
+        return data
+
+    def get_chunk(self, size=None):
+        """
+        Reads the next chunk of observations
+
+        Parameters
+        ----------
+        size : int, default None
+            The number of observations, defaults to the chunksize of the
+            reader
+
+        Returns
+        -------
+        y : DataFrame instance
+        """
+        if size is None:
+            size = self.chunksize
+        return self.read(nrows=size)
+
+    def __iter__(self):
+        try:
+            if self.chunksize:
+                while True:
+                    yield self.get_chunk()
+            else:
+                yield self.read()
+        except StopIteration:
+            pass
+
+    def close(self):
+        """ close the file """
+        self._mmap = None
+        self.path_or_buf.close()
+
+    def _read_records(self, start, count):
+        """ read count observations from start as a record array """
+        dtype = self._dtype
+        offset = self.data_location + start * dtype.itemsize
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        elif self._mmap is not None:
+            return np.frombuffer(self._mmap, dtype=dtype, count=count,
+                                 offset=offset)
+        read_len = count * dtype.itemsize
+        self.path_or_buf.seek(offset)
+        return np.frombuffer(self.path_or_buf.read(read_len), dtype=dtype,
+                             count=count)
+
+    def _scan_unlabeled(self):
+        """ the sorted values without a value label of each labeled column
+        over the whole data set, so that all the chunks get the same
+        categories """
+        names = self._read_options['columns'] or self.varlist
+        unlabeled = {}
+        for i, name in enumerate(names):
+            if self.lbllist[i] in self.value_label_dict:
+                unlabeled[i] = set()
+        if not unlabeled:
+            return unlabeled
+
+        step = max(self.chunksize or 0, 100000)
+        for start in range(0, self.nobs, step):
+            records = self._read_records(start, min(step, self.nobs - start))
+            for i in unlabeled:
+                field = 's%d' % self.varlist.index(names[i])
+                values = np.unique(records[field])
+                fmt = self.typlist[i]
+                if fmt in self.VALID_RANGE:
+                    # missing values are not categories
+                    nmin, nmax = self.VALID_RANGE[fmt]
+                    values = values[(values >= nmin) & (values <= nmax)]
+                value_labels = list(self.value_label_dict[self.lbllist[i]])
+                values = values[~np.in1d(values, value_labels)]
+                unlabeled[i].update(values.tolist())
+
+        return dict((i, np.array(sorted(values)))
+                    for i, values in compat.iteritems(unlabeled))
+
+    def _read_chunk(self, nrows):
+        """ read and convert the next nrows observations """
+        options = self._read_options
+        convert_dates = options['convert_dates']
+        convert_categoricals = options['convert_categoricals']
+        index = options['index']
+        preserve_dtypes = options['preserve_dtypes']
+        columns = options['columns']
+
+        # Read data
+        start = self._lines_read
+        count = max(min(nrows, self.nobs - start), 0)
+        data = self._read_records(start, count)
+        self._lines_read += count
+
+        if len(data)==0:
+            data = DataFrame(columns=self.varlist, index=index)
+        else:
+            data = DataFrame.from_records(data, index=index)
+            data.columns = self.varlist
+
+        if columns is not None:
+            data = data[columns]
+
         for col, typ in zip(data, self.typlist):
             if type(typ) is int:
                 data[col] = data[col].apply(self._null_terminate, convert_dtype=True,)
@@ -1139,12 +1314,27 @@ class StataReader(StataParser):
             )[0]
             for i in cols:
                 col = data.columns[i]
-                labeled_data = np.copy(data[col])
-                labeled_data = labeled_data.astype(object)
-                for k, v in compat.iteritems(
-                        self.value_label_dict[self.lbllist[i]]):
-                    labeled_data[(data[col] == k).values] = v
-                data[col] = Categorical.from_array(labeled_data)
+                value_labels = self.value_label_dict[self.lbllist[i]]
+                values = data[col].values
+                labeled_data = values.astype(object)
+                labeled = isnull(values)
+                for k, v in compat.iteritems(value_labels):
+                    mask = values == k
+                    labeled_data[mask] = v
+                    labeled |= mask
+
+                # the categories are the value labels, in the order of their
+                # values, followed by the values without a label, found in
+                # the whole data set when it is read in chunks
+                categories = []
+                for k in sorted(value_labels):
+                    if value_labels[k] not in categories:
+                        categories.append(value_labels[k])
+                if self._unlabeled is not None:
+                    categories.extend(self._unlabeled[i])
+                else:
+                    categories.extend(np.unique(values[~labeled]))
+                data[col] = Categorical(labeled_data, categories=categories)
 
         if not preserve_dtypes:
             retyped_data = []
@@ -1161,6 +1351,11 @@ class StataReader(StataParser):
             if convert:
                 data = DataFrame.from_items(retyped_data)
 
+        if index is None and start:
+            # number the observations as in the data set; the conversions
+            # above align on the default index
+            data.index = np.arange(start, start + count)
+
         return data
 
     def data_label(self):
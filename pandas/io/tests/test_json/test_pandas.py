@@ -627,3 +627,118 @@ class TestPandasContainer(tm.TestCase):
             raise TypeError("raisin")
         self.assertRaises(TypeError, frame.to_json,
                           default_handler=my_handler_raises)
+
+    def test_to_json_lines(self):
+        df = DataFrame([[1, 'a,b'], [2, '{"c": [3]}']], columns=['x', 'y'])
+        result = df.to_json(orient='records', lines=True)
+        expected = ('{"x":1,"y":"a,b"}\n'
+                    '{"x":2,"y":"{\\"c\\": [3]}"}\n')
+        self.assertEqual(result, expected)
+
+        s = Series([[1, 2], {'a': 1}, 'x'])
+        self.assertEqual(s.to_json(orient='records', lines=True),
+                         '[1,2]\n{"a":1}\n"x"\n')
+
+        self.assertEqual(self.empty_frame.to_json(orient='records',
+                                                  lines=True), '')
+        self.assertRaises(ValueError, df.to_json, orient='split',
+                          lines=True)
+
+    def test_to_json_chunksize(self):
+        frames = [self.frame, self.intframe, self.tsframe, self.mixed_frame,
+                  self.empty_frame,
+                  DataFrame({'a': ['x', None, 'z'], 'b': [1.5, np.nan, 3]},
+                            index=pd.date_range('2000-01-01', periods=3))]
+        for df in frames:
+            for orient in ['records', 'split', 'values']:
+                expected = df.to_json(orient=orient, date_format='iso')
+                for chunksize in [1, 7, 100]:
+                    result = df.to_json(orient=orient, date_format='iso',
+                                        chunksize=chunksize)
+                    self.assertEqual(result, expected)
+
+            expected = df.to_json(orient='records', lines=True)
+            result = df.to_json(orient='records', lines=True, chunksize=7)
+            self.assertEqual(result, expected)
+
+        for s in [self.ts, self.series, self.objSeries]:
+            for orient in ['records', 'split']:
+                expected = s.to_json(orient=orient)
+                result = s.to_json(orient=orient, chunksize=3)
+                self.assertEqual(result, expected)
+
+        with ensure_clean('test.json') as path:
+            self.frame.to_json(path, orient='split', chunksize=4)
+            result = read_json(path, orient='split')
+            assert_frame_equal(result, self.frame)
+
+        self.assertRaises(ValueError, self.frame.to_json, chunksize=4)
+        self.assertRaises(ValueError, self.frame.to_json, orient='records',
+                          chunksize=0)
+
+    def test_read_json_lines(self):
+        data = ('{"a": 1, "b": "x", "c": true, "d": 1.5}\n'
+                '{"a": 2, "b": "y,z", "c": false, "d": 2}\n'
+                '\n'
+                '{"a": 3, "b": null, "c": true}\n')
+        expected = DataFrame({'a': [1, 2, 3], 'b': ['x', 'y,z', None],
+                              'c': [True, False, True],
+                              'd': [1.5, 2, np.nan]})
+        result = read_json(data, lines=True)
+        assert_frame_equal(result, expected)
+
+        result = read_json(StringIO(data), lines=True)
+        assert_frame_equal(result, expected)
+
+        # round trip
+        result = read_json(self.frame.to_json(orient='records', lines=True),
+                           lines=True)
+        assert_frame_equal(result, self.frame.reset_index(drop=True))
+
+        # ints mixed with floats, missing keys, bools mixed with missing
+        # values and nested objects
+        data = ('{"i": 1, "f": 1, "b": true, "n": [1, 2]}\n'
+                '{"f": 2.5, "n": {"x": 1}}\n'
+                '{"i": 3, "f": 3, "b": null, "n": null}\n')
+        result = read_json(data, lines=True, dtype=False)
+        self.assertEqual(result.columns.tolist(), ['b', 'f', 'i', 'n'])
+        self.assertEqual(result['f'].dtype, np.float64)
+        self.assertEqual(result['i'].dtype, np.float64)
+        self.assertTrue(np.isnan(result['i'][1]))
+        self.assertEqual(result['b'].dtype, np.object_)
+        self.assertEqual(result['b'].tolist()[0], True)
+        self.assertEqual(result['n'].tolist()[:2], [[1, 2], {'x': 1}])
+
+        result = read_json('1\n2\n3\n', lines=True, typ='series')
+        assert_series_equal(result, Series([1, 2, 3]))
+
+        self.assertRaises(ValueError, read_json, data, lines=True,
+                          orient='split')
+        self.assertRaises(ValueError, read_json, data, chunksize=2)
+
+    def test_read_json_lines_chunksize(self):
+        df = DataFrame({'a': lrange(10), 'b': list('abcdefghij')})
+        data = df.to_json(orient='records', lines=True)
+
+        reader = read_json(StringIO(data), lines=True, chunksize=4)
+        chunks = list(reader)
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        assert_frame_equal(chunks[1], df[4:8])
+        result = pd.concat(chunks)
+        assert_frame_equal(result, df)
+        assert_frame_equal(result, read_json(StringIO(data), lines=True))
+
+        reader = read_json(data, lines=True, chunksize=3)
+        assert_frame_equal(reader.get_chunk(), df[:3])
+        assert_frame_equal(reader.get_chunk(5), df[3:8])
+        assert_frame_equal(reader.read(), df[8:])
+        self.assertIsNone(reader.get_chunk())
+
+        with ensure_clean('test.json') as path:
+            df.to_json(path, orient='records', lines=True)
+            reader = read_json(path, lines=True, chunksize=5)
+            result = pd.concat(reader, ignore_index=True)
+            assert_frame_equal(result, df)
+
+        self.assertRaises(ValueError, read_json, data, lines=True,
+                          chunksize=0)
@@ -385,6 +385,83 @@ class TestNDFrame(TestPackers):
         result = self.encode_decode(df)
         assert_frame_equal(result, df)
 
+class TestContainer(TestPackers):
+
+    def setUp(self):
+        super(TestContainer, self).setUp()
+        self.frame = DataFrame({'A': np.arange(10.),
+                                'B': np.arange(10),
+                                'C': ['foo%d' % i for i in range(10)],
+                                'D': date_range('20130101', periods=10)})
+
+    def test_roundtrip(self):
+        l = [self.frame, self.frame.A, np.arange(5), 'foo', None]
+        for write_kwargs, read_kwargs in [({}, {}),
+                                          ({'compress': 'zlib'}, {}),
+                                          ({}, {'memory_map': False})]:
+            with ensure_clean(self.path) as path:
+                to_msgpack(path, *l, container=True, **write_kwargs)
+                result = read_msgpack(path, **read_kwargs)
+                check_arbitrary(result[:2], l[:2])
+                tm.assert_numpy_array_equal(result[2], l[2])
+                self.assertEqual(result[3:], l[3:])
+
+        result = read_msgpack(self.frame.to_msgpack(container=True))
+        assert_frame_equal(result, self.frame)
+
+    def test_views(self):
+        # uncompressed arrays are views of the file, and writable
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, self.frame, container=True)
+            result = read_msgpack(path)
+            assert_frame_equal(result, self.frame)
+            for b in result._data.blocks:
+                if b.dtype != np.object_:
+                    self.assertFalse(b.values.flags.owndata)
+            result.iloc[0, 0] = 100.
+            assert_frame_equal(read_msgpack(path), self.frame)
+
+    def test_chunks(self):
+        from pandas.io.packers import MsgpackContainer
+
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, self.frame, self.frame.B, np.arange(3),
+                       container=True, chunksize=4)
+            with MsgpackContainer(path) as store:
+                self.assertEqual(len(store), 3)
+                self.assertEqual(store.nchunks(0), 3)
+                self.assertEqual(store.nrows(0), 10)
+                self.assertEqual(store.nrows(2), None)
+
+                assert_frame_equal(store.read(0), self.frame)
+                assert_frame_equal(store.read(0, chunk=1),
+                                   self.frame.iloc[4:8])
+                assert_frame_equal(store.read(0, chunk=[1, 2]),
+                                   self.frame.iloc[4:])
+                assert_series_equal(store.read(1, chunk=-1),
+                                    self.frame.B.iloc[8:])
+                for i, chunk in enumerate(store.iter_chunks(1)):
+                    assert_series_equal(chunk,
+                                        self.frame.B.iloc[i * 4:i * 4 + 4])
+                tm.assert_numpy_array_equal(store.read(2), np.arange(3))
+                self.assertRaises(IndexError, store.read, 3)
+
+            for i, packed in enumerate(read_msgpack(path, iterator=True)):
+                if i == 0:
+                    assert_frame_equal(packed, self.frame)
+
+        self.assertRaises(ValueError, to_msgpack, None, self.frame,
+                          chunksize=4)
+
+    def test_append(self):
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, self.frame, container=True)
+            to_msgpack(path, self.frame.A, container=True, append=True)
+            result = read_msgpack(path)
+            assert_frame_equal(result[0], self.frame)
+            assert_series_equal(result[1], self.frame.A)
+
+
 class TestSparse(TestPackers):
 
     def _check_roundtrip(self, obj, comparator, **kwargs):
@@ -24,6 +24,7 @@ from pandas.io.parsers import (read_csv, read_table, read_fwf,
 
 import pandas.util.testing as tm
 import pandas as pd
+import pandas.core.common as com
 
 from pandas.compat import parse_date
 import pandas.lib as lib
@@ -904,6 +905,56 @@ c,4,5
         self.assertIsInstance(df.index[0], (datetime, np.datetime64, Timestamp))
         tm.assert_frame_equal(df, expected)
 
+    def test_parse_dates_iso8601(self):
+        data = """date,A
+2012-01-01 09:00:00,1
+2012-01-02 10:30:00.500,2
+,3
+NaN,4
+2012-01-05T23:59:59,5
+"""
+        df = self.read_csv(StringIO(data), parse_dates=['date'])
+        self.assertEqual(df['date'].dtype, 'M8[ns]')
+        expected = tools.to_datetime(['2012-01-01 09:00:00',
+                                      '2012-01-02 10:30:00.500', None, None,
+                                      '2012-01-05T23:59:59'])
+        tm.assert_numpy_array_equal(df['date'].values, expected.values)
+
+        df = self.read_csv(StringIO(data), index_col='date', parse_dates=True)
+        self.assertIsInstance(df.index, DatetimeIndex)
+        tm.assert_numpy_array_equal(df.index.values, expected.values)
+
+        # values that are not ISO 8601 fall back to the date converter
+        data = """date,A
+2012-01-01,1
+01/02/2012,2
+"""
+        df = self.read_csv(StringIO(data), parse_dates=['date'])
+        expected = tools.to_datetime(['2012-01-01', '2012-01-02'])
+        tm.assert_numpy_array_equal(df['date'].values, expected.values)
+
+    def test_parse_dates_date_format(self):
+        data = """date,A
+31/01/2012 09:00,1
+01/02/2012 10:30,2
+,3
+"""
+        df = self.read_csv(StringIO(data), parse_dates=['date'],
+                           date_format='%d/%m/%Y %H:%M')
+        expected = tools.to_datetime(['2012-01-31 09:00', '2012-02-01 10:30',
+                                      None])
+        tm.assert_numpy_array_equal(df['date'].values, expected.values)
+
+        # formats the C parser cannot handle natively
+        data = """date,A
+31 Jan 2012,1
+01 Feb 2012,2
+"""
+        df = self.read_csv(StringIO(data), parse_dates=['date'],
+                           date_format='%d %b %Y')
+        expected = tools.to_datetime(['2012-01-31', '2012-02-01'])
+        tm.assert_numpy_array_equal(df['date'].values, expected.values)
+
     def test_parse_dates_string(self):
         data = """date,A,B,C
 20090101,a,1,2
@@ -1170,6 +1221,72 @@ baz,7,8,9
         tm.assert_frame_equal(chunks[1], df[2:4])
         tm.assert_frame_equal(chunks[2], df[4:])
 
+    def test_read_where(self):
+        data = """A,B,C
+1,a,3.5
+2,b,4.5
+3,c,5.5
+4,d,6.5
+5,e,7.5
+6,f,8.5
+7,g,9.5"""
+        df = self.read_csv(StringIO(data))
+
+        chunksize = parsers._WHERE_CHUNKSIZE
+        try:
+            for n in [2, 3, chunksize]:
+                parsers._WHERE_CHUNKSIZE = n
+
+                result = self.read_csv(StringIO(data), where='A % 2 == 1')
+                tm.assert_frame_equal(result, df[df.A % 2 == 1])
+
+                result = self.read_csv(StringIO(data),
+                                       where=lambda x: x.C > 5)
+                tm.assert_frame_equal(result, df[df.C > 5])
+
+                result = self.read_csv(StringIO(data), where='A > 10')
+                tm.assert_frame_equal(result, df[df.A > 10])
+
+                result = self.read_csv(StringIO(data), where='A > 2',
+                                       nrows=5)
+                tm.assert_frame_equal(result, df[:5][df.A[:5] > 2])
+
+                result = self.read_csv(StringIO(data), where='A > 2',
+                                       index_col='B')
+                expected = df.set_index('B')
+                tm.assert_frame_equal(result, expected[expected.A > 2])
+        finally:
+            parsers._WHERE_CHUNKSIZE = chunksize
+
+        # chunks count the rows read from the file
+        reader = self.read_csv(StringIO(data), where='A != 2', chunksize=3)
+        chunks = list(reader)
+        self.assertEqual(len(chunks), 3)
+        tm.assert_frame_equal(chunks[0], df.iloc[[0, 2]])
+        tm.assert_frame_equal(chunks[1], df.iloc[3:6])
+        tm.assert_frame_equal(chunks[2], df.iloc[6:])
+
+        # variables of the calling scope
+        threshold = 4
+        result = read_csv(StringIO(data), where='A > @threshold')
+        tm.assert_frame_equal(result, df[df.A > threshold])
+        result = read_table(StringIO(data), sep=',',
+                            where='A > @threshold and index < 5')
+        tm.assert_frame_equal(result, df[4:5])
+
+        # wrappers pass the variables of their caller
+        result = self.read_csv(StringIO(data), where='A < @threshold',
+                               where_locals={'threshold': threshold})
+        tm.assert_frame_equal(result, df[df.A < threshold])
+
+        def wrapper(where):
+            threshold = 0
+            return read_csv(StringIO(data), where=where)
+        result = wrapper('A > @threshold')
+        tm.assert_frame_equal(result, df)
+
+        self.assertRaises(TypeError, self.read_csv, StringIO(data), where=1)
+
     def test_get_chunk_passed_chunksize(self):
         data = """A,B,C
 1,2,3
@@ -3217,6 +3334,133 @@ one,two
         self.assertEqual(result['one'].dtype, 'u1')
         self.assertEqual(result['two'].dtype, 'S1')
 
+    def test_categorical_dtype(self):
+        data = """a,b,c
+1,a,3.4
+1,a,3.4
+2,b,4.5
+3,,5.6
+4,c,
+5,a,7.8"""
+        expected = self.read_csv(StringIO(data))
+        expected['b'] = expected['b'].astype('category')
+
+        # chunks have different categories
+        result = self.read_csv(StringIO(data), dtype={'b': 'category'})
+        self.assertTrue(com.is_categorical_dtype(result['b']))
+        tm.assert_frame_equal(result, expected)
+
+        result = read_csv(StringIO(data), dtype={'b': 'category'},
+                          engine='c', low_memory=False)
+        tm.assert_frame_equal(result, expected)
+
+        result = self.read_csv(StringIO(data), dtype={1: 'category'})
+        tm.assert_frame_equal(result, expected)
+
+        expected = self.read_csv(StringIO(data), dtype=object)
+        expected = expected.apply(lambda x: x.astype('category'))
+        result = self.read_csv(StringIO(data), dtype='category')
+        tm.assert_frame_equal(result, expected)
+
+        # numpy dtypes mixed with categories
+        result = self.read_csv(StringIO(data),
+                               dtype={'a': np.float64, 'b': 'category',
+                                      'c': np.dtype('f8')})
+        self.assertEqual(result['a'].dtype, np.float64)
+        self.assertTrue(com.is_categorical_dtype(result['b']))
+        result = self.read_csv(StringIO(data), dtype=np.dtype('O'))
+        self.assertTrue((result.dtypes == object).all())
+
+    def test_infer_schema_rows(self):
+        # the 2 row sample is the first chunk, later chunks keep its dtypes
+        data = 'a,b,c\n1,x,1.5\n2,y,\n3,5,3\n4,6,4.5\n'
+        expected = self.read_csv(StringIO(data), dtype={'b': object})
+
+        result = self.read_csv(StringIO(data), infer_schema_rows=2)
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(result['b'].tolist(), ['x', 'y', '5', '6'])
+
+        reader = self.read_csv(StringIO(data), infer_schema_rows=2,
+                               chunksize=2)
+        chunks = list(reader)
+        self.assertEqual(chunks[1]['b'].tolist(), ['5', '6'])
+        self.assertEqual(chunks[1]['c'].dtype, np.float64)
+        tm.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+        data = 'a,b\n1,x\n2,y\n3.5,z\n'
+        with tm.assertRaisesRegexp(ValueError, "Unable to parse column 'a'"):
+            self.read_csv(StringIO(data), infer_schema_rows=2)
+
+        result = self.read_csv(StringIO(data), infer_schema_rows=2,
+                               infer_schema_errors='infer')
+        tm.assert_frame_equal(result, read_csv(StringIO(data)))
+
+        self.assertRaises(ValueError, self.read_csv, StringIO(data),
+                          infer_schema_rows=0)
+        self.assertRaises(ValueError, self.read_csv, StringIO(data),
+                          infer_schema_rows=2, infer_schema_errors='coerce')
+
+    def test_fwf_c_engine(self):
+        data = """\
+A     B        C    D
+1     a,b      3.5  2011-01-01
+
+# comment
+20~~~ c        -1   2011-01-02
+ 300  d   # e  7.25
+4     NA       nan  2011-01-04
+"""
+        def check(**kwds):
+            expected = read_fwf(StringIO(data), engine='python', **kwds)
+            result = read_fwf(StringIO(data), engine='c', buffer_lines=2,
+                              **kwds)
+            tm.assert_frame_equal(result, expected)
+
+        colspecs = [(0, 6), (6, 15), (15, 20), (20, None)]
+        check(colspecs=colspecs)
+        check(widths=[6, 9, 5, 10])
+        check(colspecs=colspecs, delimiter=' ~')
+        check(colspecs=colspecs, delimiter=' ~', comment='#')
+        check(colspecs=colspecs, comment='#', usecols=['A', 'C'])
+        check(colspecs=colspecs, comment='#', na_values=['a,b'],
+              header=None, skiprows=1)
+        check(colspecs=colspecs, delimiter=' ~', comment='#',
+              parse_dates=['D'])
+        check(delimiter=' ~', comment='#')
+
+        expected = read_fwf(StringIO(data), colspecs=colspecs,
+                            delimiter=' ~', comment='#', engine='python')
+        expected['A'] = expected['A'].astype(np.float32)
+        result = read_fwf(StringIO(data), colspecs=colspecs, delimiter=' ~',
+                          comment='#', dtype={'A': np.float32})
+        tm.assert_frame_equal(result, expected)
+
+        expected = read_fwf(StringIO(data), colspecs=colspecs, comment='#',
+                            engine='python')
+        reader = read_fwf(StringIO(data), colspecs=colspecs, comment='#',
+                          chunksize=2)
+        result = pd.concat(list(reader), ignore_index=True)
+        tm.assert_frame_equal(result, expected)
+
+        # extents count characters, not bytes
+        data = u('\u0161a\u017e  1\n\u00e9\u00e8   2\nc     3\n')
+        expected = read_fwf(BytesIO(data.encode('utf-8')), widths=[4, 2],
+                            header=None, encoding='utf-8', engine='python')
+        result = read_fwf(BytesIO(data.encode('utf-8')), widths=[4, 2],
+                          header=None, encoding='utf-8', engine='c')
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(result[0].tolist(),
+                         [u('\u0161a\u017e'), u('\u00e9\u00e8'), u('c')])
+
+        # options the c engine cannot handle fall back to python
+        data = 'a  1\nb  2\nc  3\n'
+        result = read_fwf(StringIO(data), widths=[3, 1], header=None,
+                          skip_footer=1)
+        self.assertEqual(len(result), 2)
+        with tm.assertRaisesRegexp(ValueError, 'skip_footer'):
+            read_fwf(StringIO(data), widths=[3, 1], skip_footer=1,
+                     engine='c')
+
     def test_usecols_dtypes(self):
         data = """\
 1,2,3
@@ -3310,6 +3554,80 @@ one,two
             self.assertRaises(ValueError, self.read_csv,
                               path, compression='bz3')
 
+    def test_decompression_xz_zip(self):
+        from pandas.io.common import ZipFile
+        data = open(self.csv1, 'rb').read()
+        expected = self.read_csv(self.csv1)
+
+        with tm.ensure_clean() as path:
+            with ZipFile(path, mode='w') as tmp:
+                tmp.writestr('test1.csv', data)
+
+            result = self.read_csv(path, compression='zip')
+            tm.assert_frame_equal(result, expected)
+
+            result = self.read_csv(open(path, 'rb'), compression='zip')
+            tm.assert_frame_equal(result, expected)
+
+            result = read_csv(path, compression='zip', engine='python')
+            tm.assert_frame_equal(result, expected)
+
+            with ZipFile(path, mode='a') as tmp:
+                tmp.writestr('test2.csv', data)
+            with tm.assertRaisesRegexp(ValueError, 'exactly one file'):
+                self.read_csv(path, compression='zip')
+
+        try:
+            from pandas.io.common import _import_lzma
+            lzma = _import_lzma()
+        except ImportError:
+            raise nose.SkipTest('need lzma to run')
+
+        with tm.ensure_clean() as path:
+            tmp = lzma.LZMAFile(path, mode='wb')
+            tmp.write(data)
+            tmp.close()
+
+            result = self.read_csv(path, compression='xz')
+            tm.assert_frame_equal(result, expected)
+
+            result = self.read_csv(open(path, 'rb'), compression='xz')
+            tm.assert_frame_equal(result, expected)
+
+            result = read_csv(path, compression='xz', engine='python')
+            tm.assert_frame_equal(result, expected)
+
+    def test_read_ahead_reader(self):
+        from pandas.io.common import ReadAheadReader
+
+        data = b'a,b\n' + b''.join([b'1,2\n'] * 1000)
+        reader = ReadAheadReader(BytesIO(data), chunksize=7)
+        result = []
+        while True:
+            block = reader.read(5)
+            if not block:
+                break
+            self.assertTrue(len(block) <= 5)
+            result.append(block)
+        self.assertEqual(b''.join(result), data)
+        reader.close()
+
+        reader = ReadAheadReader(BytesIO(data), chunksize=7)
+        self.assertEqual(reader.read(3), data[:3])
+        self.assertEqual(reader.read(), data[3:])
+        self.assertEqual(reader.read(), b'')
+
+        class BadFile(object):
+            def read(self, size):
+                raise IOError('bad read')
+
+        reader = ReadAheadReader(BadFile())
+        self.assertRaises(IOError, reader.read, 10)
+
+        # the tokenizer reads directly from the read-ahead buffers
+        result = self.read_csv(ReadAheadReader(BytesIO(data), chunksize=7))
+        self.assertEqual(len(result), 1000)
+
     def test_decompression_regex_sep(self):
         try:
             import gzip
@@ -3540,6 +3858,55 @@ No,No,No"""
             self.assertRaises(TypeError, self.read_csv, path, dtype={'A' : 'timedelta64', 'B' : 'float64' },
                               index_col=0)
 
+    def test_threads(self):
+        df = DataFrame({'a': np.arange(100),
+                        'b': np.random.randn(100),
+                        'c': tm.makeStringIndex(100),
+                        'd': [True, False] * 50})
+        df.loc[::7, 'b'] = np.nan
+        data = df.to_csv(index=False)
+
+        expected = self.read_csv(StringIO(data))
+        for threads in [1, 2, 4]:
+            result = self.read_csv(StringIO(data), threads=threads)
+            tm.assert_frame_equal(result, expected)
+
+            result = self.read_csv(StringIO(data), threads=threads,
+                                   na_values=[4], usecols=['a', 'b'])
+            expected_usecols = self.read_csv(StringIO(data), na_values=[4],
+                                             usecols=['a', 'b'])
+            tm.assert_frame_equal(result, expected_usecols)
+
+            # the threads are shared by the chunks of a reader
+            reader = self.read_csv(StringIO(data), threads=threads,
+                                   chunksize=30)
+            tm.assert_frame_equal(reader.get_chunk(), expected[:30])
+            tm.assert_frame_equal(reader.get_chunk(), expected[30:60])
+            reader.close()
+            tm.assert_frame_equal(pd.concat(list(reader)), expected[60:])
+
+            result = self.read_csv(StringIO(data), threads=threads, nrows=10)
+            tm.assert_frame_equal(result, expected[:10])
+
+        for threads in [0, -1, 1.5]:
+            self.assertRaises(ValueError, self.read_csv, StringIO(data),
+                              threads=threads)
+
+    def test_parse_dates_iso8601_chunks(self):
+        # some chunks are converted while parsing, others fall back
+        data = """date,A
+2012-01-01,1
+2012-01-02,2
+2012-01-03,3
+01/04/2012,4
+2012-01-05,5
+"""
+        result = self.read_csv(StringIO(data), parse_dates=['date'])
+        expected = tools.to_datetime(['2012-01-01', '2012-01-02',
+                                      '2012-01-03', '2012-01-04',
+                                      '2012-01-05'])
+        tm.assert_numpy_array_equal(result['date'].values, expected.values)
+
     def test_fallback_to_python(self):
         # GH 6607
         data = 'a b c\n1 2 3'
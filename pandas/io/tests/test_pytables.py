@@ -667,9 +667,8 @@ class TestHDFStore(tm.TestCase):
             store.put('c', df, format='table', complib='zlib')
             tm.assert_frame_equal(store['c'], df)
 
-            # can't compress if format='fixed'
-            self.assertRaises(ValueError, store.put, 'b', df,
-                              format='fixed', complib='zlib')
+            store.put('b', df, format='fixed', complib='zlib')
+            tm.assert_frame_equal(store['b'], df)
 
     def test_put_compression_blosc(self):
         tm.skip_if_no_package('tables', '2.2', app='blosc support')
@@ -677,9 +676,8 @@ class TestHDFStore(tm.TestCase):
 
         with ensure_clean_store(self.path) as store:
 
-            # can't compress if format='fixed'
-            self.assertRaises(ValueError, store.put, 'b', df,
-                              format='fixed', complib='blosc')
+            store.put('b', df, format='fixed', complib='blosc')
+            tm.assert_frame_equal(store['b'], df)
 
             store.put('c', df, format='table', complib='blosc')
             tm.assert_frame_equal(store['c'], df)
@@ -1729,9 +1727,53 @@ class TestHDFStore(tm.TestCase):
 
         with ensure_clean_store(self.path) as store:
             store.put('df',df)
-            self.assertRaises(TypeError, store.select, 'df', columns=['A'])
+            tm.assert_frame_equal(store.select('df', columns=['A']), df[['A']])
             self.assertRaises(TypeError, store.select, 'df',where=[('columns=A')])
 
+    def test_fixed_partial_read(self):
+
+        df = tm.makeTimeDataFrame()
+        df['int'] = np.arange(len(df), dtype='int64')
+        df['str'] = 'foo'
+        df['dt'] = Timestamp('20130101')
+        s = df['A']
+
+        with ensure_clean_store(self.path) as store:
+            store.put('df', df)
+            store.put('dfc', df, complib='zlib', complevel=5)
+            store.put('s', s)
+            store.put('mi', df.set_index(['int', 'str']))
+
+            for key in ['df', 'dfc']:
+                self.assertEqual(store.get_storer(key).nrows, len(df))
+
+                result = store.select(key, start=5, stop=10)
+                tm.assert_frame_equal(result, df.iloc[5:10])
+
+                result = store.select(key, start=-5)
+                tm.assert_frame_equal(result, df.iloc[-5:])
+
+                result = store.select(key, start=len(df) + 10)
+                tm.assert_frame_equal(result, df.iloc[len(df):])
+
+                # columns of a block are read in the given order
+                result = store.select(key, columns=['C', 'A'])
+                tm.assert_frame_equal(result, df[['C', 'A']])
+
+                result = store.select(key, columns=['str', 'B', 'dt'],
+                                      start=3, stop=7)
+                tm.assert_frame_equal(result, df[['str', 'B', 'dt']].iloc[3:7])
+
+                self.assertRaises(KeyError, store.select, key,
+                                  columns=['A', 'foo'])
+
+            result = store.select('s', start=2, stop=4)
+            tm.assert_series_equal(result, s.iloc[2:4])
+
+            expected = df.set_index(['int', 'str'])
+            result = store.select('mi', start=2, stop=4, columns=['A'])
+            tm.assert_frame_equal(result, expected[['A']].iloc[2:4])
+
     def test_append_misc(self):
 
         with ensure_clean_store(self.path) as store:
@@ -3979,6 +4021,66 @@ class TestHDFStore(tm.TestCase):
             expected = df[5:10]
             tm.assert_frame_equal(result,expected)
 
+    def test_appender(self):
+
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+        df['int'] = np.arange(len(df), dtype='int64')
+        df.iloc[3:5, 0:4] = np.nan
+        chunks = [df.iloc[i:i + 7] for i in range(0, len(df), 7)]
+
+        with ensure_clean_store(self.path) as store:
+
+            with store.appender('df', chunksize=10, data_columns=['B'],
+                                min_itemsize={'string': 10}) as app:
+                for chunk in chunks:
+                    app.append(chunk)
+
+                # buffered rows are not written until flushed
+                self.assertTrue(app.nbuffered > 0)
+            tm.assert_frame_equal(store['df'], df)
+            self.assertTrue(store.get_storer('df').table.cols.index.is_indexed)
+            self.assertTrue(store.get_storer('df').table.cols.B.is_indexed)
+
+            # a frame which is not the same schema is validated by append
+            df_long = df.iloc[:2].copy()
+            df_long['string'] = 'x' * 20
+            with store.appender('df') as app:
+                app.append(df.iloc[:2])
+                self.assertRaises(ValueError, app.append, df_long)
+                self.assertRaises(ValueError, app.append, df[['A', 'B']])
+            tm.assert_frame_equal(store['df'], concat([df, df.iloc[:2]]))
+            self.assertRaises(ValueError, app.append, df)
+
+            # all nan rows are dropped unless dropna=False
+            df_float = tm.makeTimeDataFrame()
+            df_float.iloc[3:5] = np.nan
+            for dropna, expected in [(True, df_float.dropna(how='all')),
+                                     (False, df_float)]:
+                _maybe_remove(store, 'df_float')
+                with store.appender('df_float', chunksize=4,
+                                    dropna=dropna, index=False) as app:
+                    for i in range(0, len(df_float), 3):
+                        app.append(df_float.iloc[i:i + 3])
+                tm.assert_frame_equal(store['df_float'], expected)
+                self.assertFalse(
+                    store.get_storer('df_float').table.cols.index.is_indexed)
+
+            # the rows dropped with a datetime block are the ones append drops
+            df_dt = tm.makeTimeDataFrame()
+            df_dt['date'] = Timestamp('20130101')
+            df_dt.iloc[3:5] = np.nan
+            df_dt.iloc[6, 0:4] = np.nan
+            _maybe_remove(store, 'df_dt')
+            _maybe_remove(store, 'df_dt_append')
+            with store.appender('df_dt', chunksize=4) as app:
+                for i in range(0, len(df_dt), 3):
+                    app.append(df_dt.iloc[i:i + 3])
+                    store.append('df_dt_append', df_dt.iloc[i:i + 3])
+            tm.assert_frame_equal(store['df_dt'], store['df_dt_append'])
+
+            self.assertRaises(ValueError, store.appender, 'df', chunksize=0)
+
     def test_append_to_multiple(self):
         df1 = tm.makeTimeDataFrame()
         df2 = tm.makeTimeDataFrame().rename(columns=lambda x: "%s_2" % x)
@@ -4084,6 +4186,73 @@ class TestHDFStore(tm.TestCase):
             self.assertRaises(ValueError, store.select_as_multiple,
                               ['df1','df3'], where=['A>0', 'B>0'], selector='df1')
 
+    def test_select_as_multiple_threads(self):
+
+        df1 = tm.makeTimeDataFrame(500)
+        df2 = tm.makeTimeDataFrame(500).rename(columns=lambda x: "%s_2" % x)
+        df2['foo'] = 'bar'
+
+        with ensure_clean_store(self.path) as store:
+            store.append('df1', df1, data_columns=['A', 'B'])
+            store.append('df2', df2)
+            store.put('df3', df1)
+
+            expected = store.select_as_multiple(
+                ['df1', 'df2'], where=['A>0', 'B>0'], selector='df1')
+            result = store.select_as_multiple(
+                ['df1', 'df2'], where=['A>0', 'B>0'], selector='df1',
+                threads=2)
+            tm.assert_frame_equal(result, expected)
+
+            for prefetch in [1, 3]:
+                results = list(store.select_as_multiple(
+                    ['df1', 'df2'], where=['A>0', 'B>0'], selector='df1',
+                    chunksize=100, threads=2, prefetch=prefetch))
+                tm.assert_frame_equal(concat(results), expected)
+
+            self.assertRaises(ValueError, store.select_as_multiple,
+                              ['df1', 'df2'], selector='df1', threads=0)
+
+            # several keys
+            result = store.select_multiple(['df1', 'df2', 'df3'], threads=2)
+            self.assertEqual(sorted(result), ['df1', 'df2', 'df3'])
+            tm.assert_frame_equal(result['df1'], df1)
+            tm.assert_frame_equal(result['df2'], df2)
+            tm.assert_frame_equal(result['df3'], df1)
+
+            result = store.select_multiple(['df1', 'df2'], where='index>df1.index[9]',
+                                           threads=2)
+            tm.assert_frame_equal(result['df1'], df1[10:])
+            tm.assert_frame_equal(result['df2'], df2[10:])
+
+            self.assertRaises(KeyError, store.select_multiple, ['df1', 'foo'])
+            self.assertRaises(TypeError, store.select_multiple, 'df1')
+
+    def test_select_iterator_prefetch(self):
+
+        df = tm.makeTimeDataFrame(500)
+
+        with ensure_clean_store(self.path) as store:
+            store.append('df', df, data_columns=['A'])
+
+            for prefetch in [None, 0, 1, 2, 10]:
+                results = list(store.select('df', chunksize=100,
+                                            prefetch=prefetch))
+                self.assertEqual(len(results), 5)
+                tm.assert_frame_equal(concat(results), df)
+
+                results = list(store.select('df', where='A>0', chunksize=100,
+                                            prefetch=prefetch))
+                tm.assert_frame_equal(concat(results), df[df.A > 0])
+
+            # stop iterating early
+            for result in store.select('df', chunksize=100, prefetch=2):
+                tm.assert_frame_equal(result, df[:100])
+                break
+
+            self.assertRaises(ValueError, store.select, 'df', chunksize=100,
+                              prefetch=-1)
+
     def test_nan_selection_bug_4858(self):
 
         # GH 4858; nan selection bug, only works for pytables >= 3.1
@@ -4571,29 +4740,69 @@ class TestHDFStore(tm.TestCase):
         tm.assert_frame_equal(expected, result)
 
     def test_categorical(self):
-        # FIXME
 
         with ensure_clean_store(self.path) as store:
 
             s = Series(Categorical(['a', 'b', 'b', 'a', 'a', 'c'], categories=['a','b','c','d']))
 
             self.assertRaises(NotImplementedError, store.put, 's_fixed', s, format='fixed')
-            self.assertRaises(NotImplementedError, store.append, 's_table', s, format='table')
-            #store.append('s', s, format='table')
-            #result = store.select('s')
-            #tm.assert_series_equal(s, result)
+            store.append('s', s, format='table')
+            result = store.select('s')
+            tm.assert_series_equal(s, result)
 
             df = DataFrame({"s":s, "vals":[1,2,3,4,5,6]})
             self.assertRaises(NotImplementedError, store.put, 'df_fixed', df, format='fixed')
-            self.assertRaises(NotImplementedError, store.append, 'df_table', df, format='table')
-            #store.append('df', df, format='table')
-            #result = store.select('df')
-            #tm.assert_frame_equal(df, df2)
+            store.append('df', df, format='table')
+            result = store.select('df')
+            tm.assert_frame_equal(result, df)
 
-            # Ok, this doesn't work yet
-            # FIXME: TypeError: cannot pass a where specification when reading from a Fixed format store. this store must be selected in its entirety
-            #result = store.select('df', where = ['index>2'])
-            #tm.assert_frame_equal(df[df.index>2],result)
+            # the codes are stored, not the values
+            dtype = store.get_storer('df').table.dtype
+            self.assertTrue(np.dtype('int8') in [dtype[n].base for n in dtype.names])
+
+            # appending
+            store.append('df', df, format='table')
+            result = store.select('df')
+            tm.assert_frame_equal(result, concat([df, df]))
+
+            # a data column, with nans
+            df2 = DataFrame({'s': Categorical(['b', np.nan, 'a', 'c', 'a', 'b']),
+                             'vals': np.arange(6.)})
+            store.append('df2', df2, data_columns=['s'])
+            tm.assert_frame_equal(store.select('df2'), df2)
+            tm.assert_series_equal(store.select_column('df2', 's'), df2['s'])
+
+            # where on the categories are on the codes
+            result = store.select('df2', where="s == 'a'")
+            tm.assert_frame_equal(result, df2[df2.s == 'a'])
+            result = store.select('df2', where="s != 'a'")
+            tm.assert_frame_equal(result, df2[df2.s != 'a'])
+            result = store.select('df2', where="s == ['a', 'c']")
+            tm.assert_frame_equal(result, df2[df2.s.isin(['a', 'c'])])
+            result = store.select('df2', where="s == 'd'")
+            tm.assert_frame_equal(result, df2.iloc[[]])
+            result = store.select('df2', where="s < 'b'")
+            tm.assert_frame_equal(result, df2[[False, False, True, False, True, False]])
+            result = store.select('df2', where="s <= 'b'")
+            tm.assert_frame_equal(result, df2[[True, False, True, False, True, True]])
+            result = store.select('df2', where="s > 'ab'")
+            tm.assert_frame_equal(result, df2[[True, False, False, True, False, True]])
+            result = store.select('df2', where="s >= 'c' & vals > 1")
+            tm.assert_frame_equal(result, df2.iloc[[3]])
+
+            # numeric categories
+            df3 = DataFrame({'s': Categorical([3, 1, 2, 3])})
+            store.append('df3', df3, data_columns=True)
+            tm.assert_frame_equal(store.select('df3'), df3)
+            tm.assert_frame_equal(store.select('df3', where='s > 1'),
+                                  df3.iloc[[0, 2, 3]])
+
+            # the categories must match to append
+            df_other = df.copy()
+            df_other['s'] = Categorical(['a', 'b', 'b', 'a', 'a', 'c'])
+            self.assertRaises(ValueError, store.append, 'df', df_other)
+            df_other['s'] = df_other['s'].astype(object)
+            self.assertRaises(ValueError, store.append, 'df', df_other)
 
     def test_duplicate_column_name(self):
         df = DataFrame(columns=["a", "a"], data=[[0, 0]])
@@ -4605,6 +4814,88 @@ class TestHDFStore(tm.TestCase):
             other = read_hdf(path, 'df')
             tm.assert_frame_equal(df, other)
 
+    def test_column_format(self):
+
+        df = tm.makeTimeDataFrame()
+        df['int'] = np.arange(len(df))
+        df['bool'] = df['A'] > 0
+        df['str'] = ['foo', 'bar'] * (len(df) // 2) + ['foo'] * (len(df) % 2)
+        df.loc[df.index[3:6], 'str'] = np.nan
+        df['date'] = Timestamp('20130101')
+        df.loc[df.index[4], 'date'] = np.nan
+        df['td'] = df['date'] - Timestamp('20121225')
+
+        with ensure_clean_store(self.path) as store:
+            store.put('df', df, format='column')
+            self.assertTrue(store.get_storer('df').is_column_store)
+            tm.assert_frame_equal(store['df'], df)
+            tm.assert_frame_equal(store.select('df'), df)
+
+            # column subsets and row ranges
+            result = store.select('df', columns=['str', 'A'])
+            tm.assert_frame_equal(result, df[['str', 'A']])
+
+            result = store.select('df', columns=['int'], start=5, stop=10)
+            tm.assert_frame_equal(result, df[['int']].iloc[5:10])
+
+            result = store.select('df', start=-5)
+            tm.assert_frame_equal(result, df.iloc[-5:])
+
+            # row coordinates
+            result = store.select('df', where=[1, 3, 7], columns=['B'])
+            tm.assert_frame_equal(result, df[['B']].iloc[[1, 3, 7]])
+
+            c = store.select_as_coordinates('df', start=2, stop=4)
+            tm.assert_index_equal(c, Index([2, 3]))
+
+            tm.assert_series_equal(store.select_column('df', 'int'),
+                                   df['int'].reset_index(drop=True))
+            tm.assert_series_equal(store.select_column('df', 'index'),
+                                   Series(df.index))
+
+            # iteration
+            result = concat(list(store.select('df', chunksize=7)))
+            tm.assert_frame_equal(result, df)
+
+            self.assertRaises(KeyError, store.select, 'df', columns=['foo'])
+            self.assertRaises(TypeError, store.select, 'df', 'index>df.index[3]')
+
+        # append, with the string widths preset
+        with ensure_clean_store(self.path) as store:
+            store.append('df', df[:10], format='column', complib='zlib',
+                         min_itemsize={'str': 10})
+            store.append('df', df[10:], format='column')
+            tm.assert_frame_equal(store.select('df'), df)
+
+            node = store.get_storer('df').group.values_0
+            self.assertEqual(node.filters.complib, 'zlib')
+
+            longer = df[:2].copy()
+            longer['str'] = 'x' * 20
+            self.assertRaises(ValueError, store.append, 'df', longer,
+                              format='column')
+            self.assertRaises(ValueError, store.append, 'df', df[['A', 'B']],
+                              format='column')
+
+            other = df[:2].copy()
+            other['int'] = 1.5
+            self.assertRaises(ValueError, store.append, 'df', other,
+                              format='column')
+
+            # the rejected appends did not write any of the arrays
+            tm.assert_frame_equal(store.select('df'), df)
+
+        # unsupported data
+        with ensure_clean_store(self.path) as store:
+            dfc = DataFrame({'A': Categorical(['a', 'b'])})
+            self.assertRaises(NotImplementedError, store.put, 'dfc', dfc,
+                              format='column')
+            dfo = DataFrame({'A': [1, 'a']})
+            self.assertRaises(TypeError, store.put, 'dfo', dfo,
+                              format='column')
+            self.assertRaises(TypeError, store.put, 's', df['A'],
+                              format='column')
+
 
 def _test_sort(obj):
     if isinstance(obj, DataFrame):
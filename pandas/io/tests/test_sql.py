@@ -498,6 +498,98 @@ class _TestSQLApi(PandasSQLTest):
             con=self.conn)
         tm.assert_frame_equal(result, self.test_frame1)
 
+    def test_roundtrip_insert_method_multi(self):
+        sql.to_sql(self.test_frame1, 'test_frame_roundtrip', con=self.conn,
+            index=False, flavor='sqlite', insert_method='multi')
+        result = sql.read_sql_query(
+            'SELECT * FROM test_frame_roundtrip',
+            con=self.conn)
+        tm.assert_frame_equal(result, self.test_frame1)
+
+        # more rows than fit in a statement, in chunks of unequal size
+        df = DataFrame({'a': np.arange(1000, dtype='int64'),
+                        'b': np.arange(1000, dtype='float64')})
+        df.loc[5, 'b'] = np.nan
+        sql.to_sql(df, 'test_multi', con=self.conn, index=False,
+                   flavor='sqlite', insert_method='multi', chunksize=700)
+        result = sql.read_sql_query('SELECT * FROM test_multi',
+                                    con=self.conn)
+        tm.assert_frame_equal(result, df)
+
+        self.assertRaises(ValueError, sql.to_sql, df, 'test_multi2',
+                          con=self.conn, flavor='sqlite',
+                          insert_method='foo')
+
+    def test_read_batches(self):
+        # the rows are converted a batch at a time, batches of different
+        # types are combined as if read at once
+        df = DataFrame({'a': [1, 2, 3, None, 5],
+                        'b': ['x', 'y', None, 'z', 'w'],
+                        'c': ['2013-01-01', '2013-01-02', None,
+                              '2013-01-04', '2013-01-05']})
+        df.to_sql('test_batches', self.conn, index=False)
+
+        query = 'SELECT * FROM test_batches'
+        expected = sql.read_sql_query(query, self.conn, parse_dates=['c'])
+        self.assertTrue(expected['a'].dtype == np.float64)
+        self.assertTrue(expected['c'].dtype == 'M8[ns]')
+
+        batchsize = sql._FETCH_BATCHSIZE
+        try:
+            sql._FETCH_BATCHSIZE = 2
+            result = sql.read_sql_query(query, self.conn, parse_dates=['c'])
+            tm.assert_frame_equal(result, expected)
+            result = sql.read_sql_query(query, self.conn, parse_dates=['c'],
+                                        index_col='b')
+            tm.assert_frame_equal(result, expected.set_index('b'))
+        finally:
+            sql._FETCH_BATCHSIZE = batchsize
+
+    def test_session(self):
+        session = sql.SQLSession(self.conn, flavor=self.flavor)
+
+        df = DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        session.to_sql(df, 'test_session', index=False)
+        self.assertTrue(session.has_table('test_session'))
+        sql.to_sql(df, 'test_session', session, index=False,
+                   if_exists='append')
+
+        expected = concat([df, df], ignore_index=True)
+        for i in range(2):
+            result = session.read_sql_query('SELECT * FROM test_session')
+            tm.assert_frame_equal(result, expected)
+            result = sql.read_sql('SELECT * FROM test_session', session)
+            tm.assert_frame_equal(result, expected)
+        result = session.read_sql_query(
+            'SELECT * FROM test_session WHERE a = ?', params=[2])
+        tm.assert_frame_equal(result,
+                              expected.iloc[[1, 4]].reset_index(drop=True))
+
+        # replacing the table through the session updates its schema
+        df2 = DataFrame({'c': [1.5, 2.5]})
+        session.to_sql(df2, 'test_session', index=False, if_exists='replace')
+        result = session.read_sql_query('SELECT * FROM test_session')
+        tm.assert_frame_equal(result, df2)
+
+        if self.mode == 'sqlalchemy':
+            for i in range(2):
+                result = session.read_sql_table('test_session')
+                tm.assert_frame_equal(result, df2)
+                result = session.read_sql('test_session')
+                tm.assert_frame_equal(result, df2)
+            session.to_sql(df, 'test_session', index=False,
+                           if_exists='replace')
+            result = session.read_sql_table('test_session')
+            tm.assert_frame_equal(result, df)
+            self.assertRaises(ValueError, session.read_sql_table, 'no_table')
+
+            # the queries passed to read_sql are not kept as table names
+            names = [name for name, _ in session.pandas_sql.table_names]
+            self.assertNotIn('SELECT * FROM test_session', names)
+        else:
+            self.assertRaises(NotImplementedError, session.read_sql_table,
+                              'test_session')
+
     def test_execute_sql(self):
         # drop_sql = "DROP TABLE IF EXISTS test"  # should already be done
         iris_results = sql.execute("SELECT * FROM iris", con=self.conn)
@@ -1306,6 +1398,15 @@ class TestPostgreSQLAlchemy(_TestSQLAlchemy):
         for table in c.fetchall():
             self.conn.execute("DROP TABLE %s" % table[0])
 
+    def test_insert_method_copy(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [0.1, np.nan, 0.3],
+                        'c': ['x', None, 'z'],
+                        'd': date_range('20130101', periods=3)})
+        df.to_sql('test_copy', self.conn, index=False, insert_method='copy',
+                  chunksize=2)
+        result = sql.read_sql_table('test_copy', self.conn)
+        tm.assert_frame_equal(result, df)
+
     def test_schema_support(self):
         # only test this for postgresql (schema's not supported in mysql/sqlite)
         df = DataFrame({'col1':[1, 2], 'col2':[0.1, 0.2], 'col3':['a', 'n']})
@@ -744,6 +744,47 @@ class TestStata(tm.TestCase):
             columns = ['byte_', 'int_', 'long_', 'not_found']
             read_stata(self.dta15_117, convert_dates=True, columns=columns)
 
+    def test_read_chunks(self):
+        for fname in [self.dta3_114, self.dta3_117, self.dta14_114,
+                      self.dta14_117, self.dta15_114, self.dta15_117]:
+            parsed = read_stata(fname)
+            for memory_map in [False, True]:
+                for chunksize in [1, 2, 7, 100]:
+                    reader = read_stata(fname, chunksize=chunksize,
+                                        memory_map=memory_map)
+                    result = pd.concat(list(reader), axis=0)
+                    tm.assert_frame_equal(result, parsed)
+
+        parsed = read_stata(self.dta15_117, columns=['byte_', 'date_td'])
+        reader = read_stata(self.dta15_117, columns=['byte_', 'date_td'],
+                            iterator=True)
+        tm.assert_frame_equal(reader.get_chunk(2), parsed.iloc[:2])
+        tm.assert_frame_equal(reader.read(), parsed.iloc[2:])
+        self.assertRaises(StopIteration, reader.read)
+        reader.close()
+
+        self.assertRaises(ValueError, read_stata, self.dta15_117,
+                          chunksize=0)
+
+    def test_read_chunks_categoricals(self):
+        # the labels are applied to each chunk, with the same categories
+        labeled = ['fully_labeled', 'fully_labeled2', 'incompletely_labeled',
+                   'labeled_with_missings', 'float_labelled']
+        for fname in [self.dta4_114, self.dta4_117]:
+            parsed = read_stata(fname)
+            reader = StataReader(fname, chunksize=4)
+            chunks = list(reader)
+            for i, chunk in enumerate(chunks):
+                tm.assert_frame_equal(chunk, parsed.iloc[i * 4:i * 4 + 4])
+                for col in labeled:
+                    tm.assert_index_equal(chunk[col].cat.categories,
+                                          parsed[col].cat.categories)
+
+            result = pd.concat(chunks)
+            tm.assert_frame_equal(result, parsed)
+            for col in labeled:
+                self.assertEqual(result[col].dtype, 'category')
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
                    exit=False)
@@ -104,7 +104,7 @@ cpdef map_indices_list(list index):
     return result
 
 
-from libc.stdlib cimport malloc, free
+from libc.stdlib cimport malloc, free, realloc
 
 
 def ismember_nans(float64_t[:] arr, set values, bint hasnans):
@@ -480,6 +480,162 @@ def dicts_to_array(list dicts, list columns):
 
     return result
 
+cdef enum:
+    _SEEN_INT = 1
+    _SEEN_FLOAT = 2
+    _SEEN_BOOL = 4
+    _SEEN_NULL = 8
+    _SEEN_OBJECT = 16
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def dicts_to_columns(list dicts):
+    """
+    Scatter the values of a list of dicts (records) into one array per key,
+    typed while the records are walked: int64, float64 (ints mixed with
+    floats or missing values), bool or object. Missing keys are NaN.
+
+    Returns
+    -------
+    columns : list of the keys, sorted if possible
+    arrays : list of ndarrays, matching columns
+    """
+    cdef:
+        Py_ssize_t i, j, r, n, k = 0, cap = 0
+        dict row, table = {}
+        list keys = [], arrays = [], objects = [], ivals = [], fvals = []
+        list bvals = [], order
+        object key, val, loc, onan = np.nan
+        ndarray[object] ocol
+        int64_t **iptr = NULL
+        float64_t **fptr = NULL
+        uint8_t **bptr = NULL
+        uint8_t *seen = NULL
+        Py_ssize_t *counts = NULL
+        int64_t ival
+        void *tmp
+
+    n = len(dicts)
+    try:
+        for i in range(n):
+            row = dicts[i]
+            for key, val in row.items():
+                loc = table.get(key)
+                if loc is None:
+                    if k == cap:
+                        cap = cap * 2 if cap else 16
+                        tmp = realloc(iptr, cap * sizeof(int64_t*))
+                        if tmp == NULL:
+                            raise MemoryError()
+                        iptr = <int64_t**> tmp
+                        tmp = realloc(fptr, cap * sizeof(float64_t*))
+                        if tmp == NULL:
+                            raise MemoryError()
+                        fptr = <float64_t**> tmp
+                        tmp = realloc(bptr, cap * sizeof(uint8_t*))
+                        if tmp == NULL:
+                            raise MemoryError()
+                        bptr = <uint8_t**> tmp
+                        tmp = realloc(seen, cap * sizeof(uint8_t))
+                        if tmp == NULL:
+                            raise MemoryError()
+                        seen = <uint8_t*> tmp
+                        tmp = realloc(counts, cap * sizeof(Py_ssize_t))
+                        if tmp == NULL:
+                            raise MemoryError()
+                        counts = <Py_ssize_t*> tmp
+
+                    table[key] = k
+                    keys.append(key)
+                    ivals.append(np.zeros(n, dtype=np.int64))
+                    fvals.append(np.empty(n, dtype=np.float64))
+                    fvals[k].fill(np.nan)
+                    bvals.append(np.zeros(n, dtype=np.uint8))
+                    objects.append(None)
+                    iptr[k] = <int64_t*> (<ndarray> ivals[k]).data
+                    fptr[k] = <float64_t*> (<ndarray> fvals[k]).data
+                    bptr[k] = <uint8_t*> (<ndarray> bvals[k]).data
+                    seen[k] = 0
+                    counts[k] = 0
+                    j = k
+                    k += 1
+                else:
+                    j = loc
+
+                counts[j] += 1
+                if seen[j] & _SEEN_OBJECT:
+                    ocol = objects[j]
+                    ocol[i] = val
+                    continue
+
+                if val is None:
+                    seen[j] |= _SEEN_NULL
+                    continue
+                elif util.is_bool_object(val):
+                    seen[j] |= _SEEN_BOOL
+                    bptr[j][i] = val
+                    continue
+                elif util.is_integer_object(val):
+                    try:
+                        ival = val
+                    except OverflowError:
+                        pass
+                    else:
+                        seen[j] |= _SEEN_INT
+                        iptr[j][i] = ival
+                        fptr[j][i] = <float64_t> ival
+                        continue
+                elif util.is_float_object(val):
+                    seen[j] |= _SEEN_FLOAT
+                    fptr[j][i] = val
+                    continue
+
+                # anything else makes an object column, fill in the
+                # earlier values from the records
+                seen[j] |= _SEEN_OBJECT
+                ocol = np.empty(n, dtype=object)
+                ocol.fill(onan)
+                for r in range(i):
+                    ocol[r] = dicts[r].get(key, onan)
+                ocol[i] = val
+                objects[j] = ocol
+
+        for j in range(k):
+            if counts[j] < n:
+                seen[j] |= _SEEN_NULL
+            if seen[j] & _SEEN_OBJECT:
+                arrays.append(objects[j])
+            elif seen[j] & _SEEN_BOOL:
+                if seen[j] == _SEEN_BOOL:
+                    arrays.append(bvals[j].view(np.bool_))
+                else:
+                    # bools mixed with numbers or missing values
+                    ocol = np.empty(n, dtype=object)
+                    key = keys[j]
+                    for r in range(n):
+                        ocol[r] = dicts[r].get(key, onan)
+                    arrays.append(ocol)
+            elif seen[j] == _SEEN_INT:
+                arrays.append(ivals[j])
+            else:
+                arrays.append(fvals[j])
+    finally:
+        free(iptr)
+        free(fptr)
+        free(bptr)
+        free(seen)
+        free(counts)
+
+    # order the columns as DataFrame does for a list of dicts
+    order = list(range(k))
+    try:
+        order.sort(key=keys.__getitem__)
+    except Exception:
+        pass
+
+    return [keys[j] for j in order], [arrays[j] for j in order]
+
 def fast_zip(list ndarrays):
     '''
     For zipping multiple ndarrays into an ndarray of tuples
@@ -1764,3 +1920,4 @@ cdef class BlockPlacement:
 include "reduce.pyx"
 include "properties.pyx"
 include "inference.pyx"
+include "writers.pyx"
@@ -9,8 +9,9 @@ import warnings
 
 from cpython cimport (PyObject, PyBytes_FromString,
                       PyBytes_AsString, PyBytes_Check,
-                      PyUnicode_Check, PyUnicode_AsUTF8String)
-from io.common import DtypeWarning
+                      PyUnicode_Check, PyUnicode_AsUTF8String,
+                      PyErr_Clear)
+from io.common import DtypeWarning, ReadAheadReader, open_compressed
 
 
 cdef extern from "Python.h":
@@ -29,10 +30,20 @@ from numpy cimport ndarray, uint8_t, uint64_t
 import numpy as np
 cimport util
 
+from datetime cimport (pandas_datetimestruct, PANDAS_DATETIMEUNIT,
+                       PANDAS_FR_ns, NPY_UNSAFE_CASTING, npy_bool,
+                       parse_iso_8601_datetime,
+                       pandas_datetimestruct_to_datetime)
+
 import pandas.lib as lib
+import pandas.tslib as tslib
+import pandas.core.common as com
+from pandas.core.categorical import Categorical
 
 import time
 import os
+import codecs
+from functools import partial
 
 cnp.import_array()
 
@@ -159,7 +170,7 @@ cdef extern from "parser/tokenizer.h":
 
         void *skipset
         int skip_footer
-        double (*converter)(const char *, char **, char, char, char, int)
+        double (*converter)(const char *, char **, char, char, char, int) nogil
 
         #  error handling
         char *warn_msg
@@ -172,8 +183,8 @@ cdef extern from "parser/tokenizer.h":
         int *line_start
         int col
 
-    void coliter_setup(coliter_t *it, parser_t *parser, int i, int start)
-    char* COLITER_NEXT(coliter_t it)
+    void coliter_setup(coliter_t *it, parser_t *parser, int i, int start) nogil
+    char* COLITER_NEXT(coliter_t it) nogil
 
     parser_t* parser_new()
 
@@ -183,32 +194,37 @@ cdef extern from "parser/tokenizer.h":
 
     void parser_set_default_options(parser_t *self)
 
+    int parser_set_fixed_width(parser_t *self, int ncols, int *starts,
+                               int *ends, char *fill, int utf8)
+
     int parser_consume_rows(parser_t *self, size_t nrows)
 
     int parser_trim_buffers(parser_t *self)
 
     void debug_print_parser(parser_t *self)
 
-    int tokenize_all_rows(parser_t *self)
-    int tokenize_nrows(parser_t *self, size_t nrows)
+    int tokenize_all_rows(parser_t *self) nogil
+    int tokenize_nrows(parser_t *self, size_t nrows) nogil
 
     int64_t str_to_int64(char *p_item, int64_t int_min,
-                         int64_t int_max, int *error, char tsep)
+                         int64_t int_max, int *error, char tsep) nogil
     uint64_t str_to_uint64(char *p_item, uint64_t uint_max, int *error)
 
     double xstrtod(const char *p, char **q, char decimal, char sci,
-                   char tsep, int skip_trailing)
+                   char tsep, int skip_trailing) nogil
     double precise_xstrtod(const char *p, char **q, char decimal, char sci,
-                   char tsep, int skip_trailing)
+                   char tsep, int skip_trailing) nogil
+    # declared nogil to match parser_t.converter, but calls back into
+    # python so the GIL must be held
     double round_trip(const char *p, char **q, char decimal, char sci,
-                   char tsep, int skip_trailing)
+                   char tsep, int skip_trailing) nogil
 
     inline int to_complex(char *item, double *p_real,
                           double *p_imag, char sci, char decimal)
     inline int to_longlong(char *item, long long *p_value)
     inline int to_longlong_thousands(char *item, long long *p_value,
                                      char tsep)
-    inline int to_boolean(char *item, uint8_t *val)
+    inline int to_boolean(char *item, uint8_t *val) nogil
 
 
 cdef extern from "parser/io.h":
@@ -273,7 +289,11 @@ cdef class TextReader:
         object compression
         object mangle_dupe_cols
         object tupleize_cols
-        set noconvert, usecols
+        object thread_pool
+        int threads
+        object date_format
+        object infer_schema_rows, infer_schema_errors, schema
+        set noconvert, usecols, date_columns
 
     def __cinit__(self, source,
                   delimiter=b',',
@@ -329,7 +349,12 @@ cdef class TextReader:
                   mangle_dupe_cols=True,
                   tupleize_cols=False,
                   float_precision=None,
-                  skip_blank_lines=True):
+                  skip_blank_lines=True,
+                  threads=1,
+                  date_format=None,
+                  colspecs=None,
+                  infer_schema_rows=None,
+                  infer_schema_errors='raise'):
 
         self.parser = parser_new()
         self.parser.chunksize = tokenize_chunksize
@@ -350,7 +375,7 @@ cdef class TextReader:
 
         if delim_whitespace:
             self.parser.delim_whitespace = delim_whitespace
-        else:
+        elif colspecs is None:
             if len(delimiter) > 1:
                 raise ValueError('only length-1 separators excluded right now')
             self.parser.delimiter = ord(delimiter)
@@ -430,6 +455,24 @@ cdef class TextReader:
 
         self.verbose = verbose
         self.low_memory = low_memory
+
+        if not util.is_integer_object(threads) or threads < 1:
+            raise ValueError('threads must be a positive integer')
+        self.threads = threads
+        self.thread_pool = None
+
+        if infer_schema_rows is not None:
+            if (not util.is_integer_object(infer_schema_rows) or
+                    infer_schema_rows < 1):
+                raise ValueError('infer_schema_rows must be a positive '
+                                 'integer')
+        if infer_schema_errors not in ('raise', 'infer'):
+            raise ValueError("infer_schema_errors must be 'raise' or "
+                             "'infer'")
+        self.infer_schema_rows = infer_schema_rows
+        self.infer_schema_errors = infer_schema_errors
+        # dtypes locked by _infer_schema, keyed by column index
+        self.schema = None
         self.parser.converter = xstrtod
         if float_precision == 'high':
             self.parser.converter = precise_xstrtod
@@ -447,14 +490,22 @@ cdef class TextReader:
 
         self.encoding = encoding
 
+        if colspecs is not None:
+            # fixed width fields, the delimiter gives the fill characters
+            self._set_fixed_width(colspecs, delimiter)
+
         if isinstance(dtype, dict):
             conv = {}
             for k in dtype:
                 v = dtype[k]
-                if isinstance(v, basestring):
+                if com.is_categorical_dtype(v):
+                    v = 'category'
+                elif isinstance(v, basestring):
                     v = np.dtype(v)
                 conv[k] = v
             dtype = conv
+        elif com.is_categorical_dtype(dtype):
+            dtype = 'category'
         elif dtype is not None:
             dtype = np.dtype(dtype)
 
@@ -463,6 +514,16 @@ cdef class TextReader:
         # XXX
         self.noconvert = set()
 
+        # columns converted to datetime64 while parsing, see _try_datetime
+        self.date_columns = set()
+        if date_format is not None:
+            if not _is_native_date_format(date_format):
+                raise ValueError('date_format %r is not supported by the C '
+                                 'parser' % (date_format,))
+            if not isinstance(date_format, bytes):
+                date_format = date_format.encode('ascii')
+        self.date_format = date_format
+
         self.index_col = index_col
 
         #----------------------------------------
@@ -518,10 +579,56 @@ cdef class TextReader:
 
     def __dealloc__(self):
         parser_free(self.parser)
+        if self.thread_pool is not None:
+            # let the idle workers exit, without waiting for them
+            self.thread_pool.close()
+            self.thread_pool = None
+
+    def close(self):
+        """
+        stop the threads converting the columns, the reader can still be
+        read from afterwards, without threads
+        """
+        if self.thread_pool is not None:
+            self.thread_pool.close()
+            self.thread_pool.join()
+            self.thread_pool = None
+        self.threads = 1
 
     def set_error_bad_lines(self, int status):
         self.parser.error_bad_lines = status
 
+    cdef _set_fixed_width(self, colspecs, fill):
+        cdef:
+            int status, utf8
+            ndarray starts, ends
+
+        starts = np.array([0 if start is None else start
+                           for start, _ in colspecs], dtype=np.intc)
+        ends = np.array([-1 if end is None else end
+                         for _, end in colspecs], dtype=np.intc)
+        if (starts < 0).any() or (ends < -1).any():
+            raise ValueError('negative column specifications are not '
+                             'supported by the C parser')
+
+        if not fill:
+            fill = b' \t'
+        elif not isinstance(fill, bytes):
+            fill = fill.encode('utf-8')
+
+        # the extents count characters, which are bytes unless the data
+        # is decoded as UTF-8
+        if self.c_encoding == NULL:
+            utf8 = PY3
+        else:
+            utf8 = codecs.lookup(self.encoding.decode('ascii')).name == 'utf-8'
+
+        status = parser_set_fixed_width(self.parser, len(colspecs),
+                                        <int*> starts.data, <int*> ends.data,
+                                        fill, utf8)
+        if status != 0:
+            raise MemoryError()
+
     cdef _make_skiprow_set(self):
         if isinstance(self.skiprows, (int, np.integer)):
             self.skiprows = range(self.skiprows)
@@ -538,22 +645,9 @@ cdef class TextReader:
         self.parser.cb_cleanup = NULL
 
         if self.compression:
-            if self.compression == 'gzip':
-                import gzip
-                if isinstance(source, basestring):
-                    source = gzip.GzipFile(source, 'rb')
-                else:
-                    source = gzip.GzipFile(fileobj=source)
-            elif self.compression == 'bz2':
-                import bz2
-                if isinstance(source, basestring):
-                    source = bz2.BZ2File(source, 'rb')
-                else:
-                    raise ValueError('Python cannot read bz2 from open file '
-                                     'handle')
-            else:
-                raise ValueError('Unrecognized compression type: %s' %
-                                 self.compression)
+            # decompress in a background thread while the tokenizer runs
+            source = ReadAheadReader(open_compressed(source, self.compression),
+                                     chunksize=self.parser.chunksize)
 
         if isinstance(source, basestring):
             if not isinstance(source, bytes):
@@ -749,12 +843,28 @@ cdef class TextReader:
         cdef:
             int status
 
-        if self.low_memory:
-            # Conserve intermediate space
-            columns = self._read_low_memory(rows)
-        else:
-            # Don't care about memory usage
-            columns = self._read_rows(rows, 1)
+        if self.threads > 1 and self.thread_pool is None:
+            # one pool for all the reads of this reader, it is closed once
+            # the input is exhausted, on an error, or by close()
+            from multiprocessing.pool import ThreadPool
+            self.thread_pool = ThreadPool(self.threads)
+
+        try:
+            if self.infer_schema_rows is not None and self.schema is None:
+                self._infer_schema(self.infer_schema_rows)
+
+            if self.low_memory:
+                # Conserve intermediate space
+                columns = self._read_low_memory(rows)
+            else:
+                # Don't care about memory usage
+                columns = self._read_rows(rows, 1)
+        except:
+            self.close()
+            raise
+
+        if rows is None:
+            self.close()
 
         if self.as_recarray:
             self._start_clock()
@@ -803,9 +913,48 @@ cdef class TextReader:
         # destructive to chunks
         return _concatenate_chunks(chunks)
 
+    cdef _infer_schema(self, int nrows):
+        """
+        Infer the dtypes of the first nrows rows and lock them for the rest
+        of the read, so every chunk is converted to the same dtype
+        """
+        cdef:
+            int buffered_lines, parser_start = self.parser_start
+
+        self.schema = {}
+
+        buffered_lines = self.parser.lines - parser_start
+        if buffered_lines < nrows:
+            self._tokenize_rows(nrows - buffered_lines)
+        if self.parser.lines == parser_start:
+            return
+
+        # convert the sample without consuming it
+        try:
+            columns = self._convert_column_data(rows=nrows, upcast_na=True)
+        finally:
+            self.parser_start = parser_start
+
+        for i, values in columns.items():
+            if (isinstance(values, Categorical) or i in self.noconvert or
+                    i in self.date_columns):
+                continue
+
+            dtype = values.dtype
+            if dtype.kind not in ('i', 'f', 'b', 'O'):
+                continue
+            if dtype.kind in ('f', 'O') and com.isnull(values).all():
+                # nothing to infer from
+                continue
+            if dtype.kind == 'i':
+                # compact_ints may have downcast the sample
+                dtype = np.dtype(np.int64)
+            self.schema[i] = dtype.str
+
     cdef _tokenize_rows(self, size_t nrows):
         cdef int status
-        status = tokenize_nrows(self.parser, nrows)
+        with nogil:
+            status = tokenize_nrows(self.parser, nrows)
 
         if self.parser.warn_msg != NULL:
             print >> sys.stderr, self.parser.warn_msg
@@ -832,7 +981,8 @@ cdef class TextReader:
                 raise ValueError('skip_footer can only be used to read '
                                  'the whole file')
         else:
-            status = tokenize_all_rows(self.parser)
+            with nogil:
+                status = tokenize_all_rows(self.parser)
 
             if self.parser.warn_msg != NULL:
                 print >> sys.stderr, self.parser.warn_msg
@@ -883,13 +1033,14 @@ cdef class TextReader:
     def remove_noconvert(self, i):
         self.noconvert.remove(i)
 
+    def set_date_column(self, i):
+        self.date_columns.add(i)
+
     def _convert_column_data(self, rows=None, upcast_na=False, footer=0):
         cdef:
             Py_ssize_t i, nused
-            kh_str_t *na_hashset = NULL
             int start, end
-            object name, na_flist
-            bint na_filter = 0
+            object name
             Py_ssize_t num_cols
 
         start = self.parser_start
@@ -919,7 +1070,7 @@ cdef class TextReader:
             raise CParserError("Too many columns specified: expected %s and found %s" %
                 (self.table_width - self.leading_cols, num_cols))
 
-        results = {}
+        columns = []
         nused = 0
         for i in range(self.table_width):
             if i < self.leading_cols:
@@ -935,46 +1086,69 @@ cdef class TextReader:
                     continue
                 nused += 1
 
-            conv = self._get_converter(i, name)
+            columns.append((i, name))
 
-            # XXX
-            na_flist = set()
-            if self.na_filter:
-                na_list, na_flist = self._get_na_list(i, name)
-                if na_list is None:
-                    na_filter = 0
-                else:
-                    na_filter = 1
-                    na_hashset = kset_from_list(na_list)
-            else:
+        convert = partial(self._convert_column, start=start, end=end,
+                          upcast_na=upcast_na)
+        if self.thread_pool is not None and len(columns) > 1:
+            # the conversion loops release the GIL, so the columns can be
+            # converted concurrently
+            converted = self.thread_pool.map(convert, columns)
+        else:
+            converted = [convert(col) for col in columns]
+
+        results = dict(zip([i for i, _ in columns], converted))
+
+        self.parser_start += end - start
+
+        return results
+
+    def _convert_column(self, col, int start, int end, bint upcast_na):
+        cdef:
+            Py_ssize_t i
+            kh_str_t *na_hashset = NULL
+            bint na_filter = 0
+            object name, na_flist
+
+        i, name = col
+        conv = self._get_converter(i, name)
+
+        # XXX
+        na_flist = set()
+        if self.na_filter:
+            na_list, na_flist = self._get_na_list(i, name)
+            if na_list is None:
                 na_filter = 0
+            else:
+                na_filter = 1
+                na_hashset = kset_from_list(na_list)
+        else:
+            na_filter = 0
 
-            if conv:
-                results[i] = _apply_converter(conv, self.parser, i, start, end,
-                                              self.c_encoding)
-                continue
+        if conv:
+            return _apply_converter(conv, self.parser, i, start, end,
+                                    self.c_encoding)
 
-            # Should return as the desired dtype (inferred or specified)
+        # Should return as the desired dtype (inferred or specified)
+        try:
             col_res, na_count = self._convert_tokens(i, start, end, name,
-                                                     na_filter, na_hashset, na_flist)
-
+                                                     na_filter, na_hashset,
+                                                     na_flist)
+        finally:
             if na_filter:
                 self._free_na_set(na_hashset)
 
-            if upcast_na and na_count > 0:
-                col_res = _maybe_upcast(col_res)
-
-            if issubclass(col_res.dtype.type, np.integer) and self.compact_ints:
-                col_res = downcast_int64(col_res, self.use_unsigned)
+        if upcast_na and na_count > 0 and not isinstance(col_res,
+                                                         Categorical):
+            col_res = _maybe_upcast(col_res)
 
-            if col_res is None:
-                raise Exception('Unable to parse column %d' % i)
+        if issubclass(col_res.dtype.type, np.integer) and self.compact_ints:
+            col_res = downcast_int64(col_res, self.use_unsigned)
 
-            results[i] = col_res
-
-        self.parser_start += end - start
+        if col_res is None:
+            raise Exception('Unable to parse column %d' % i)
 
-        return results
+        return col_res
 
     cdef inline _convert_tokens(self, Py_ssize_t i, int start, int end,
                                 object name, bint na_filter,
@@ -989,12 +1163,18 @@ cdef class TextReader:
                     col_dtype = self.dtype[name]
                 elif i in self.dtype:
                     col_dtype = self.dtype[i]
+            elif isinstance(self.dtype, basestring):
+                col_dtype = self.dtype
             else:
                 if self.dtype.names:
                     col_dtype = self.dtype.descr[i][1]
                 else:
                     col_dtype = self.dtype
 
+            if isinstance(col_dtype, basestring) and col_dtype == 'category':
+                return self._categorical_convert(i, start, end, na_filter,
+                                                 na_hashset)
+
             if col_dtype is not None:
                 if not isinstance(col_dtype, basestring):
                     if isinstance(col_dtype, np.dtype):
@@ -1005,6 +1185,30 @@ cdef class TextReader:
                 return self._convert_with_dtype(col_dtype, i, start, end,
                                                 na_filter, 1, na_hashset, na_flist)
 
+        if i in self.date_columns:
+            col_res, na_count = self._convert_datetime(i, start, end,
+                                                       na_filter, na_hashset)
+            if col_res is not None:
+                return col_res, na_count
+
+        if self.schema and i in self.schema:
+            col_dtype = self.schema[i]
+            try:
+                col_res, na_count = self._convert_with_dtype(
+                    col_dtype, i, start, end, na_filter, 0, na_hashset,
+                    na_flist)
+            except OverflowError:
+                col_res = None
+
+            if col_res is not None:
+                return col_res, na_count
+
+            if self.infer_schema_errors == 'raise':
+                raise ValueError('Unable to parse column %r as %s, the dtype '
+                                 'inferred from the first %d rows'
+                                 % (name, np.dtype(col_dtype).name,
+                                    self.infer_schema_rows))
+
         if i in self.noconvert:
             return self._string_convert(i, start, end, na_filter, na_hashset)
         else:
@@ -1095,6 +1299,43 @@ cdef class TextReader:
                                  "pass this column using parse_dates instead" % dtype)
             raise TypeError("the dtype %s is not supported for parsing" % dtype)
 
+    cdef _convert_datetime(self, Py_ssize_t i, int start, int end,
+                           bint na_filter, kh_str_t *na_hashset):
+        cdef char *fmt = NULL
+
+        if self.date_format is not None:
+            fmt = self.date_format
+        return _try_datetime(self.parser, i, start, end, na_filter,
+                             na_hashset, fmt)
+
+    cdef _categorical_convert(self, Py_ssize_t i, int start, int end,
+                              bint na_filter, kh_str_t *na_hashset):
+        codes, uniques, na_count = _factorize_strings(self.parser, i, start,
+                                                      end, na_filter,
+                                                      na_hashset)
+
+        # box only the distinct values, decoded the same way as
+        # _string_convert would
+        if PY3 or self.c_encoding != NULL:
+            if self.c_encoding != NULL and self.c_encoding != b"utf-8":
+                uniques = np.array([PyUnicode_Decode(x, len(x),
+                                                     self.c_encoding,
+                                                     "strict")
+                                    for x in uniques], dtype=np.object_)
+            else:
+                uniques = np.array([x.decode('utf-8') for x in uniques],
+                                   dtype=np.object_)
+
+        # sort the categories like Categorical(values) does
+        indexer = uniques.argsort()
+        reverse = np.empty(len(indexer), dtype=np.int64)
+        reverse.put(indexer, np.arange(len(indexer)))
+        uniques = uniques.take(indexer)
+        codes = com.take_1d(reverse, codes, fill_value=-1)
+
+        return Categorical(codes, categories=uniques, ordered=True,
+                           fastpath=True), na_count
+
     cdef _string_convert(self, Py_ssize_t i, int start, int end,
                          bint na_filter, kh_str_t *na_hashset):
         if PY3:
@@ -1296,6 +1537,62 @@ cdef _string_box_factorize(parser_t *parser, int col,
 
     return result, na_count
 
+cdef _factorize_strings(parser_t *parser, int col,
+                        int line_start, int line_end,
+                        bint na_filter, kh_str_t *na_hashset):
+    """
+    Hash the raw tokens of a column into integer codes (-1 for NA) without
+    boxing them. Returns codes, the distinct values as bytes in order of
+    appearance, and the NA count.
+    """
+    cdef:
+        int na_count = 0
+        Py_ssize_t i
+        size_t lines, n_uniques = 0
+        coliter_t it
+        char *word
+        int64_t *data
+        ndarray codes, uniques
+
+        int ret = 0
+        kh_str_t *table
+        khiter_t k
+
+    table = kh_init_str()
+    lines = line_end - line_start
+    codes = np.empty(lines, dtype=np.int64)
+    data = <int64_t *> codes.data
+    coliter_setup(&it, parser, col, line_start)
+
+    with nogil:
+        for i in range(lines):
+            word = COLITER_NEXT(it)
+
+            if na_filter:
+                k = kh_get_str(na_hashset, word)
+                # in the hash table
+                if k != na_hashset.n_buckets:
+                    na_count += 1
+                    data[i] = -1
+                    continue
+
+            k = kh_get_str(table, word)
+            if k == table.n_buckets:
+                k = kh_put_str(table, word, &ret)
+                table.vals[k] = n_uniques
+                n_uniques += 1
+
+            data[i] = table.vals[k]
+
+    uniques = np.empty(n_uniques, dtype=np.object_)
+    for k in range(table.n_buckets):
+        if kh_exist_str(table, k):
+            uniques[table.vals[k]] = PyBytes_FromString(table.keys[k])
+
+    kh_destroy_str(table)
+
+    return codes, uniques, na_count
+
 cdef _string_box_utf8(parser_t *parser, int col,
                       int line_start, int line_end,
                       bint na_filter, kh_str_t *na_hashset):
@@ -1437,20 +1734,49 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
                  bint na_filter, kh_str_t *na_hashset, object na_flist):
     cdef:
         int error, na_count = 0
-        size_t i, lines
-        coliter_t it
-        char *word
-        char *p_end
+        size_t lines
         double *data
         double NA = na_values[np.float64]
         ndarray result
-        khiter_t k
         bint use_na_flist = len(na_flist) > 0
 
-    global errno
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.float64)
     data = <double *> result.data
+
+    if parser.converter == round_trip:
+        # round_trip calls back into python
+        error = _try_double_nogil(parser, col, line_start, line_end,
+                                  na_filter, na_hashset, NA, data,
+                                  &na_count)
+    else:
+        with nogil:
+            error = _try_double_nogil(parser, col, line_start, line_end,
+                                      na_filter, na_hashset, NA, data,
+                                      &na_count)
+    if error != 0:
+        return None, None
+
+    if na_filter and use_na_flist:
+        mask = np.in1d(result, list(na_flist))
+        na_count += mask.sum()
+        result[mask] = NA
+
+    return result, na_count
+
+cdef inline int _try_double_nogil(parser_t *parser, int col, int line_start,
+                                  int line_end, bint na_filter,
+                                  kh_str_t *na_hashset, double NA,
+                                  double *data, int *na_count) nogil:
+    cdef:
+        size_t i, lines
+        coliter_t it
+        char *word
+        char *p_end
+        khiter_t k
+
+    global errno
+    lines = line_end - line_start
     coliter_setup(&it, parser, col, line_start)
 
     if na_filter:
@@ -1460,7 +1786,7 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
-                na_count += 1
+                na_count[0] += 1
                 data[0] = NA
             else:
                 data[0] = parser.converter(word, &p_end, parser.decimal, parser.sci,
@@ -1471,11 +1797,7 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
                     elif strcasecmp(word, cneginf) == 0:
                         data[0] = NEGINF
                     else:
-                        return None, None
-                if use_na_flist:
-                    if data[0] in na_flist:
-                        na_count += 1
-                        data[0] = NA
+                        return 1
             data += 1
     else:
         for i in range(lines):
@@ -1488,28 +1810,51 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
                 elif strcasecmp(word, cneginf) == 0:
                     data[0] = NEGINF
                 else:
-                    return None, None
+                    return 1
             data += 1
 
-    return result, na_count
+    return 0
 
 
 cdef _try_int64(parser_t *parser, int col, int line_start, int line_end,
                 bint na_filter, kh_str_t *na_hashset):
     cdef:
         int error, na_count = 0
-        size_t i, lines
-        coliter_t it
-        char *word
+        size_t lines
+        char *bad_word = NULL
         int64_t *data
         ndarray result
 
         int64_t NA = na_values[np.int64]
-        khiter_t k
 
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.int64)
     data = <int64_t *> result.data
+
+    with nogil:
+        error = _try_int64_nogil(parser, col, line_start, line_end,
+                                 na_filter, na_hashset, NA, data,
+                                 &na_count, &bad_word)
+    if error != 0:
+        if error == ERROR_OVERFLOW:
+            raise OverflowError(bad_word)
+        return None, None
+
+    return result, na_count
+
+cdef inline int _try_int64_nogil(parser_t *parser, int col, int line_start,
+                                 int line_end, bint na_filter,
+                                 kh_str_t *na_hashset, int64_t NA,
+                                 int64_t *data, int *na_count,
+                                 char **bad_word) nogil:
+    cdef:
+        int error
+        size_t i, lines
+        coliter_t it
+        char *word
+        khiter_t k
+
+    lines = line_end - line_start
     coliter_setup(&it, parser, col, line_start)
 
     if na_filter:
@@ -1518,46 +1863,61 @@ cdef _try_int64(parser_t *parser, int col, int line_start, int line_end,
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
-                na_count += 1
+                na_count[0] += 1
                 data[i] = NA
                 continue
 
             data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
                                    &error, parser.thousands)
             if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
-
-                return None, None
+                bad_word[0] = word
+                return error
     else:
         for i in range(lines):
             word = COLITER_NEXT(it)
             data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
                                    &error, parser.thousands)
             if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
-                return None, None
+                bad_word[0] = word
+                return error
 
-    return result, na_count
+    return 0
 
 
 cdef _try_bool(parser_t *parser, int col, int line_start, int line_end,
                bint na_filter, kh_str_t *na_hashset):
     cdef:
         int error, na_count = 0
-        size_t i, lines
-        coliter_t it
-        char *word
+        size_t lines
         uint8_t *data
         ndarray result
 
         uint8_t NA = na_values[np.bool_]
-        khiter_t k
 
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.uint8)
     data = <uint8_t *> result.data
+
+    with nogil:
+        error = _try_bool_nogil(parser, col, line_start, line_end,
+                                na_filter, na_hashset, NA, data, &na_count)
+    if error != 0:
+        return None, None
+
+    return result.view(np.bool_), na_count
+
+cdef inline int _try_bool_nogil(parser_t *parser, int col, int line_start,
+                                int line_end, bint na_filter,
+                                kh_str_t *na_hashset, uint8_t NA,
+                                uint8_t *data, int *na_count) nogil:
+    cdef:
+        int error
+        size_t i, lines
+        coliter_t it
+        char *word
+        khiter_t k
+
+    lines = line_end - line_start
     coliter_setup(&it, parser, col, line_start)
 
     if na_filter:
@@ -1567,14 +1927,14 @@ cdef _try_bool(parser_t *parser, int col, int line_start, int line_end,
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
-                na_count += 1
+                na_count[0] += 1
                 data[0] = NA
                 data += 1
                 continue
 
             error = to_boolean(word, data)
             if error != 0:
-                return None, None
+                return error
             data += 1
     else:
         for i in range(lines):
@@ -1582,10 +1942,225 @@ cdef _try_bool(parser_t *parser, int col, int line_start, int line_end,
 
             error = to_boolean(word, data)
             if error != 0:
-                return None, None
+                return error
             data += 1
 
-    return result.view(np.bool_), na_count
+    return 0
+
+
+cdef int64_t NPY_NAT = util.get_nat()
+
+_native_date_directives = set('YmdHMSf%')
+
+def _is_native_date_format(fmt):
+    """
+    Whether fmt only uses the strftime directives understood by
+    _parse_date_format
+    """
+    try:
+        if isinstance(fmt, bytes):
+            fmt = fmt.decode('ascii')
+        else:
+            fmt.encode('ascii')
+    except UnicodeError:
+        return False
+
+    i = 0
+    while i < len(fmt):
+        if fmt[i] == '%':
+            if fmt[i + 1:i + 2] not in _native_date_directives:
+                return False
+            i += 2
+        else:
+            i += 1
+    return True
+
+cdef inline bint _is_nat_string(char *word):
+    # the strings parsed as NaT by tslib.array_to_datetime
+    return (strcmp(word, b'NaT') == 0 or strcmp(word, b'nat') == 0 or
+            strcmp(word, b'NAT') == 0 or strcmp(word, b'nan') == 0 or
+            strcmp(word, b'NaN') == 0 or strcmp(word, b'NAN') == 0)
+
+cdef _try_datetime(parser_t *parser, int col, int line_start, int line_end,
+                   bint na_filter, kh_str_t *na_hashset, char *date_format):
+    """
+    Convert the tokens of a column straight to datetime64[ns], either as
+    ISO 8601 or with date_format. Returns (None, None) if any token cannot
+    be parsed, in which case the column goes through the regular date
+    conversion after parsing.
+    """
+    cdef:
+        int status, na_count = 0
+        int out_local = 0, out_tzoffset = 0
+        size_t i, lines
+        coliter_t it
+        char *word
+        int64_t *data
+        ndarray result
+        khiter_t k
+        npy_bool special
+        PANDAS_DATETIMEUNIT out_bestunit
+        pandas_datetimestruct dts
+
+    lines = line_end - line_start
+    result = np.empty(lines, dtype='M8[ns]')
+    data = <int64_t *> result.data
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count += 1
+                data[i] = NPY_NAT
+                continue
+
+        if date_format != NULL:
+            if _parse_date_format(word, date_format, &dts) != 0:
+                return None, None
+        else:
+            if word[0] == 0:
+                data[i] = NPY_NAT
+                continue
+
+            if _is_nat_string(word):
+                data[i] = NPY_NAT
+                continue
+
+            out_local = 0
+            status = parse_iso_8601_datetime(word, strlen(word), PANDAS_FR_ns,
+                                             NPY_UNSAFE_CASTING, &dts,
+                                             &out_local, &out_tzoffset,
+                                             &out_bestunit, &special)
+            if status != 0:
+                PyErr_Clear()
+                return None, None
+            if special:
+                # 'now' / 'today'
+                return None, None
+
+        # leave anything near the datetime64[ns] bounds to tslib
+        if dts.year < 1678 or dts.year > 2261:
+            return None, None
+
+        data[i] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+        if out_local:
+            data[i] -= out_tzoffset * 60000000000LL
+
+    return result, na_count
+
+cdef inline int _parse_digits(char **p, int maxdigits, int *ndigits) nogil:
+    cdef int value = 0
+
+    ndigits[0] = 0
+    while ndigits[0] < maxdigits and b'0' <= p[0][0] <= b'9':
+        value = value * 10 + (p[0][0] - b'0')
+        p[0] += 1
+        ndigits[0] += 1
+    return value
+
+cdef inline bint _isspace(char c) nogil:
+    return c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' or \
+        c == b'\v' or c == b'\f'
+
+cdef int _parse_date_format(char *word, char *fmt,
+                            pandas_datetimestruct *dts) nogil:
+    """
+    strptime for the %Y %m %d %H %M %S %f and %% directives. Returns -1 if
+    word does not match fmt, or the match is ambiguous and would need the
+    backtracking of the regular expressions used by strptime.
+    """
+    cdef:
+        char *p = word
+        char *f = fmt
+        char c
+        int value, ndigits, maxdigits
+        int days
+
+    dts.year = 1900
+    dts.month = dts.day = 1
+    dts.hour = dts.min = dts.sec = dts.us = dts.ps = dts.as = 0
+
+    while f[0] != 0:
+        if f[0] == b'%':
+            c = f[1]
+            f += 2
+            if c == b'%':
+                if p[0] != b'%':
+                    return -1
+                p += 1
+                continue
+
+            if c == b'Y':
+                maxdigits = 4
+            elif c == b'f':
+                maxdigits = 6
+            else:
+                maxdigits = 2
+
+            value = _parse_digits(&p, maxdigits, &ndigits)
+            if ndigits == 0:
+                return -1
+            # variable width fields directly followed by another directive
+            # are ambiguous
+            if ndigits != maxdigits and (c == b'Y' or (
+                    c != b'f' and f[0] == b'%' and f[1] != b'%')):
+                return -1
+
+            if c == b'Y':
+                dts.year = value
+            elif c == b'm':
+                dts.month = value
+            elif c == b'd':
+                dts.day = value
+            elif c == b'H':
+                dts.hour = value
+            elif c == b'M':
+                dts.min = value
+            elif c == b'S':
+                dts.sec = value
+            elif c == b'f':
+                while ndigits < 6:
+                    value *= 10
+                    ndigits += 1
+                dts.us = value
+            else:
+                return -1
+        elif _isspace(f[0]):
+            # whitespace in the format matches any run of whitespace
+            if not _isspace(p[0]):
+                return -1
+            while _isspace(f[0]):
+                f += 1
+            while _isspace(p[0]):
+                p += 1
+        else:
+            if p[0] != f[0]:
+                return -1
+            p += 1
+            f += 1
+
+    if p[0] != 0:
+        return -1
+
+    if dts.month < 1 or dts.month > 12:
+        return -1
+    if dts.month == 2:
+        days = 28 + (dts.year % 4 == 0 and (dts.year % 100 != 0 or
+                                            dts.year % 400 == 0))
+    elif (dts.month == 4 or dts.month == 6 or dts.month == 9 or
+          dts.month == 11):
+        days = 30
+    else:
+        days = 31
+    if dts.day < 1 or dts.day > days:
+        return -1
+    if dts.hour > 23 or dts.min > 59 or dts.sec > 59:
+        return -1
+    return 0
 
 
 cdef _try_bool_flex(parser_t *parser, int col, int line_start, int line_end,
@@ -1798,6 +2373,8 @@ def downcast_int64(ndarray[int64_t] arr, bint use_unsigned=0):
     return arr
 
 
+_NS_DTYPE = np.dtype('M8[ns]')
+
 def _concatenate_chunks(list chunks):
     cdef:
         list names = list(chunks[0].keys())
@@ -1810,8 +2387,19 @@ def _concatenate_chunks(list chunks):
     warning_columns = list()
     for name in names:
         arrs = [chunk.pop(name) for chunk in chunks]
+        if isinstance(arrs[0], Categorical):
+            result[name] = _concatenate_categoricals(arrs)
+            continue
+
         # Check each arr for consistent types.
         dtypes = set([a.dtype for a in arrs])
+        if len(dtypes) > 1 and _NS_DTYPE in dtypes:
+            # a date column only some of whose chunks were converted to
+            # datetime64 while parsing; box them so the whole column goes
+            # through the regular date conversion
+            arrs = [tslib.ints_to_pydatetime(a.view(np.int64), box=True)
+                    if a.dtype == _NS_DTYPE else a for a in arrs]
+            dtypes = set([a.dtype for a in arrs])
         if len(dtypes) > 1:
             common_type = np.find_common_type(dtypes, [])
             if common_type == np.object:
@@ -1826,6 +2414,27 @@ def _concatenate_chunks(list chunks):
         warnings.warn(warning_message, DtypeWarning)
     return result
 
+def _concatenate_categoricals(list arrs):
+    """
+    Combine the per-chunk Categoricals of a column, recoding each chunk
+    against the union of their categories
+    """
+    categories = arrs[0].categories
+    for arr in arrs[1:]:
+        if not arr.categories.equals(categories):
+            categories = categories.union(arr.categories)
+
+    codes = []
+    for arr in arrs:
+        if arr.categories.equals(categories):
+            codes.append(com._ensure_int64(arr.codes))
+        else:
+            indexer = categories.get_indexer(arr.categories)
+            codes.append(com.take_1d(indexer, arr.codes, fill_value=-1))
+
+    return Categorical(np.concatenate(codes), categories=categories,
+                       ordered=arrs[0].ordered, fastpath=True)
+
 #----------------------------------------------------------------------
 
 # NA values
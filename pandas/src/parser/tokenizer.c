@@ -199,6 +199,48 @@ int parser_cleanup(parser_t *self) {
     if (self->skipset != NULL)
         kh_destroy_int64((kh_int64_t*) self->skipset);
 
+    free_if_not_null(self->fwf_starts);
+    free_if_not_null(self->fwf_ends);
+    free_if_not_null(self->fwf_line);
+    free_if_not_null(self->fwf_offsets);
+    self->fwf_starts = NULL;
+    self->fwf_ends = NULL;
+    self->fwf_line = NULL;
+    self->fwf_offsets = NULL;
+    self->fwf_ncols = 0;
+
+    return 0;
+}
+
+
+int parser_set_fixed_width(parser_t *self, int ncols, int *starts, int *ends,
+                           const char *fill, int utf8) {
+    self->fwf_starts = (int*) malloc(ncols * sizeof(int));
+    self->fwf_ends = (int*) malloc(ncols * sizeof(int));
+    self->fwf_line_cap = 256;
+    self->fwf_line = (char*) malloc(self->fwf_line_cap * sizeof(char));
+    self->fwf_offsets_cap = 0;
+    self->fwf_offsets = NULL;
+
+    if (self->fwf_starts == NULL || self->fwf_ends == NULL ||
+        self->fwf_line == NULL) {
+        return PARSER_OUT_OF_MEMORY;
+    }
+
+    memcpy(self->fwf_starts, starts, ncols * sizeof(int));
+    memcpy(self->fwf_ends, ends, ncols * sizeof(int));
+
+    memset(self->fwf_fill, 0, sizeof(self->fwf_fill));
+    self->fwf_fill[(unsigned char) '\r'] = 1;
+    self->fwf_fill[(unsigned char) '\n'] = 1;
+    while (*fill != '\0') {
+        self->fwf_fill[(unsigned char) *fill++] = 1;
+    }
+
+    self->fwf_line_len = 0;
+    self->fwf_utf8 = utf8;
+    self->fwf_ncols = ncols;
+
     return 0;
 }
 
@@ -1532,8 +1574,179 @@ linelimit:
 }
 
 
+/*
+  Fixed width fields: the bytes of a line are collected in fwf_line, and at
+  the end of the line each field is cut out of it, stripped of the fill
+  characters and pushed to the token stream. Lines may span data chunks.
+ */
+
+static int append_fixed_width_bytes(parser_t *self, char *buf, int nbytes) {
+    int status;
+
+    self->fwf_line = (char*) grow_buffer((void *) self->fwf_line,
+                                         self->fwf_line_len,
+                                         &self->fwf_line_cap, nbytes,
+                                         sizeof(char), &status);
+    if (status != 0) {
+        self->error_msg = "out of memory";
+        return -1;
+    }
+
+    memcpy(self->fwf_line + self->fwf_line_len, buf, nbytes);
+    self->fwf_line_len += nbytes;
+    return 0;
+}
+
+// byte extent [start, end) of field j of the current line
+#define FWF_FIELD_EXTENT(j)                                     \
+    start = self->fwf_starts[j];                                \
+    end = self->fwf_ends[j];                                    \
+    if (end < 0 || end > nchars) end = nchars;                  \
+    if (start > end) start = end;                               \
+    if (offsets != NULL) {                                      \
+        start = offsets[start];                                 \
+        end = offsets[end];                                     \
+    }
+
+static int end_fixed_width_line(parser_t *self) {
+    int j, k, start, end, nchars, total, status;
+    int len = self->fwf_line_len;
+    char *line = self->fwf_line;
+    int *offsets = NULL;
+    int had_comment = self->state == EAT_COMMENT;
+
+    self->fwf_line_len = 0;
+    self->state = START_RECORD;
+
+    if (self->skip_empty_lines && (had_comment || self->fwf_ncols == 1)) {
+        for (k = 0; k < len; ++k) {
+            if (!IS_WHITESPACE(line[k]) && line[k] != '\r' &&
+                !self->fwf_fill[(unsigned char) line[k]]) {
+                break;
+            }
+        }
+        if (k == len) {
+            // comment-only line. Like the python reader, blank lines are
+            // kept as a row of empty fields when there are several columns
+            self->file_lines++;
+            return 0;
+        }
+    }
+
+    nchars = len;
+    if (self->fwf_utf8) {
+        // map character positions to byte offsets
+        self->fwf_offsets = (int*) grow_buffer((void *) self->fwf_offsets, 0,
+                                               &self->fwf_offsets_cap,
+                                               len + 1, sizeof(int), &status);
+        if (status != 0) {
+            self->error_msg = "out of memory";
+            return -1;
+        }
+        offsets = self->fwf_offsets;
+
+        nchars = 0;
+        for (k = 0; k < len; ++k) {
+            // skip UTF-8 continuation bytes
+            if ((line[k] & 0xC0) != 0x80) {
+                offsets[nchars++] = k;
+            }
+        }
+        offsets[nchars] = len;
+    }
+
+    // room for all fields and their terminators
+    total = self->fwf_ncols;
+    for (j = 0; j < self->fwf_ncols; ++j) {
+        FWF_FIELD_EXTENT(j);
+        total += end - start;
+    }
+
+    if (make_stream_space(self, total) < 0) {
+        self->error_msg = "out of memory";
+        return -1;
+    }
+
+    for (j = 0; j < self->fwf_ncols; ++j) {
+        FWF_FIELD_EXTENT(j);
+
+        while (start < end && self->fwf_fill[(unsigned char) line[start]]) {
+            ++start;
+        }
+        while (end > start && self->fwf_fill[(unsigned char) line[end - 1]]) {
+            --end;
+        }
+
+        memcpy(self->stream + self->stream_len, line + start, end - start);
+        self->stream_len += end - start;
+
+        if (end_field(self) < 0) {
+            return -1;
+        }
+    }
+
+    return end_line(self);
+}
+
+int tokenize_fixed_width(parser_t *self, size_t line_limit)
+{
+    int start_lines = self->lines;
+    char *buf = self->data + self->datapos;
+    char *end = self->data + self->datalen;
+    char *eol, *cut, *comment;
+
+    while (buf < end) {
+        eol = (char*) memchr(buf, '\n', end - buf);
+        cut = (eol == NULL) ? end : eol;
+
+        if (self->state != EAT_COMMENT) {
+            if (self->commentchar != '\0') {
+                comment = (char*) memchr(buf, self->commentchar, cut - buf);
+                if (comment != NULL) {
+                    cut = comment;
+                    self->state = EAT_COMMENT;
+                }
+            }
+            if (append_fixed_width_bytes(self, buf, cut - buf) < 0) {
+                self->datapos = self->datalen;
+                return -1;
+            }
+            if (self->state != EAT_COMMENT) {
+                self->state = IN_FIELD;
+            }
+        }
+
+        if (eol == NULL) {
+            buf = end;
+            break;
+        }
+
+        buf = eol + 1;
+        if (end_fixed_width_line(self) < 0) {
+            self->datapos = buf - self->data;
+            return -1;
+        }
+
+        if (line_limit > 0 && self->lines == start_lines + line_limit) {
+            break;
+        }
+    }
+
+    self->datapos = buf - self->data;
+    return 0;
+}
+
+
 static int parser_handle_eof(parser_t *self) {
     TRACE(("handling eof, datalen: %d, pstate: %d\n", self->datalen, self->state))
+    if (self->fwf_ncols > 0) {
+        // close out a last line without a line terminator
+        if (self->datalen == 0 && self->state != START_RECORD) {
+            return end_fixed_width_line(self);
+        }
+        return 0;
+    }
+
     if (self->datalen == 0 && (self->state != START_RECORD)) {
         // test cases needed here
         // TODO: empty field at end of line
@@ -1703,7 +1916,9 @@ int _tokenize_helper(parser_t *self, size_t nrows, int all) {
     int status = 0;
     int start_lines = self->lines;
 
-    if (self->delim_whitespace) {
+    if (self->fwf_ncols > 0) {
+        tokenize_bytes = tokenize_fixed_width;
+    } else if (self->delim_whitespace) {
         tokenize_bytes = tokenize_whitespace;
     } else if (self->lineterminator == '\0') {
         tokenize_bytes = tokenize_delimited;
@@ -211,6 +211,18 @@ typedef struct parser_t {
     char *error_msg;
 
     int skip_empty_lines;
+
+    // fixed width fields, see tokenize_fixed_width
+    int fwf_ncols;          // number of fields, 0 when delimited
+    int *fwf_starts;        // field extents as half-open intervals
+    int *fwf_ends;          // -1: until the end of the line
+    char fwf_fill[256];     // characters stripped from the fields
+    int fwf_utf8;           // extents count UTF-8 characters, not bytes
+    char *fwf_line;         // current line
+    int fwf_line_len;
+    int fwf_line_cap;
+    int *fwf_offsets;       // byte offset of each character of the line
+    int fwf_offsets_cap;
 } parser_t;
 
 
@@ -244,6 +256,9 @@ void parser_free(parser_t *self);
 
 void parser_set_default_options(parser_t *self);
 
+int parser_set_fixed_width(parser_t *self, int ncols, int *starts, int *ends,
+                           const char *fill, int utf8);
+
 void debug_print_parser(parser_t *self);
 
 int tokenize_nrows(parser_t *self, size_t nrows);
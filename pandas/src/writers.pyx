@@ -0,0 +1,584 @@
+#-------------------------------------------------------------------------------
+# Vectorized CSV formatting, see CSVFormatter
+
+import sys
+from libc.stdio cimport snprintf
+from libc.string cimport memcpy
+from libc.stdlib cimport realloc, strtod, atoi
+from cpython cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+
+cdef bint _PY3 = sys.version_info[0] >= 3
+
+DEF _CSV_INT64 = 0
+DEF _CSV_FLOAT64 = 1
+DEF _CSV_BOOL = 2
+DEF _CSV_DATETIME64 = 3
+DEF _CSV_OBJECT = 4
+
+# column kinds understood by format_csv_rows
+CSV_INT64 = _CSV_INT64
+CSV_FLOAT64 = _CSV_FLOAT64
+CSV_BOOL = _CSV_BOOL
+CSV_DATETIME64 = _CSV_DATETIME64
+CSV_OBJECT = _CSV_OBJECT
+
+DEF _CELL_SIZE = 512
+DEF _DBL_MIN = 2.2250738585072014e-308
+DEF _NS_PER_DAY = 86400000000000
+
+ctypedef struct csv_buffer:
+    char *data
+    Py_ssize_t length
+    Py_ssize_t capacity
+
+ctypedef struct csv_options:
+    char special[256]
+    char quotechar
+    bint quote_all
+    char *na_rep
+    Py_ssize_t na_len
+    char *float_format
+    char *date_format
+
+
+cdef inline int _buf_reserve(csv_buffer *buf, Py_ssize_t n) nogil:
+    cdef:
+        Py_ssize_t cap
+        char *data
+
+    if buf.length + n <= buf.capacity:
+        return 0
+
+    cap = buf.capacity * 2 if buf.capacity else 4096
+    while cap < buf.length + n:
+        cap *= 2
+    data = <char*> realloc(buf.data, cap)
+    if data == NULL:
+        return -1
+    buf.data = data
+    buf.capacity = cap
+    return 0
+
+
+cdef int _write_cell(csv_buffer *buf, char *s, Py_ssize_t n,
+                     csv_options *opts) nogil:
+    # quote like csv.QUOTE_MINIMAL / QUOTE_ALL with doublequote=True
+    cdef:
+        Py_ssize_t k, j, nquotes = 0
+        bint quote = opts.quote_all
+        char *out
+
+    for k in range(n):
+        if opts.special[<unsigned char> s[k]]:
+            quote = 1
+            if s[k] == opts.quotechar:
+                nquotes += 1
+
+    if not quote:
+        if _buf_reserve(buf, n) < 0:
+            return -1
+        memcpy(buf.data + buf.length, s, n)
+        buf.length += n
+        return 0
+
+    if _buf_reserve(buf, n + nquotes + 2) < 0:
+        return -1
+    out = buf.data + buf.length
+    out[0] = opts.quotechar
+    j = 1
+    for k in range(n):
+        out[j] = s[k]
+        j += 1
+        if s[k] == opts.quotechar:
+            out[j] = s[k]
+            j += 1
+    out[j] = opts.quotechar
+    buf.length += j + 1
+    return 0
+
+
+cdef Py_ssize_t _format_double_repr(double val, char *out) nogil:
+    """
+    Format like repr(float): the shortest string round-tripping to val
+    """
+    cdef:
+        char tmp[32]
+        char digits[20]
+        char *p
+        int prec, ndigits = 0, exp, decpt, k
+        Py_ssize_t pos = 0
+
+    if val - val != 0:
+        # infinity, NaN is written as na_rep
+        if val < 0:
+            memcpy(out, b'-inf', 4)
+            return 4
+        memcpy(out, b'inf', 3)
+        return 3
+
+    # 15 significant digits are enough unless 17 are needed, except for
+    # subnormals which carry fewer
+    prec = 14
+    if -_DBL_MIN < val < _DBL_MIN:
+        prec = 0
+    for prec in range(prec, 17):
+        snprintf(tmp, 32, '%.*e', prec, val)
+        if strtod(tmp, NULL) == val:
+            break
+
+    p = tmp
+    if p[0] == b'-':
+        out[pos] = b'-'
+        pos += 1
+        p += 1
+    while p[0] != b'e':
+        if p[0] != b'.':
+            digits[ndigits] = p[0]
+            ndigits += 1
+        p += 1
+    exp = atoi(p + 1)
+    while ndigits > 1 and digits[ndigits - 1] == b'0':
+        ndigits -= 1
+
+    decpt = exp + 1
+    if decpt <= -4 or decpt > 16:
+        out[pos] = digits[0]
+        pos += 1
+        if ndigits > 1:
+            out[pos] = b'.'
+            pos += 1
+            memcpy(out + pos, digits + 1, ndigits - 1)
+            pos += ndigits - 1
+        pos += snprintf(out + pos, 8, 'e%+03d', exp)
+    elif decpt <= 0:
+        out[pos] = b'0'
+        out[pos + 1] = b'.'
+        pos += 2
+        for k in range(-decpt):
+            out[pos] = b'0'
+            pos += 1
+        memcpy(out + pos, digits, ndigits)
+        pos += ndigits
+    elif decpt >= ndigits:
+        memcpy(out + pos, digits, ndigits)
+        pos += ndigits
+        for k in range(decpt - ndigits):
+            out[pos] = b'0'
+            pos += 1
+        out[pos] = b'.'
+        out[pos + 1] = b'0'
+        pos += 2
+    else:
+        memcpy(out + pos, digits, decpt)
+        pos += decpt
+        out[pos] = b'.'
+        pos += 1
+        memcpy(out + pos, digits + decpt, ndigits - decpt)
+        pos += ndigits - decpt
+    return pos
+
+
+@cython.cdivision(True)
+cdef Py_ssize_t _format_datetime64(int64_t val, char *fmt, char *out) nogil:
+    """
+    Format nanoseconds since the epoch like Timestamp._repr_base, or with
+    the strftime directives %Y %y %m %d %H %M %S %f and %%
+    """
+    cdef:
+        int64_t days, rem, z, era, doe, yoe, doy, mp
+        int64_t year, month, day, hour, minute, second, nanos
+        Py_ssize_t pos = 0
+
+    days = val / _NS_PER_DAY
+    rem = val % _NS_PER_DAY
+    if rem < 0:
+        rem += _NS_PER_DAY
+        days -= 1
+
+    # civil date from days since 1970-01-01
+    z = days + 719468
+    era = (z if z >= 0 else z - 146096) / 146097
+    doe = z - era * 146097
+    yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365
+    doy = doe - (365 * yoe + yoe / 4 - yoe / 100)
+    mp = (5 * doy + 2) / 153
+    day = doy - (153 * mp + 2) / 5 + 1
+    month = mp + 3 if mp < 10 else mp - 9
+    year = yoe + era * 400 + (month <= 2)
+
+    nanos = rem % 1000000000
+    rem = rem / 1000000000
+    second = rem % 60
+    minute = (rem / 60) % 60
+    hour = rem / 3600
+
+    if fmt == NULL:
+        pos = snprintf(out, _CELL_SIZE, '%d-%02d-%02d %02d:%02d:%02d',
+                       <int> year, <int> month, <int> day, <int> hour,
+                       <int> minute, <int> second)
+        if nanos % 1000 != 0:
+            pos += snprintf(out + pos, 16, '.%09d', <int> nanos)
+        elif nanos != 0:
+            pos += snprintf(out + pos, 16, '.%06d', <int> (nanos / 1000))
+        return pos
+
+    while fmt[0] != 0 and pos < _CELL_SIZE - 16:
+        if fmt[0] != b'%':
+            out[pos] = fmt[0]
+            pos += 1
+        else:
+            fmt += 1
+            if fmt[0] == b'Y':
+                pos += snprintf(out + pos, 16, '%d', <int> year)
+            elif fmt[0] == b'y':
+                pos += snprintf(out + pos, 16, '%02d', <int> (year % 100))
+            elif fmt[0] == b'm':
+                pos += snprintf(out + pos, 16, '%02d', <int> month)
+            elif fmt[0] == b'd':
+                pos += snprintf(out + pos, 16, '%02d', <int> day)
+            elif fmt[0] == b'H':
+                pos += snprintf(out + pos, 16, '%02d', <int> hour)
+            elif fmt[0] == b'M':
+                pos += snprintf(out + pos, 16, '%02d', <int> minute)
+            elif fmt[0] == b'S':
+                pos += snprintf(out + pos, 16, '%02d', <int> second)
+            elif fmt[0] == b'f':
+                pos += snprintf(out + pos, 16, '%06d', <int> (nanos / 1000))
+            else:
+                out[pos] = fmt[0]
+                pos += 1
+        fmt += 1
+    return pos
+
+
+cdef int _format_numeric_column(int kind, char *data, Py_ssize_t n,
+                                csv_buffer *buf, Py_ssize_t *offsets,
+                                csv_options *opts) nogil:
+    cdef:
+        Py_ssize_t i, length
+        char cell[_CELL_SIZE]
+        int64_t ival
+        double fval
+        int status
+
+    for i in range(n):
+        offsets[i] = buf.length
+
+        if kind == _CSV_INT64:
+            length = snprintf(cell, _CELL_SIZE, '%lld',
+                              <long long> (<int64_t*> data)[i])
+            status = _write_cell(buf, cell, length, opts)
+        elif kind == _CSV_FLOAT64:
+            fval = (<double*> data)[i]
+            if fval != fval:
+                status = _write_cell(buf, opts.na_rep, opts.na_len, opts)
+                if status < 0:
+                    return -1
+                continue
+            if opts.float_format != NULL:
+                length = snprintf(cell, _CELL_SIZE, opts.float_format, fval)
+            else:
+                length = _format_double_repr(fval, cell)
+            status = _write_cell(buf, cell, length, opts)
+        elif kind == _CSV_BOOL:
+            if (<uint8_t*> data)[i]:
+                status = _write_cell(buf, b'True', 4, opts)
+            else:
+                status = _write_cell(buf, b'False', 5, opts)
+        else:
+            ival = (<int64_t*> data)[i]
+            if ival == NPY_NAT:
+                status = _write_cell(buf, opts.na_rep, opts.na_len, opts)
+            else:
+                length = _format_datetime64(ival, opts.date_format, cell)
+                status = _write_cell(buf, cell, length, opts)
+
+        if status < 0:
+            return -1
+
+    offsets[n] = buf.length
+    return 0
+
+
+cdef class _CSVColumn:
+    """
+    The formatted, quoted cells of one column, back to back
+    """
+    cdef:
+        csv_buffer buf
+        Py_ssize_t *offsets
+
+    def __cinit__(self, Py_ssize_t n):
+        self.buf.data = NULL
+        self.buf.length = 0
+        self.buf.capacity = 0
+        self.offsets = <Py_ssize_t*> malloc((n + 1) * sizeof(Py_ssize_t))
+        if self.offsets == NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        free(self.buf.data)
+        free(self.offsets)
+
+
+cdef class _CSVOptions:
+    cdef:
+        csv_options opts
+        object refs
+
+    def __cinit__(self, sep, quotechar, bint quote_all, line_terminator,
+                  na_rep, float_format, date_format):
+        cdef:
+            bytes s
+            Py_ssize_t k
+
+        sep = _encode_csv_option(sep)
+        quotechar = _encode_csv_option(quotechar)
+        line_terminator = _encode_csv_option(line_terminator)
+        na_rep = _encode_csv_option(na_rep)
+        if float_format is not None:
+            float_format = _encode_csv_option(float_format)
+        if date_format is not None:
+            date_format = _encode_csv_option(date_format)
+        self.refs = (na_rep, float_format, date_format)
+
+        for k in range(256):
+            self.opts.special[k] = 0
+        for s in (sep, quotechar, line_terminator):
+            for k in range(len(s)):
+                self.opts.special[<unsigned char> (<char*> s)[k]] = 1
+
+        self.opts.quotechar = (<char*> quotechar)[0]
+        self.opts.quote_all = quote_all
+        self.opts.na_rep = <char*> na_rep
+        self.opts.na_len = len(na_rep)
+        self.opts.float_format = NULL
+        if float_format is not None:
+            self.opts.float_format = <char*> float_format
+        self.opts.date_format = NULL
+        if date_format is not None:
+            self.opts.date_format = <char*> date_format
+
+
+cdef bytes _encode_csv_option(object value):
+    if isinstance(value, bytes):
+        return value
+    return value.encode('utf-8')
+
+
+cdef _format_object_column(ndarray[object] values, csv_buffer *buf,
+                           Py_ssize_t *offsets, csv_options *opts):
+    cdef:
+        Py_ssize_t i, n = len(values)
+        int status
+        object val, s
+
+    for i in range(n):
+        offsets[i] = buf.length
+        val = values[i]
+
+        # like csv.writer: str(), and repr() for floats on Python 2
+        if val is NaT or _checknull(val):
+            status = _write_cell(buf, opts.na_rep, opts.na_len, opts)
+        else:
+            if PyBytes_Check(val) and not _PY3:
+                s = val
+            elif PyFloat_Check(val) and not _PY3:
+                s = repr(val)
+            else:
+                s = str(val)
+                if _PY3:
+                    s = s.encode('utf-8')
+            status = _write_cell(buf, PyBytes_AS_STRING(s), len(s), opts)
+
+        if status < 0:
+            raise MemoryError()
+
+    offsets[n] = buf.length
+
+
+def format_csv_rows(list values, list kinds, sep=',', quotechar='"',
+                    bint quote_all=False, line_terminator='\n', na_rep='',
+                    float_format=None, date_format=None, pool=None):
+    """
+    Format the columns of a chunk as CSV rows
+
+    Parameters
+    ----------
+    values : list of 1-d contiguous ndarrays, the columns of the rows
+    kinds : list of the CSV_* kind of each column. int64 columns are
+        written with %lld, float64 columns like repr() or with the printf
+        style float_format, and datetime64[ns] columns, passed as int64,
+        like Timestamp._repr_base or with date_format (only the %Y %y %m %d
+        %H %M %S %f and %% directives). Object columns use str() of the
+        values as csv.writer does
+    sep, quotechar, line_terminator : as for csv.writer with
+        doublequote=True
+    quote_all : quote every field (csv.QUOTE_ALL) rather than only those
+        containing special characters (csv.QUOTE_MINIMAL)
+    na_rep : written for missing values
+    pool : ThreadPool, optional
+        Format the columns concurrently. Only object columns hold the GIL
+
+    Returns
+    -------
+    the rows as UTF-8 encoded bytes
+    """
+    cdef:
+        Py_ssize_t i, j, n, ncols = len(values), nempty = 0
+        Py_ssize_t total, pos, lt_len, cell_len
+        _CSVOptions options
+        _CSVColumn col
+        list columns
+        char **datas = NULL
+        Py_ssize_t **offsets = NULL
+        char csep, *lt, *out
+        bytes line_terminator_b
+        object result
+
+    if ncols == 0:
+        return b''
+    n = len(values[0])
+
+    options = _CSVOptions(sep, quotechar, quote_all, line_terminator,
+                          na_rep, float_format, date_format)
+
+    def format_column(i):
+        cdef:
+            _CSVColumn col = _CSVColumn(n)
+            int status
+            ndarray arr = values[i]
+            int kind = kinds[i]
+
+        if kind == _CSV_OBJECT:
+            _format_object_column(arr, &col.buf, col.offsets, &options.opts)
+        else:
+            with nogil:
+                status = _format_numeric_column(kind, arr.data, n, &col.buf,
+                                                col.offsets, &options.opts)
+            if status < 0:
+                raise MemoryError()
+        return col
+
+    if pool is not None and ncols > 1:
+        columns = pool.map(format_column, range(ncols))
+    else:
+        columns = [format_column(i) for i in range(ncols)]
+
+    sep = _encode_csv_option(sep)
+    csep = (<char*> sep)[0]
+    line_terminator_b = _encode_csv_option(line_terminator)
+    lt = <char*> line_terminator_b
+    lt_len = len(line_terminator_b)
+
+    total = n * (ncols - 1 + lt_len)
+    for i in range(ncols):
+        col = columns[i]
+        total += col.buf.length
+
+    if ncols == 1:
+        # csv.writer quotes a record made of a single empty field
+        col = columns[0]
+        for j in range(n):
+            if col.offsets[j + 1] == col.offsets[j]:
+                nempty += 1
+        total += 2 * nempty
+
+    datas = <char**> malloc(ncols * sizeof(char*))
+    offsets = <Py_ssize_t**> malloc(ncols * sizeof(Py_ssize_t*))
+    if datas == NULL or offsets == NULL:
+        free(datas)
+        free(offsets)
+        raise MemoryError()
+    for i in range(ncols):
+        col = columns[i]
+        datas[i] = col.buf.data
+        offsets[i] = col.offsets
+
+    result = PyBytes_FromStringAndSize(NULL, total)
+    out = PyBytes_AS_STRING(result)
+    try:
+        with nogil:
+            pos = 0
+            for j in range(n):
+                for i in range(ncols):
+                    if i > 0:
+                        out[pos] = csep
+                        pos += 1
+                    cell_len = offsets[i][j + 1] - offsets[i][j]
+                    if cell_len == 0 and nempty > 0:
+                        out[pos] = options.opts.quotechar
+                        out[pos + 1] = options.opts.quotechar
+                        pos += 2
+                    else:
+                        memcpy(out + pos, datas[i] + offsets[i][j], cell_len)
+                        pos += cell_len
+                memcpy(out + pos, lt, lt_len)
+                pos += lt_len
+    finally:
+        free(datas)
+        free(offsets)
+
+    return result
+
+
+#-------------------------------------------------------------------------------
+# Line delimited JSON, see pandas.io.json
+
+def convert_json_to_lines(object s):
+    """
+    Convert the JSON array s to line delimited JSON, writing each element
+    on its own line. The elements are split at the commas outside of
+    strings and nested containers.
+    """
+    cdef:
+        bytes data, result
+        char *src
+        char *out
+        char c
+        Py_ssize_t i, n, pos = 0, depth = 0
+        bint in_string = 0, escaped = 0
+
+    if isinstance(s, bytes):
+        data = s
+    else:
+        data = s.encode('utf-8')
+
+    # strip the enclosing brackets
+    data = data.strip()
+    n = len(data)
+    if n < 2 or data[:1] != b'[' or data[n - 1:] != b']':
+        raise ValueError('expected a JSON array')
+    src = PyBytes_AS_STRING(data)
+
+    result = PyBytes_FromStringAndSize(NULL, n - 1)
+    out = PyBytes_AS_STRING(result)
+    with nogil:
+        for i in range(1, n - 1):
+            c = src[i]
+            if in_string:
+                if escaped:
+                    escaped = 0
+                elif c == b'\\':
+                    escaped = 1
+                elif c == b'"':
+                    in_string = 0
+            elif c == b'"':
+                in_string = 1
+            elif c == b'{' or c == b'[':
+                depth += 1
+            elif c == b'}' or c == b']':
+                depth -= 1
+            elif c == b',' and depth == 0:
+                c = b'\n'
+            out[pos] = c
+            pos += 1
+
+    if pos == 0:
+        result = b''
+    else:
+        out[pos] = b'\n'
+
+    if isinstance(s, bytes):
+        return result
+    return result.decode('utf-8')
@@ -200,6 +200,63 @@ class TestUnique(tm.TestCase):
 
         tm.assert_almost_equal(result, expected)
 
+class TestIsin(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def test_ints(self):
+        arr = np.array([1, 2, 3, 4], dtype=np.int64)
+        result = algos.isin(arr, [2, 4, 5])
+        self.assert_numpy_array_equal(result, [False, True, False, True])
+
+        result = algos.isin(arr, set([2, 4, 5]))
+        self.assert_numpy_array_equal(result, [False, True, False, True])
+
+        # integral floats match, fractional and nan do not
+        result = algos.isin(arr, [1.0, 2.5, np.nan, 1e300])
+        self.assert_numpy_array_equal(result, [True, False, False, False])
+
+        result = algos.isin(arr, [])
+        self.assert_numpy_array_equal(result, [False] * 4)
+
+        result = algos.isin(np.array([True, False]), [1])
+        self.assert_numpy_array_equal(result, [True, False])
+
+    def test_floats(self):
+        arr = np.array([1.0, 1.5, np.nan])
+        result = algos.isin(arr, [1, 2])
+        self.assert_numpy_array_equal(result, [True, False, False])
+
+        result = algos.isin(arr, [1.5, np.nan])
+        self.assert_numpy_array_equal(result, [False, True, False])
+
+        result = algos.isin(arr, [1.5, np.nan], hasnans=True)
+        self.assert_numpy_array_equal(result, [False, True, True])
+
+    def test_mixed(self):
+        arr = np.array([1, 2, 3], dtype=np.int64)
+        result = algos.isin(arr, [1, 'a', None])
+        self.assert_numpy_array_equal(result, [True, False, False])
+
+        arr = np.array(['a', 'b', 1], dtype=object)
+        result = algos.isin(arr, ['b', 1])
+        self.assert_numpy_array_equal(result, [False, True, True])
+
+    def test_kernels(self):
+        arr = np.array([5, -1, 7, 5], dtype=np.int64)
+        result = hashtable.ismember_int64(arr, np.array([5, 8],
+                                                        dtype=np.int64))
+        self.assert_numpy_array_equal(result, [True, False, False, True])
+
+        arr = np.array([0.5, np.nan, -0.0])
+        result = hashtable.ismember_float64(arr, np.array([0.0, np.nan]))
+        self.assert_numpy_array_equal(result, [False, False, True])
+
+    def test_query(self):
+        df = pd.DataFrame({'a': np.arange(10)})
+        vals = [1, 3, 5.0, 7.5]
+        result = df.query('a in @vals')
+        tm.assert_frame_equal(result, df.iloc[[1, 3, 5]])
+
 class TestValueCounts(tm.TestCase):
     _multiprocess_can_split_ = True
 
@@ -6623,6 +6623,92 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         df2.to_csv(exp)
         self.assertEqual(res.getvalue(), exp.getvalue())
 
+    def test_to_csv_vectorized(self):
+        df = DataFrame({'i': [1, -2, 3],
+                        'f': [0.1, np.nan, 1e20],
+                        'b': [True, False, True],
+                        'd': [Timestamp('2011-01-01'), pd.NaT,
+                              Timestamp('2011-01-02 03:04:05.000006')],
+                        'o': ['a,b', 'c"d', None]},
+                       columns=['i', 'f', 'b', 'd', 'o'])
+
+        expected = (',i,f,b,d,o\n'
+                    '0,1,0.1,True,2011-01-01 00:00:00,"a,b"\n'
+                    '1,-2,,False,,"c""d"\n'
+                    '2,3,1e+20,True,2011-01-02 03:04:05.000006,\n')
+        self.assertEqual(df.to_csv(), expected)
+        self.assertEqual(df.to_csv(threads=2, chunksize=2), expected)
+
+        expected = ('i,f,b,d,o\n'
+                    '1,0.100,True,20110101,"a,b"\n'
+                    '-2,NA,False,NA,"c""d"\n'
+                    '3,100000000000000000000.000,True,20110102,NA\n')
+        result = df.to_csv(index=False, na_rep='NA', float_format='%.3f',
+                           date_format='%Y%m%d')
+        self.assertEqual(result, expected)
+
+        # formats the C writer does not handle itself
+        expected = ('i,f,b,d,o\n'
+                    '1,[0.1],True,Jan 01,"a,b"\n'
+                    '-2,,False,,"c""d"\n'
+                    '3,[1e+20],True,Jan 02,\n')
+        result = df.to_csv(index=False, float_format='[%r]',
+                           date_format='%b %d')
+        self.assertEqual(result, expected)
+
+        expected = ('"","i","b"\n'
+                    '"0","1","True"\n'
+                    '"1","-2","False"\n'
+                    '"2","3","True"\n')
+        result = df[['i', 'b']].to_csv(quoting=csv.QUOTE_ALL)
+        self.assertEqual(result, expected)
+
+        # a record of a single empty field is quoted
+        df = DataFrame({'a': ['x', np.nan]})
+        self.assertEqual(df.to_csv(index=False), 'a\nx\n""\n')
+
+        floats = np.array([0.1, 1 / 3., -2.5e-8, 1e16, 1e15, 123456.789,
+                           5e-324, np.inf, -np.inf, -0.0])
+        df = DataFrame({'f': floats})
+        expected = ('f\n' +
+                    ''.join([repr(float(x)) + '\n' for x in floats]))
+        self.assertEqual(df.to_csv(index=False), expected)
+
+        df = DataFrame({'d': pd.to_datetime(['1677-09-22', '2262-04-11',
+                                             '1969-12-31 23:59:59.999999999',
+                                             '2000-02-29 00:00:00.1'])})
+        expected = ('d\n1677-09-22 00:00:00\n2262-04-11 00:00:00\n'
+                    '1969-12-31 23:59:59.999999999\n'
+                    '2000-02-29 00:00:00.100000\n')
+        self.assertEqual(df.to_csv(index=False), expected)
+
+    def test_to_csv_compression(self):
+        import gzip
+        import bz2
+
+        df = DataFrame([[0.123456, 0.234567, 0.567567],
+                        [12.32112, 123123.2, 321321.2]],
+                       index=['A', 'B'], columns=['X', 'Y', 'Z'])
+
+        for compression, opener in [('gzip', gzip.GzipFile),
+                                    ('bz2', bz2.BZ2File)]:
+            with ensure_clean() as filename:
+                df.to_csv(filename, compression=compression)
+
+                f = opener(filename, 'rb')
+                text = f.read().decode('utf-8')
+                f.close()
+                self.assertEqual(text, df.to_csv())
+
+                rs = read_csv(filename, index_col=0,
+                              compression=compression)
+                assert_frame_equal(rs, df)
+
+        with ensure_clean() as filename:
+            self.assertRaises(ValueError, df.to_csv, filename,
+                              compression='zip')
+            self.assertRaises(ValueError, df.to_csv, filename, threads=0)
+
     def test_to_csv_path_is_none(self):
         # GH 8215
         # Make sure we return string for consistency with
@@ -7580,6 +7666,26 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         expected = df.ix[[1, 3, 6, 7]]
         assert_frame_equal(result, expected)
 
+    def test_duplicated_many_columns(self):
+        # combined codes of all columns overflow int64 and get compressed
+        np.random.seed(1234)
+        df = DataFrame(np.random.randint(0, 1000, size=(1000, 10)))
+        df['s'] = tm.makeStringIndex(1000)
+        df['d'] = date_range('20130101', periods=1000)
+        df.iloc[::7, 0] = np.nan
+        df = pd.concat([df, df.iloc[::3], df.iloc[::5]], ignore_index=True)
+
+        for take_last in [False, True]:
+            keys = lib.fast_zip_fillna([df[c].values for c in df.columns])
+            expected = Series(lib.duplicated(keys, take_last=take_last))
+            result = df.duplicated(take_last=take_last)
+            assert_series_equal(result, expected)
+
+            keys = lib.fast_zip_fillna([df[0].values, df['s'].values])
+            expected = Series(lib.duplicated(keys, take_last=take_last))
+            result = df.duplicated([0, 's'], take_last=take_last)
+            assert_series_equal(result, expected)
+
     def test_drop_duplicates_inplace(self):
         orig = DataFrame({'A': ['foo', 'bar', 'foo', 'bar',
                                 'foo', 'bar', 'bar', 'foo'],
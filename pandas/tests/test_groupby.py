@@ -4845,6 +4845,38 @@ def test_decons():
     testit(label_list, shape)
 
 
+def test_compressed_group_index_overflow():
+    from pandas.core.groupby import _get_compressed_group_index
+
+    # the sizes of the first two levels alone overflow int64
+    big = 2 ** 40
+    label_list = [np.array([0, big - 1, 0, 5, big - 1, -1], dtype=np.int64),
+                  np.array([1, big - 1, 1, 2, big - 1, 0], dtype=np.int64),
+                  np.array([0, 1, 0, 2, 1, 0], dtype=np.int64)]
+    ids = _get_compressed_group_index(label_list, [big, big, 3])
+
+    assert(ids[0] == ids[2])
+    assert(ids[1] == ids[4])
+    assert(ids[5] == -1)
+    assert(len(np.unique(ids[:5])) == 3)
+
+
+def test_compressed_group_index_single_level():
+    from pandas.core.groupby import _get_compressed_group_index
+
+    labels = np.array([0, 2, 0, -1, 1], dtype=np.int64)
+    ids = _get_compressed_group_index([labels], [3])
+    assert(np.array_equal(ids, labels))
+
+    # duplicated and drop_duplicates on a single column
+    df = DataFrame({'A': ['foo', 'bar', 'foo', np.nan, np.nan],
+                    'B': lrange(5)})
+    expected = Series([False, False, True, False, True])
+    assert_series_equal(df.duplicated('A'), expected)
+    assert_series_equal(df[['A']].duplicated(), expected)
+    assert_frame_equal(df.drop_duplicates('A'), df.iloc[[0, 1, 3]])
+
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure',
                          '-s'], exit=False)
@@ -14,7 +14,7 @@ from numpy.testing import assert_array_equal
 from pandas import period_range, date_range
 
 from pandas.core.index import (Index, Float64Index, Int64Index, MultiIndex,
-                               InvalidIndexError, NumericIndex)
+                               InvalidIndexError, NumericIndex, RangeIndex)
 from pandas.tseries.index import DatetimeIndex
 from pandas.tseries.tdi import TimedeltaIndex
 from pandas.tseries.period import PeriodIndex
@@ -1804,6 +1804,249 @@ class TestInt64Index(Numeric, tm.TestCase):
         idx = Int64Index([1, 2], name='asdf')
         self.assertEqual(idx.name, idx[1:].name)
 
+    def test_engine_bin_search(self):
+        with pd.option_context('mode.index_size_cutoff', 0):
+            index = Int64Index(np.arange(0, 20, 2))
+
+            self.assertEqual(index.get_loc(4), 2)
+            self.assertRaises(KeyError, index.get_loc, 5)
+            self.assertRaises(KeyError, index.get_loc, 20)
+            self.assertRaises(KeyError, index.get_loc, 4.0)
+            self.assertTrue(18 in index)
+            self.assertFalse(19 in index)
+            self.assertTrue(index.is_unique)
+
+            result = index.get_indexer(Int64Index([-1, 0, 5, 18, 20]))
+            self.assert_numpy_array_equal(result, [-1, 0, -1, 9, -1])
+
+            # the hash table is never built
+            self.assertFalse(index._engine.is_mapping_populated)
+            self.assertEqual(index.engine_nbytes, 0)
+
+            # not monotonic
+            index = Int64Index([3, 1, 2])
+            self.assertEqual(index.get_loc(1), 1)
+            self.assertTrue(index._engine.is_mapping_populated)
+
+    def test_engine_bin_search_contains_incomparable(self):
+        # keys that cannot be compared with the values are not in the index
+        with pd.option_context('mode.index_size_cutoff', 0):
+            index = Index(['a', 'b', 'c'])
+            self.assertTrue('b' in index)
+            self.assertFalse('d' in index)
+            self.assertFalse(1 in index)
+            self.assertFalse(None in index)
+
+    def test_engine_cache(self):
+        index = Int64Index([3, 1, 2])
+        self.assertEqual(index.engine_nbytes, 0)
+
+        index.get_loc(1)
+        self.assertTrue(index.engine_nbytes > 0)
+
+        index.clear_engine_cache()
+        self.assertEqual(index.engine_nbytes, 0)
+        self.assertEqual(index.get_loc(2), 2)
+
+        index = MultiIndex.from_product([[1, 2], ['a', 'b']])
+        index.get_loc((2, 'a'))
+        self.assertTrue(index.engine_nbytes > 0)
+        index.clear_engine_cache()
+        self.assertEqual(index.engine_nbytes, 0)
+
+
+class TestRangeIndex(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.index = RangeIndex(0, 20, 2, name='foo')
+
+    def test_constructor(self):
+        index = RangeIndex(5)
+        self.assert_numpy_array_equal(index, np.arange(5))
+        self.assertEqual(index._start, 0)
+        self.assertEqual(index._stop, 5)
+        self.assertEqual(index._step, 1)
+        self.assertIsNone(index.name)
+
+        index = RangeIndex(1, 5)
+        self.assert_numpy_array_equal(index, np.arange(1, 5))
+
+        index = RangeIndex(10, -10, -3)
+        self.assert_numpy_array_equal(index, np.arange(10, -10, -3))
+        self.assertEqual(len(index), len(np.arange(10, -10, -3)))
+
+        self.assertEqual(len(RangeIndex(5, 0)), 0)
+        self.assertIsInstance(RangeIndex(3), Int64Index)
+
+        self.assertRaises(TypeError, RangeIndex)
+        self.assertRaises(TypeError, RangeIndex, 1.5)
+        self.assertRaises(TypeError, RangeIndex, 'foo')
+        self.assertRaises(ValueError, RangeIndex, 0, 5, 0)
+
+    def test_from_range(self):
+        index = Index(range(1, 10, 3))
+        self.assertIsInstance(index, RangeIndex)
+        self.assert_numpy_array_equal(index, np.arange(1, 10, 3))
+
+        index = RangeIndex.from_range(range(5), name='bar')
+        self.assertEqual(index.name, 'bar')
+        self.assertRaises(TypeError, RangeIndex.from_range, [1, 2])
+
+    def test_default_index(self):
+        df = pd.DataFrame({'A': [1, 2, 3]})
+        self.assertIsInstance(df.index, RangeIndex)
+        self.assertIsInstance(Series([1, 2]).index, RangeIndex)
+        self.assertIsInstance(df.reset_index().index, RangeIndex)
+
+        result = pd.concat([df, df], ignore_index=True)
+        self.assertIsInstance(result.index, RangeIndex)
+        self.assertTrue(result.index.equals(Int64Index(lrange(6))))
+
+    def test_properties(self):
+        index = self.index
+        self.assertEqual(len(index), 10)
+        self.assertEqual(index.dtype, np.int64)
+        self.assertTrue(index.is_unique)
+        self.assertTrue(index.is_monotonic)
+        self.assertTrue(index.is_monotonic_increasing)
+        self.assertFalse(index.is_monotonic_decreasing)
+
+        index = RangeIndex(10, 0, -1)
+        self.assertFalse(index.is_monotonic)
+        self.assertTrue(index.is_monotonic_decreasing)
+
+        # the values are not materialized
+        self.assertLess(self.index.nbytes, 100)
+        self.assertLess(RangeIndex(10 ** 9).nbytes, 100)
+
+    def test_get_loc(self):
+        index = self.index
+        self.assertEqual(index.get_loc(0), 0)
+        self.assertEqual(index.get_loc(18), 9)
+        self.assertRaises(KeyError, index.get_loc, 3)
+        self.assertRaises(KeyError, index.get_loc, 20)
+        self.assertRaises(KeyError, index.get_loc, -2)
+        self.assertTrue(4 in index)
+        self.assertFalse(5 in index)
+
+        index = RangeIndex(10, 0, -2)
+        self.assertEqual(index.get_loc(10), 0)
+        self.assertEqual(index.get_loc(2), 4)
+        self.assertRaises(KeyError, index.get_loc, 0)
+
+        s = Series(np.arange(10.), index=self.index)
+        self.assertEqual(s[4], 2.)
+        self.assertRaises(KeyError, s.__getitem__, 5)
+
+    def test_get_indexer(self):
+        target = Int64Index([-2, 0, 1, 4, 18, 20])
+        result = self.index.get_indexer(target)
+        self.assert_numpy_array_equal(result, [-1, 0, -1, 2, 9, -1])
+
+        result = self.index.get_indexer(RangeIndex(0, 10))
+        self.assert_numpy_array_equal(result, [0, -1, 1, -1, 2, -1, 3, -1,
+                                               4, -1])
+
+        index = RangeIndex(10, 0, -2)
+        result = index.get_indexer(target)
+        self.assert_numpy_array_equal(result, [-1, -1, -1, 3, -1, -1])
+
+        result = self.index.get_indexer(Int64Index([1, 3, 5]), method='pad')
+        self.assert_numpy_array_equal(result, [0, 1, 2])
+
+    def test_getitem(self):
+        index = self.index
+        self.assertEqual(index[0], 0)
+        self.assertEqual(index[-1], 18)
+        self.assertRaises(IndexError, index.__getitem__, 10)
+
+        for key in [slice(2, 5), slice(None, None, 3), slice(-3, None),
+                    slice(None, None, -1), slice(8, 2, -2), slice(5, 2)]:
+            result = index[key]
+            self.assertIsInstance(result, RangeIndex)
+            self.assertEqual(result.name, 'foo')
+            self.assert_numpy_array_equal(result, index.values[key])
+
+        result = index[[0, 2]]
+        self.assertNotIsInstance(result, RangeIndex)
+        self.assert_numpy_array_equal(result, [0, 4])
+
+    def test_equals(self):
+        self.assertTrue(self.index.equals(RangeIndex(0, 19, 2)))
+        self.assertTrue(self.index.equals(Int64Index(lrange(0, 20, 2))))
+        self.assertFalse(self.index.equals(RangeIndex(0, 20, 4)))
+        self.assertTrue(RangeIndex(0).equals(RangeIndex(5, 0)))
+        self.assertTrue(RangeIndex(3, 4).equals(RangeIndex(3, 5, 5)))
+
+    def test_simple_new(self):
+        # the values of inherited methods give an Int64Index
+        result = self.index._simple_new(np.array([1, 3]), 'bar')
+        self.assertEqual(type(result), Int64Index)
+        self.assert_numpy_array_equal(result, np.array([1, 3]))
+        self.assertEqual(result.name, 'bar')
+
+    def test_get_level_values_name(self):
+        index = MultiIndex(levels=[RangeIndex(3), Index(['a', 'b'])],
+                           labels=[[0, 1, 2], [0, 1, 0]],
+                           names=['first', 'second'])
+        self.assertEqual(type(index.levels[0]), RangeIndex)
+        result = index.get_level_values(0)
+        self.assert_numpy_array_equal(result, np.arange(3))
+        self.assertEqual(result.name, 'first')
+
+        df = pd.DataFrame({'A': [1, 2], 'B': [3, 4]})
+        result = df.set_index('A', append=True).index.get_level_values(0)
+        self.assertIsNone(result.name)
+        df.index.name = 'foo'
+        result = df.set_index('A', append=True).index.get_level_values(0)
+        self.assertEqual(result.name, 'foo')
+
+    def test_union(self):
+        result = RangeIndex(0, 10).union(RangeIndex(5, 15))
+        self.assertIsInstance(result, RangeIndex)
+        self.assert_numpy_array_equal(result, np.arange(15))
+
+        result = RangeIndex(0, 10, 2).union(RangeIndex(10, 20, 2))
+        self.assertIsInstance(result, RangeIndex)
+        self.assert_numpy_array_equal(result, np.arange(0, 20, 2))
+
+        # not representable as a range
+        result = RangeIndex(0, 10, 2).union(RangeIndex(1, 10, 3))
+        self.assertNotIsInstance(result, RangeIndex)
+        expected = np.union1d(np.arange(0, 10, 2), np.arange(1, 10, 3))
+        self.assert_numpy_array_equal(result, expected)
+
+        result = RangeIndex(0, 5).union(Int64Index([3, 7]))
+        self.assert_numpy_array_equal(result, [0, 1, 2, 3, 4, 7])
+
+    def test_intersection(self):
+        for first, second in [((0, 20, 2), (0, 20, 3)),
+                              ((1, 50, 4), (3, 70, 6)),
+                              ((0, 10), (5, 15)),
+                              ((0, 10, 2), (1, 10, 2)),
+                              ((0, 5), (10, 15))]:
+            result = RangeIndex(*first).intersection(RangeIndex(*second))
+            self.assertIsInstance(result, RangeIndex)
+            expected = np.intersect1d(np.arange(*first), np.arange(*second))
+            self.assert_numpy_array_equal(result, expected)
+
+        result = self.index.intersection(Int64Index([2, 3, 4]))
+        self.assert_numpy_array_equal(result, [2, 4])
+
+    def test_pickle(self):
+        unpickled = self.round_trip_pickle(self.index)
+        self.assertIsInstance(unpickled, RangeIndex)
+        self.assertTrue(self.index.equals(unpickled))
+        self.assertEqual(unpickled.name, 'foo')
+
+    def test_repr(self):
+        self.assertEqual(repr(self.index),
+                         "RangeIndex(start=0, stop=20, step=2, name='foo')")
+        self.assertEqual(repr(RangeIndex(5)),
+                         "RangeIndex(start=0, stop=5, step=1)")
+
+
 class TestDatetimeIndex(Base, tm.TestCase):
     _holder = DatetimeIndex
     _multiprocess_can_split_ = True
@@ -2849,6 +3092,45 @@ class TestMultiIndex(Base, tm.TestCase):
                            " uniquely valued Index objects",
                            idx1.get_indexer, idx2)
 
+    def test_engine_does_not_materialize_tuples(self):
+        index = MultiIndex.from_product([lrange(3), ['a', 'b']])
+        target = MultiIndex.from_tuples([(0, 'b'), (2, 'a'), (3, 'a'),
+                                         (1, 'c')])
+
+        assert_almost_equal(index.get_indexer(target), [1, 4, -1, -1])
+        assert_almost_equal(index.get_indexer(target._tuple_index),
+                            [1, 4, -1, -1])
+        self.assertEqual(index.get_loc((2, 'b')), 5)
+        self.assertRaises(KeyError, index.get_loc, (3, 'b'))
+        self.assertTrue((1, 'a') in index)
+        self.assertFalse((1, 'c') in index)
+        self.assertTrue(index.is_unique)
+        self.assertTrue(index.is_monotonic)
+        self.assertIsNone(index._tuples)
+
+    def test_engine_missing_values(self):
+        index = MultiIndex.from_arrays([[1, np.nan, 2], ['a', 'b', 'c']])
+        self.assertEqual(index.get_loc((np.nan, 'b')), 1)
+        self.assertRaises(KeyError, index.get_loc, (np.nan, 'a'))
+
+        target = MultiIndex.from_arrays([[2, np.nan, 1], ['c', 'b', 'b']])
+        assert_almost_equal(index.get_indexer(target), [2, 1, -1])
+
+    def test_engine_overflow(self):
+        # 22 levels of 7 values need 66 bits, more than fit into an int64
+        nlevels = 22
+        index = MultiIndex(levels=[lrange(7)] * nlevels,
+                           labels=[[0, 3, 6]] * nlevels)
+        self.assertTrue(index._engine.overflow)
+        self.assertEqual(index.get_loc((6,) * nlevels), 2)
+        self.assertRaises(KeyError, index.get_loc, (5,) * nlevels)
+
+        target = MultiIndex(levels=[lrange(7)] * nlevels,
+                            labels=[[6, 5, 0]] * nlevels)
+        assert_almost_equal(index.get_indexer(target), [2, -1, 0])
+        self.assertTrue(index.is_unique)
+        self.assertTrue(index.is_monotonic)
+
     def test_format(self):
         self.index.format()
         self.index[:0].format()
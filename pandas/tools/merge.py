@@ -278,7 +278,7 @@ class _MergeOperation(object):
             elif self.left_index:
                 join_index = self.right.index.take(right_indexer)
             else:
-                join_index = Index(np.arange(len(left_indexer)))
+                join_index = com._default_index(len(left_indexer))
 
         return join_index, left_indexer, right_indexer
 
@@ -939,9 +939,7 @@ class _Concatenator(object):
             if self.axis == 0:
                 indexes = [x.index for x in self.objs]
             elif self.ignore_index:
-                idx = Index(np.arange(len(self.objs)))
-                idx.is_unique = True  # arange is always unique
-                return idx
+                return com._default_index(len(self.objs))
             elif self.keys is None:
                 names = []
                 for x in self.objs:
@@ -952,9 +950,7 @@ class _Concatenator(object):
                     if x.name is not None:
                         names.append(x.name)
                     else:
-                        idx = Index(np.arange(len(self.objs)))
-                        idx.is_unique = True
-                        return idx
+                        return com._default_index(len(self.objs))
 
                 return Index(names)
             else:
@@ -963,9 +959,7 @@ class _Concatenator(object):
             indexes = [x._data.axes[self.axis] for x in self.objs]
 
         if self.ignore_index:
-            idx = Index(np.arange(sum(len(i) for i in indexes)))
-            idx.is_unique = True
-            return idx
+            return com._default_index(sum(len(i) for i in indexes))
 
         if self.keys is None:
             concat_axis = _concat_indexes(indexes)
@@ -440,8 +440,8 @@ class DatetimeIndexOpsMixin(object):
             except ValueError:
                 return self.asobject.isin(values)
 
-        value_set = set(values.asi8)
-        return lib.ismember(self.asi8, value_set)
+        from pandas.core.algorithms import isin
+        return isin(self.asi8, values.asi8)
 
     def shift(self, n, freq=None):
         """
@@ -415,7 +415,7 @@ else:
     cmdclass['build_src'] = DummyBuildSrc
     cmdclass['build_ext'] = CheckingBuildExt
 
-lib_depends = ['reduce', 'inference', 'properties']
+lib_depends = ['reduce', 'inference', 'properties', 'writers']
 
 
 def srcpath(name=None, suffix='.pyx', subdir='src'):
@@ -467,9 +467,11 @@ ext_data = dict(
     parser=dict(pyxfile='parser',
                 depends=['pandas/src/parser/tokenizer.h',
                          'pandas/src/parser/io.h',
-                         'pandas/src/numpy_helper.h'],
+                         'pandas/src/numpy_helper.h'] + tseries_depends,
                 sources=['pandas/src/parser/tokenizer.c',
-                         'pandas/src/parser/io.c'])
+                         'pandas/src/parser/io.c',
+                         'pandas/src/datetime/np_datetime.c',
+                         'pandas/src/datetime/np_datetime_strings.c'])
 )
 
 extensions = []